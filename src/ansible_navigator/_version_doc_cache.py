@@ -6,10 +6,14 @@
 
    Indicates the version of the schema of the collection doc cache
    this is checked during initialization, if the version of the cache
-   differs from below, the cache will be rebuilt.  This should be
-   incremented when the schema changes and need not correspond to the
-   application version, although keeping the major in sync is probably
-   not a bad idea to minimize the amount of stale docs in the user's cache
+   differs from below, the cache will be migrated in place using the
+   migrations in ``utils/version_migration/collection_doc_cache.py``, or
+   rebuilt if no migration leads to this version.  This should be
+   incremented when the schema changes, along with a migration from the
+   previous version when the cached docs can be kept, and need not
+   correspond to the application version, although keeping the major in
+   sync is probably not a bad idea to minimize the amount of stale docs
+   in the user's cache
 """
 
-__version_collection_doc_cache__ = "1.1"
+__version_collection_doc_cache__ = "2.0"
@@ -24,6 +24,7 @@ from .utils.definitions import LogMessage
 
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
     from re import Pattern
 
     from .configuration_subsystem.definitions import ApplicationConfiguration
@@ -53,7 +54,7 @@ class ActionBase:
         self._name = name
         self._previous_filter: Pattern[str] | None
         self._previous_scroll: int
-        self.stdout: list[str] = []
+        self.stdout: Sequence[str] = []
         self.steps = Steps()
 
     @staticmethod
@@ -3,11 +3,15 @@
 from __future__ import annotations
 
 import curses
+import hashlib
 import json
+import os
 import shlex
+import sqlite3
 import sys
 
 from copy import deepcopy
+from functools import partial
 from json.decoder import JSONDecodeError
 from pathlib import Path
 from typing import TYPE_CHECKING
@@ -16,6 +20,7 @@ from typing import Any
 from ansible_navigator.action_base import ActionBase
 from ansible_navigator.action_defs import RunStdoutReturn
 from ansible_navigator.content_defs import ContentFormat
+from ansible_navigator.image_manager import inspect_image_id
 from ansible_navigator.runner import Command
 from ansible_navigator.steps import Step
 from ansible_navigator.ui_framework import CursesLine
@@ -24,16 +29,22 @@ from ansible_navigator.ui_framework import CursesLines
 from ansible_navigator.ui_framework import Interaction
 from ansible_navigator.ui_framework import nonblocking_notification
 from ansible_navigator.ui_framework import warning_notification
+from ansible_navigator.utils.catalog_cache import CatalogCache
 from ansible_navigator.utils.functions import path_is_relative_to
 from ansible_navigator.utils.functions import remove_dbl_un
+from ansible_navigator.utils.key_value_store import MAX_VARIABLES
 from ansible_navigator.utils.key_value_store import KeyValueStore
 from ansible_navigator.utils.print import print_to_stdout
+from ansible_navigator.version import __version__
 
 from . import _actions as actions
 from . import run_action
 
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+    from collections.abc import Iterable
+
     from ansible_navigator.app_public import AppPublic
     from ansible_navigator.configuration_subsystem.definitions import ApplicationConfiguration
 
@@ -87,6 +98,37 @@ def filter_content_keys(obj: dict[Any, Any]) -> dict[Any, Any]:
     return {k: v for k, v in obj.items() if not k.startswith("__")}
 
 
+class CollectionContents(list[dict[str, Any]]):
+    """The menu entries of a collection, indexing returns the complete content of an entry."""
+
+    def __init__(
+        self,
+        entries: list[dict[str, Any]],
+        load: Callable[[dict[str, Any]], dict[str, Any]],
+    ) -> None:
+        """Initialize the collection contents.
+
+        :param entries: The menu entries
+        :param load: A callable that loads the complete content for a menu entry
+        """
+        super().__init__(entries)
+        self._load = load
+        self._loaded: dict[int, dict[str, Any]] = {}
+
+    def __getitem__(self, index: Any) -> Any:
+        """Load the complete content for an index, slices return the menu entries.
+
+        :param index: The index of the entry
+        :returns: The complete content or menu entries
+        """
+        if isinstance(index, slice):
+            return super().__getitem__(index)
+        index = range(len(self))[index]
+        if index not in self._loaded:
+            self._loaded[index] = self._load(super().__getitem__(index))
+        return self._loaded[index]
+
+
 @actions.register
 class Action(ActionBase):
     """Collections subcommand implementation."""
@@ -292,52 +334,43 @@ class Action(ActionBase):
     def _build_collection_content_menu(self) -> Step:
         """Build the menu of plugins.
 
+        The menu is built from the plugin summaries, the documentation of a plugin is loaded
+        when it is selected.
+
         :returns: The plugin menu definition
         """
-        self._collection_cache.open_()
+        self._collection_cache.open_(read_only=True)
         selected_collection = self._collections[self.steps.current.index]
         collection_name = f"__{selected_collection['known_as']}"
+        plugin_checksums = selected_collection["plugin_checksums"]
+        summaries = self._plugin_summaries(plugin_checksums)
+        plugin_jsons = self._collection_cache.get_many(
+            checksum
+            for checksum, details in plugin_checksums.items()
+            if (checksum, details["type"]) not in summaries
+        )
+        self._collection_cache.close()
+
         collection_contents = []
-        for plugin_checksum, details in selected_collection["plugin_checksums"].items():
+        for plugin_checksum, details in plugin_checksums.items():
+            summary = summaries.get((plugin_checksum, details["type"]))
+            if summary is not None:
+                entry = self._plugin_menu_entry(selected_collection, plugin_checksum, summary)
+                if entry is not None:
+                    collection_contents.append(entry)
+                continue
             try:
-                plugin_json = self._collection_cache[plugin_checksum]
-                loaded = json.loads(plugin_json)
-
-                plugin = loaded["plugin"]
-                if plugin["doc"] is not None:
-                    if "name" in plugin["doc"]:
-                        short_name = plugin["doc"]["name"]
-                    else:
-                        short_name = plugin["doc"][details["type"]]
-                    plugin[collection_name] = short_name
-                    plugin["full_name"] = f"{selected_collection['known_as']}.{short_name}"
-                    plugin["__type"] = details["type"]
-                    plugin["collection_info"] = selected_collection["collection_info"]
-                    plugin["collection_info"]["name"] = selected_collection["known_as"]
-                    plugin["collection_info"]["shadowed_by"] = selected_collection["hidden_by"]
-                    plugin["collection_info"]["path"] = selected_collection["path"]
-
-                    plugin["__added"] = plugin["doc"].get("version_added")
-                    plugin["__description"] = plugin["doc"]["short_description"]
-
-                    runtime_section = "modules" if details["type"] == "module" else details["type"]
-                    plugin["__deprecated"] = "False"
-                    try:
-                        routing_info = selected_collection["runtime"]["plugin_routing"]
-                        runtime_info = routing_info[runtime_section][short_name]
-                        plugin["additional_information"] = runtime_info
-                        if "deprecation" in runtime_info:
-                            plugin["__deprecated"] = "True"
-                    except KeyError:
-                        plugin["additional_information"] = {}
-
+                plugin = self._plugin_content(
+                    selected_collection,
+                    details,
+                    plugin_jsons[plugin_checksum],
+                )
+                if plugin is not None:
                     collection_contents.append(plugin)
             except (KeyError, JSONDecodeError) as exc:
                 self._logger.exception("error loading plugin doc %s", details)
                 self._logger.debug("error was %s", str(exc))
 
-        self._collection_cache.close()
-
         for role in selected_collection["roles"]:
             role[collection_name] = role["short_name"]
             try:
@@ -350,27 +383,182 @@ class Action(ActionBase):
             collection_contents.append(role)
 
         collection_contents = sorted(collection_contents, key=lambda i: i[collection_name])
+        contents = CollectionContents(
+            collection_contents,
+            partial(self._load_plugin_content, selected_collection),
+        )
 
         return Step(
             name="all_collection_content",
             columns=[collection_name, "__type", "__added", "__deprecated", "__description"],
-            select_func=self._build_collection_content,
+            select_func=partial(self._build_collection_content, contents),
             step_type="menu",
-            value=collection_contents,
+            value=list(contents),
         )
 
-    def _build_collection_content(self) -> Step:
+    def _build_collection_content(self, contents: CollectionContents) -> Step:
         """Build the content for one plugin.
 
+        :param contents: The contents of the collection
         :returns: The plugin's content
         """
         return Step(
             name="collection_content",
             step_type="content",
-            value=self.steps.current.value,
+            value=contents,
             index=self.steps.current.index,
         )
 
+    def _plugin_summaries(self, checksums: Iterable[str]) -> dict[tuple[str, str], tuple[Any, ...]]:
+        """Read the summaries of plugins from the collection doc cache.
+
+        The shared collection doc caches layered below it are consulted, in order, for the
+        plugins it has no summary for, as they are for the documentation.
+
+        :param checksums: The checksums of the plugins
+        :returns: The summary of each plugin found, using the checksum and plugin type as the key
+        """
+        remaining = list(dict.fromkeys(checksums))
+        columns = "checksum, type, documented, name, short_description, version_added, deprecated"
+        select = f"SELECT {columns} FROM plugin_summaries WHERE checksum IN"  # noqa: S608
+        summaries: dict[tuple[str, str], tuple[Any, ...]] = {}
+        for cache in (self._collection_cache, *self._collection_cache.layers):
+            if not remaining:
+                break
+            found: set[str] = set()
+            cursor = cache.conn.cursor()
+            try:
+                for start in range(0, len(remaining), MAX_VARIABLES):
+                    chunk = remaining[start : start + MAX_VARIABLES]
+                    placeholders = ",".join("?" * len(chunk))
+                    query = f"{select} ({placeholders})"
+                    for row in cursor.execute(query, chunk):
+                        summaries[row[0], row[1]] = row[2:]
+                        found.add(row[0])
+            except sqlite3.OperationalError as exc:
+                # The cache was written before plugin summaries were stored
+                self._logger.debug("plugin summaries not available in %s: %s", cache.path, exc)
+            remaining = [checksum for checksum in remaining if checksum not in found]
+        return summaries
+
+    def _plugin_menu_entry(
+        self,
+        selected_collection: dict[str, Any],
+        plugin_checksum: str,
+        summary: tuple[Any, ...],
+    ) -> dict[str, Any] | None:
+        """Build the menu entry for a plugin from it's summary.
+
+        :param selected_collection: The selected collection
+        :param plugin_checksum: The checksum of the plugin
+        :param summary: The summary of the plugin
+        :returns: The menu entry, or None if the plugin is not documented
+        """
+        documented, short_name, short_description, version_added, deprecated = summary
+        details = selected_collection["plugin_checksums"][plugin_checksum]
+        if not documented:
+            return None
+        if short_name is None or short_description is None:
+            self._logger.error("error loading plugin doc %s", details)
+            return None
+        runtime_info = self._plugin_runtime_info(selected_collection, details["type"], short_name)
+        return {
+            f"__{selected_collection['known_as']}": short_name,
+            "full_name": f"{selected_collection['known_as']}.{short_name}",
+            "__added": version_added,
+            "__checksum": plugin_checksum,
+            "__deprecated": str(bool(deprecated) or "deprecation" in runtime_info),
+            "__description": short_description,
+            "__type": details["type"],
+        }
+
+    def _load_plugin_content(
+        self,
+        selected_collection: dict[str, Any],
+        entry: dict[str, Any],
+    ) -> dict[str, Any]:
+        """Load the complete content for a menu entry from the collection doc cache.
+
+        :param selected_collection: The selected collection
+        :param entry: The menu entry
+        :returns: The plugin's content, or the menu entry if it could not be loaded
+        """
+        if "__checksum" not in entry:
+            return entry
+        details = selected_collection["plugin_checksums"][entry["__checksum"]]
+        self._collection_cache.open_(read_only=True)
+        try:
+            plugin = self._plugin_content(
+                selected_collection,
+                details,
+                self._collection_cache[entry["__checksum"]],
+            )
+        except (KeyError, JSONDecodeError) as exc:
+            self._logger.exception("error loading plugin doc %s", details)
+            self._logger.debug("error was %s", str(exc))
+            plugin = None
+        finally:
+            self._collection_cache.close()
+        return entry if plugin is None else plugin
+
+    def _plugin_content(
+        self,
+        selected_collection: dict[str, Any],
+        details: dict[str, Any],
+        plugin_json: str,
+    ) -> dict[str, Any] | None:
+        """Build the content for a plugin from it's documentation.
+
+        :param selected_collection: The selected collection
+        :param details: The details of the plugin from the collection catalog
+        :param plugin_json: The documentation of the plugin from the collection doc cache
+        :returns: The plugin's content, or None if the plugin is not documented
+        """
+        loaded = json.loads(plugin_json)
+
+        plugin = loaded["plugin"]
+        if plugin["doc"] is None:
+            return None
+        if "name" in plugin["doc"]:
+            short_name = plugin["doc"]["name"]
+        else:
+            short_name = plugin["doc"][details["type"]]
+        plugin[f"__{selected_collection['known_as']}"] = short_name
+        plugin["full_name"] = f"{selected_collection['known_as']}.{short_name}"
+        plugin["__type"] = details["type"]
+        plugin["collection_info"] = selected_collection["collection_info"]
+        plugin["collection_info"]["name"] = selected_collection["known_as"]
+        plugin["collection_info"]["shadowed_by"] = selected_collection["hidden_by"]
+        plugin["collection_info"]["path"] = selected_collection["path"]
+
+        plugin["__added"] = plugin["doc"].get("version_added")
+        plugin["__description"] = plugin["doc"]["short_description"]
+
+        runtime_info = self._plugin_runtime_info(selected_collection, details["type"], short_name)
+        plugin["additional_information"] = runtime_info
+        deprecated = bool(plugin["doc"].get("deprecated")) or "deprecation" in runtime_info
+        plugin["__deprecated"] = str(deprecated)
+        return plugin
+
+    @staticmethod
+    def _plugin_runtime_info(
+        selected_collection: dict[str, Any],
+        plugin_type: str,
+        short_name: str,
+    ) -> dict[str, Any]:
+        """Get the plugin routing information for a plugin from the collection's runtime.
+
+        :param selected_collection: The selected collection
+        :param plugin_type: The type of the plugin
+        :param short_name: The short name of the plugin
+        :returns: The plugin routing information, if any
+        """
+        runtime_section = "modules" if plugin_type == "module" else plugin_type
+        try:
+            return selected_collection["runtime"]["plugin_routing"][runtime_section][short_name]
+        except KeyError:
+            return {}
+
     def _run_runner(self) -> None:
         # pylint: disable=too-many-locals
         """Use the runner subsystem to catalog collections."""
@@ -435,7 +623,16 @@ class Action(ActionBase):
             self._adjacent_collection_dir,
             "-c",
             self._collection_cache_path,
+            "--max-age",
+            str(self._args.collection_doc_cache_max_age),
+            "--max-size",
+            str(self._args.collection_doc_cache_max_size),
         ]
+        if self._args.collection_doc_cache_compact:
+            pass_through_arg.append("--compact")
+        shared_cache_paths = [layer.path for layer in self._collection_cache.layers]
+        for shared_cache_path in shared_cache_paths:
+            pass_through_arg.extend(("-s", shared_cache_path))
 
         kwargs["cmdline"] = pass_through_arg
 
@@ -476,6 +673,21 @@ class Action(ActionBase):
                     f"{self._args.collection_doc_cache_path}:z",
                 )
 
+            # The directory of each shared doc cache is mounted, read-only, unless already mounted
+            mounted = (
+                cache_path,
+                Path(playbook_dir),
+                Path(self._args.collection_doc_cache_path).parent,
+            )
+            container_volume_mounts.extend(
+                f"{shared_cache_path}:{shared_cache_path}:ro"
+                for shared_cache_path in shared_cache_paths
+                if not any(
+                    path_is_relative_to(child=Path(shared_cache_path), parent=parent)
+                    for parent in mounted
+                )
+            )
+
             for volume_mount in container_volume_mounts:
                 self._logger.debug("Adding volume mount to container invocation: %s", volume_mount)
 
@@ -488,6 +700,19 @@ class Action(ActionBase):
             self._logger.debug("running collections command locally")
             python_exec_path = sys.executable
 
+        catalog_cache = CatalogCache(self._collection_cache_path)
+        if self._args.collection_doc_cache_compact:
+            # The catalog script compacts the collection doc cache, so it is always run
+            catalog_settings = None
+        else:
+            catalog_settings = self._catalog_settings(python_exec_path, kwargs)
+        if catalog_settings is not None:
+            catalog = catalog_cache.get(catalog_settings)
+            if catalog is not None:
+                self._logger.info("Using the stored collection catalog, no changes were found")
+                self._parse(catalog)
+                return
+
         self._logger.debug(
             "Invoke runner with executable_cmd: %s and kwargs: %s",
             python_exec_path,
@@ -504,6 +729,73 @@ class Action(ActionBase):
             self.notify_failed()
         if output:
             self._parse(output)
+            if catalog_settings is not None and not ret_code and self._collections:
+                catalog_cache.put(catalog_settings, self._catalog_host_paths(kwargs), output)
+
+    def _catalog_settings(self, python_exec_path: str, kwargs: dict[str, Any]) -> str | None:
+        """Build a key for the settings that determine the collection catalog.
+
+        :param python_exec_path: The python executable used to run the catalog script
+        :param kwargs: The arguments for the runner command
+        :returns: The key, or None if the execution environment image could not be inspected
+        """
+        passed = kwargs["pass_environment_variable"]
+        if not isinstance(passed, list):
+            passed = []
+        settings = {
+            "command": [python_exec_path, *kwargs["cmdline"]],
+            "container_engine": kwargs["container_engine"],
+            "container_options": kwargs.get("container_options"),
+            "container_volume_mounts": kwargs.get("container_volume_mounts"),
+            "environment": {
+                key: value
+                for key, value in os.environ.items()
+                if key.startswith("ANSIBLE_") or key in ("PATH", "PYTHONPATH") or key in passed
+            },
+            "execution_environment": kwargs["execution_environment"],
+            "host_cwd": kwargs["host_cwd"],
+            "pass_environment_variable": passed,
+            "set_environment_variable": kwargs["set_environment_variable"],
+            "version": __version__,
+        }
+        if kwargs["execution_environment"]:
+            image = kwargs["execution_environment_image"]
+            image_id = inspect_image_id(kwargs["container_engine"], image)
+            if image_id is None:
+                self._logger.debug("Unable to inspect the image %s, no stored catalog", image)
+                return None
+            settings["image"] = image
+            settings["image_id"] = image_id
+        serialized = json.dumps(settings, sort_keys=True, default=str)
+        return hashlib.sha256(serialized.encode("utf-8")).hexdigest()
+
+    def _catalog_host_paths(self, kwargs: dict[str, Any]) -> list[str]:
+        """Determine the host directories and files the collection catalog was built from.
+
+        Paths within an execution environment are translated to the host paths mounted there,
+        any others are part of the image.
+
+        :param kwargs: The arguments for the runner command
+        :returns: The host paths
+        """
+        host_cwd = kwargs["host_cwd"]
+        paths = [*self._collection_scanned_paths, *(c["path"] for c in self._collections)]
+        paths.append(str(Path(host_cwd, "ansible.cfg")))
+        if not kwargs["execution_environment"]:
+            paths.extend((str(Path.home() / ".ansible.cfg"), "/etc/ansible/ansible.cfg"))
+            return paths
+
+        mounts = [(host_cwd, host_cwd)]
+        for mount in kwargs.get("container_volume_mounts", []):
+            source, destination = mount.split(":")[0:2]
+            mounts.append((source, destination))
+        host_paths = []
+        for path in paths:
+            for source, destination in mounts:
+                if path == destination or path.startswith(f"{destination.rstrip('/')}/"):
+                    host_paths.append(source + path[len(destination) :])
+                    break
+        return host_paths
 
     def _parse(self, output: str) -> None:
         """Load and process the ``json`` output from the collection cataloging process.
@@ -606,21 +898,42 @@ class Action(ActionBase):
         :returns: The plugin details like full-name, type and short description.
         """
         plugins_details: dict[str, Any] = {}
+        plugin_checksums = selected_collection["plugin_checksums"]
+        summaries = self._plugin_summaries(plugin_checksums)
+        plugin_jsons = self._collection_cache.get_many(
+            checksum
+            for checksum, plugin_info in plugin_checksums.items()
+            if (checksum, plugin_info.get("type")) not in summaries
+        )
 
-        for plugin_checksum, plugin_info in selected_collection["plugin_checksums"].items():
+        for plugin_checksum, plugin_info in plugin_checksums.items():
             plugin_type = plugin_info.get("type")
             if plugin_type not in plugins_details:
                 plugins_details[plugin_type] = []
 
-            plugin_json = self._collection_cache[plugin_checksum]
-            loaded = json.loads(plugin_json)
-
-            plugin = loaded.get("plugin")
             plugin_docs = {}
             plugin_path = Path(selected_collection.get("path", "")) / Path(
                 plugin_info.get("path", ""),
             )
             plugin_docs["path"] = str(plugin_path)
+
+            summary = summaries.get((plugin_checksum, plugin_type))
+            if summary is not None:
+                documented, short_name, short_description = summary[:3]
+                if documented:
+                    if short_name is None:
+                        plugin_docs["full_name"] = selected_collection["known_as"]
+                    else:
+                        plugin_docs["full_name"] = f"{selected_collection['known_as']}.{short_name}"
+                    if short_description is not None:
+                        plugin_docs["short_description"] = short_description
+                plugins_details[plugin_type].append(plugin_docs)
+                continue
+
+            plugin_json = plugin_jsons[plugin_checksum]
+            loaded = json.loads(plugin_json)
+
+            plugin = loaded.get("plugin")
             if plugin and plugin["doc"] is not None:
                 try:
                     if "name" in plugin["doc"]:
@@ -659,7 +972,7 @@ class Action(ActionBase):
         ]
         roles_exclude_keys = ["readme"]
 
-        self._collection_cache.open_()
+        self._collection_cache.open_(read_only=True)
         for collection in self._collections:
             plugins_details = self._get_collection_plugins_details(collection)
 
@@ -8,6 +8,7 @@ import shlex
 
 from copy import deepcopy
 from functools import partial
+from pathlib import Path
 from typing import TYPE_CHECKING
 from typing import Any
 
@@ -15,7 +16,10 @@ from ansible_navigator.action_base import ActionBase
 from ansible_navigator.action_defs import RunStdoutReturn
 from ansible_navigator.configuration_subsystem import Constants
 from ansible_navigator.content_defs import ContentFormat
+from ansible_navigator.image_manager import IntrospectionCache
 from ansible_navigator.image_manager import inspect_all
+from ansible_navigator.image_manager import inspect_image_id
+from ansible_navigator.image_manager.introspection_cache import INTROSPECTION_CACHE_FILE
 from ansible_navigator.runner import Command
 from ansible_navigator.steps import Step
 from ansible_navigator.ui_framework import CursesLine
@@ -170,15 +174,21 @@ class Action(ActionBase):
         :returns: A message and return code
         """
         image_name = self._args.execution_environment_image
+        image_id = inspect_image_id(self._args.container_engine, image_name)
 
-        output, error, return_code = self._run_runner(image_name=image_name)
-        if error or return_code:
-            return RunStdoutReturn(message=error, return_code=return_code)
+        output = self._stored_introspection(image_id)
+        stored = output is not None
+        if output is None:
+            output, error, return_code = self._run_runner(image_name=image_name)
+            if error or return_code:
+                return RunStdoutReturn(message=error, return_code=return_code)
 
         details = self._parse(output)
         if details is None:
             message = "Image introspection failed, please check the logs and log an issue."
             return RunStdoutReturn(message=message, return_code=1)
+        if not stored:
+            self._store_introspection(image_id, output)
 
         details.pop("errors")
         sections = self._args.entry("images_details").value.current
@@ -474,6 +484,14 @@ class Action(ActionBase):
             image["execution_environment"] = any(
                 (legacy_check, root_label_check, config_label_check),
             )
+
+            image["__image_id"] = details.get("id") if isinstance(details, dict) else None
+
+        image_ids = [image["__image_id"] for image in images]
+        # Only evict when the ID of every image is known, so none are evicted in error
+        if None not in image_ids:
+            evicted = self._introspection_cache().evict(self._args.container_engine, image_ids)
+            self._logger.debug("Evicted %s stored image introspections", evicted)
         self._images.value = sorted(images, key=lambda i: i["name"])
 
     def _introspect_image(self) -> bool:
@@ -487,9 +505,15 @@ class Action(ActionBase):
 
         self._images.selected["__introspected"] = True
 
-        output, error, _return_code = self._run_runner(
-            image_name=self._images.selected["__full_name"],
-        )
+        image_id = self._images.selected["__image_id"]
+        output = self._stored_introspection(image_id)
+        stored = output is not None
+        if output is None:
+            output, error, _return_code = self._run_runner(
+                image_name=self._images.selected["__full_name"],
+            )
+        else:
+            error = ""
 
         if error:
             self._logger.error(
@@ -524,8 +548,40 @@ class Action(ActionBase):
             )
             self.notify_failed()
             return False
+        if not stored:
+            self._store_introspection(image_id, output)
         return True
 
+    def _introspection_cache(self) -> IntrospectionCache:
+        """Provide the image introspection cache, within the application cache directory.
+
+        :returns: The image introspection cache
+        """
+        return IntrospectionCache(Path(self._args.internals.cache_path, INTROSPECTION_CACHE_FILE))
+
+    def _stored_introspection(self, image_id: str | None) -> str | None:
+        """Get the stored output of the introspection script for an image.
+
+        :param image_id: The ID of the image, if known
+        :returns: The output, or None if the image has not been introspected
+        """
+        if image_id is None:
+            return None
+        output = self._introspection_cache().get(self._args.container_engine, image_id)
+        if output is not None:
+            self._logger.debug("Using the stored introspection for image %s", image_id)
+        return output
+
+    def _store_introspection(self, image_id: str | None, output: str) -> None:
+        """Store the output of the introspection script for an image.
+
+        :param image_id: The ID of the image, if known
+        :param output: The output of the introspection script
+        """
+        if image_id is not None:
+            cache = self._introspection_cache()
+            cache.put(self._args.container_engine, image_id, output)
+
     def _parse(self, output: str) -> dict[Any, Any] | None:
         """Load and process the ``json`` output from the image introspection process.
 
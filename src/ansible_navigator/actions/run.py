@@ -8,12 +8,12 @@ import logging
 import re
 import shlex
 import shutil
-import time
 import uuid
 
+from functools import partial
 from math import floor
-from operator import itemgetter
 from pathlib import Path
+from queue import Empty
 from queue import Queue
 from typing import TYPE_CHECKING
 from typing import Any
@@ -24,6 +24,7 @@ from ansible_navigator.configuration_subsystem import to_effective
 from ansible_navigator.configuration_subsystem import to_sources
 from ansible_navigator.content_defs import ContentView
 from ansible_navigator.content_defs import SerializationFormat
+from ansible_navigator.runner import RUNNER_FINISHED
 from ansible_navigator.runner import CommandAsync
 from ansible_navigator.steps import Step
 from ansible_navigator.ui_framework import CursesLine
@@ -41,7 +42,15 @@ from ansible_navigator.utils.functions import is_jinja
 from ansible_navigator.utils.functions import now_iso
 from ansible_navigator.utils.functions import remove_ansi
 from ansible_navigator.utils.functions import round_half_up
+from ansible_navigator.utils.playbook_artifact import ArtifactReader
+from ansible_navigator.utils.playbook_artifact import ArtifactTasks
+from ansible_navigator.utils.playbook_artifact import ArtifactWriter
+from ansible_navigator.utils.playbook_artifact import is_compressed
+from ansible_navigator.utils.playbook_artifact import is_streaming
+from ansible_navigator.utils.playbook_artifact import open_artifact
+from ansible_navigator.utils.playbook_artifact import write_compressed_document
 from ansible_navigator.utils.serialize import serialize_write_file
+from ansible_navigator.utils.stdout_store import StdoutStore
 
 from . import _actions as actions
 from . import run_action
@@ -168,6 +177,11 @@ def filter_content_keys(obj: dict[Any, Any]) -> dict[Any, Any]:
     return {k: v for k, v in obj.items() if not (k.startswith("_") or k.endswith("uuid"))}
 
 
+#: Seconds to wait for a runner message before checking in again
+QUEUE_TIMEOUT = 1.0
+#: The number of stdout lines written to each record of a streaming artifact snapshot
+ARTIFACT_STDOUT_LINES = 10_000
+
 PLAY_COLUMNS = [
     "__play_name",
     "__ok",
@@ -181,6 +195,17 @@ PLAY_COLUMNS = [
     "__progress",
 ]
 
+PLAY_COUNTERS = [
+    "__ok",
+    "__changed",
+    "__unreachable",
+    "__failed",
+    "__skipped",
+    "__ignored",
+    "__in progress",
+    "__task_count",
+]
+
 TASK_LIST_COLUMNS = [
     "__result",
     "__host",
@@ -218,6 +243,7 @@ class Action(ActionBase):
         self._auto_scroll = False
         #: Flag when the first message is received from runner
         self._first_message_received: bool = False
+        self.stdout: StdoutStore = StdoutStore()
 
         self._plays = Step(
             name="plays",
@@ -232,6 +258,20 @@ class Action(ActionBase):
         self._playbook_type: str = check_playbook_type(self._args.playbook)
         self._task_cache: dict[str, str] = {}
         """Task name storage from playbook_on_start using the task uuid as the key"""
+        self._play_index: dict[str, dict[str, Any]] = {}
+        """Play storage from playbook_on_play_start using the play uuid as the key"""
+        self._task_index: dict[tuple[str, str], dict[str, Any]] = {}
+        """Task storage from runner_on_start using the task uuid and host as the key"""
+        self._artifact_writer: ArtifactWriter | None = None
+        """The streaming artifact writer for the current run, if requested"""
+        self._artifact_time_stamp: str = ""
+        """The time stamp used in the name of the streaming artifact"""
+        self._artifact_reader: ArtifactReader | None = None
+        """The streaming artifact reader, when tasks are read from the artifact as needed"""
+        self._artifact_task_index: dict[str, int] = {}
+        """Task index offsets for a replayed streaming artifact using the play uuid as the key"""
+        self._artifact_tasks: dict[str, ArtifactTasks] = {}
+        """Tasks read from a replayed streaming artifact using the play uuid as the key"""
 
     @property
     def mode(self) -> str:
@@ -267,16 +307,12 @@ class Action(ActionBase):
         self._subaction_type = "playbook"
         self._logger = logging.getLogger(f"{__name__}_{self._subaction_type}")
         self._run_runner()
-        while True:
-            self._dequeue()
-            if self.runner.finished:
-                if self._args.playbook_artifact_enable:
-                    self.write_artifact()
-                self._logger.debug("runner finished")
-                break
-            # Sleep briefly to prevent 100% CPU utilization
-            # in mode stdout, the delay introduced by the curses key read is not present
-            time.sleep(0.01)
+        # Block while waiting for events, the end of the run is signaled on the queue
+        while not self._dequeue(timeout=QUEUE_TIMEOUT):
+            pass
+        if self._args.playbook_artifact_enable:
+            self.write_artifact()
+        self._logger.debug("runner finished")
         return_code = self.runner.ansible_runner_instance.rc
         if return_code != 0:
             return RunStdoutReturn(
@@ -422,42 +458,114 @@ class Action(ActionBase):
             artifact_file = populated_form["fields"]["artifact_file"]["value"]
 
         try:
-            with Path(artifact_file).open(encoding="utf-8") as fh:
-                data = json.load(fh)
-        except json.JSONDecodeError as exc:
-            self._logger.debug("json decode error: %s", str(exc))
+            reader = ArtifactReader(Path(artifact_file))
+            if reader.header is None:
+                with open_artifact(Path(artifact_file), mode="rb") as fh:
+                    replayed = self._replay_document(json.load(fh))
+            else:
+                replayed = self._replay_stream(reader)
+        except (OSError, EOFError, json.JSONDecodeError) as exc:
+            # A compressed document from a run that did not complete raises an EOFError
+            self._logger.debug("artifact read error: %s", str(exc))
             self._logger.exception("Unable to parse artifact file")
             return False
+        if not replayed:
+            return False
 
+        self._runner_finished = True
+        self._logger.debug("Completed replay artifact request with mode %s", self.mode)
+        return True
+
+    def _replay_document(self, data: dict[str, Any]) -> bool:
+        """Replay an artifact written as a single json document.
+
+        :param data: The artifact
+        :returns: True if the artifact was replayed, False if there is an error
+        """
         version = data.get("version", "")
-        if version.startswith(("1.", "2.")):
-            try:
-                stdout = data["stdout"]
-                if self.mode == "interactive":
-                    self._plays.value = data["plays"]
-                    self._interaction.ui.update_status(data["status"], data["status_color"])
-                    self.stdout = stdout
-                else:
-                    for line in data["stdout"]:
-                        if self._args.display_color is True:
-                            print(line)
-                        else:
-                            print(remove_ansi(line))
-            except KeyError as exc:
-                self._logger.debug("missing keys from artifact file")
-                self._logger.debug("error was: %s", str(exc))
-                return False
-        else:
+        if not version.startswith(("1.", "2.")):
             self._logger.error(
-                "Incompatible artifact version, got '%s', compatible = '1.y.z'",
+                "Incompatible artifact version, got '%s', compatible = '1.y.z', '2.y.z' or '3.y.z'",
                 version,
             )
             return False
+        try:
+            stdout = data["stdout"]
+            if self.mode == "interactive":
+                self._plays.value = data["plays"]
+                for play in self._plays.value:
+                    self._count_play_stats(play)
+                self._interaction.ui.update_status(data["status"], data["status_color"])
+                self.stdout.extend(stdout)
+            else:
+                self._print_stdout(stdout)
+        except KeyError as exc:
+            self._logger.debug("missing keys from artifact file")
+            self._logger.debug("error was: %s", str(exc))
+            return False
+        return True
 
-        self._runner_finished = True
-        self._logger.debug("Completed replay artifact request with mode %s", self.mode)
+    def _replay_stream(self, reader: ArtifactReader) -> bool:
+        """Replay a streaming artifact.
+
+        In interactive mode, the plays and stdout are read using the index in the trailer and
+        the tasks of a play are read when the play is selected. Without a trailer, from a run
+        that did not complete, every record is read.
+
+        :param reader: The artifact reader
+        :returns: True if the artifact was replayed
+        """
+        trailer = reader.trailer()
+        if self.mode == "interactive" and trailer is not None and "index" in trailer:
+            index = trailer["index"]
+            for offset in index["stdout"]:
+                self.stdout.extend(reader.read_record(offset)["stdout"])
+            for play in trailer["plays"]:
+                play["tasks"] = []
+                self._plays.value.append(play)
+                self._artifact_task_index[play["uuid"]] = index["plays"][play["uuid"]]["task_index"]
+            self._artifact_reader = reader
+            self._interaction.ui.update_status(trailer["status"], trailer["status_color"])
+            return True
+
+        for record in reader.records():
+            if "stdout" in record:
+                if self.mode == "interactive":
+                    self.stdout.extend(record["stdout"])
+                else:
+                    self._print_stdout(record["stdout"])
+            elif self.mode != "interactive":
+                continue
+            elif "play" in record:
+                play = record["play"]
+                play["tasks"] = []
+                self._plays.value.append(play)
+                self._play_index[play["uuid"]] = play
+            elif "task" in record:
+                task = record["task"]
+                task_key = (task["task_uuid"], task["host"])
+                if task_key in self._task_index:
+                    self._task_index[task_key].update(task)
+                elif task["play_uuid"] in self._play_index:
+                    self._play_index[task["play_uuid"]]["tasks"].append(task)
+                    self._task_index[task_key] = task
+        if self.mode == "interactive":
+            for play in self._plays.value:
+                self._count_play_stats(play)
+            self._interaction.ui.update_status("incomplete", 13)
         return True
 
+    def _print_stdout(self, lines: list[str]) -> None:
+        """Print replayed stdout lines.
+
+        :param lines: The lines to print
+        """
+        for line in lines:
+            if self._args.display_color is True:
+                print(line)
+            else:
+                print(remove_ansi(line))
+
     def _prompt_for_artifact(self, artifact_file: str) -> dict[Any, Any]:
         """Prompt for a valid artifact file.
 
@@ -627,18 +735,33 @@ class Action(ActionBase):
         self.runner.run()
         self._runner_finished = False
         self._logger.debug("runner requested to start")
+        self._open_artifact_stream()
 
-    def _dequeue(self) -> None:
-        """Drain the runner queue."""
+    def _dequeue(self, timeout: float | None = None) -> bool:
+        """Drain the runner queue.
+
+        :param timeout: If set, wait up to this many seconds for the first message
+        :returns: True if the runner finished and all of it's messages have been handled
+        """
         drain_count = 0
-        while not self._queue.empty():
-            if not self._first_message_received:
+        runner_finished = False
+        try:
+            message = self._queue.get(block=timeout is not None, timeout=timeout)
+            while True:
                 self._first_message_received = True
-            message = self._queue.get()
-            self._handle_message(message)
-            drain_count += 1
+                if message is RUNNER_FINISHED:
+                    runner_finished = True
+                else:
+                    self._handle_message(message)
+                    drain_count += 1
+                message = self._queue.get_nowait()
+        except Empty:
+            pass
         if drain_count:
             self._logger.debug("Drained %s events", drain_count)
+            if self._artifact_writer is not None:
+                self._artifact_writer.flush()
+        return runner_finished
 
     def _handle_message(self, message: dict[str, Any]) -> None:
         # pylint: disable=too-many-locals
@@ -649,7 +772,9 @@ class Action(ActionBase):
         """
         # Collect any stdout
         if message.get("stdout"):
-            self.stdout.extend(message["stdout"].splitlines())
+            lines = message["stdout"].splitlines()
+            self.stdout.extend(lines)
+            self._write_record({"stdout": lines})
             if self.mode == "stdout_w_artifact":
                 print(message["stdout"])
 
@@ -675,7 +800,10 @@ class Action(ActionBase):
         if event == "playbook_on_play_start":
             event_data["__play_name"] = event_data["name"]
             event_data["tasks"] = []
+            event_data.update(dict.fromkeys(PLAY_COUNTERS, 0))
             self._plays.value.append(event_data)
+            self._play_index[event_data["uuid"]] = event_data
+            self._write_record({"play": {k: v for k, v in event_data.items() if k != "tasks"}})
             return
 
         if event == "playbook_on_task_start":
@@ -692,11 +820,13 @@ class Action(ActionBase):
 
         # Find the parent play of the task
         try:
-            play = next(p for p in self._plays.value if p["uuid"] == event_data["play_uuid"])
-        except StopIteration:
+            play = self._play_index[event_data["play_uuid"]]
+        except KeyError:
             self._logger.warning("Playbook event without parent play")
             return
 
+        task_key = (event_data["task_uuid"], event_data["host"])
+
         # New task encountered
         if runner_event == "start":
             try:
@@ -717,15 +847,16 @@ class Action(ActionBase):
                 },
             )
             play["tasks"].append(event_data)
+            play["__task_count"] += 1
+            self._tally_task(play=play, task=event_data, count=1)
+            self._task_index[task_key] = event_data
+            self._write_record({"task": event_data})
             return
 
         # The runner event indicates a task has finished, find the task in the play
-        match = ("task_uuid", "host")
         try:
-            task = next(
-                t for t in play["tasks"] if itemgetter(*match)(t) == itemgetter(*match)(event_data)
-            )
-        except StopIteration:
+            task = self._task_index[task_key]
+        except KeyError:
             self._logger.warning("Task event without parent task")
             return
 
@@ -758,31 +889,46 @@ class Action(ActionBase):
         if no_longer_templated or changed_and_not_templated:
             event_data["__task"] = event_data["task"]
 
+        self._tally_task(play=play, task=task, count=-1)
         task.update(event_data)
+        self._tally_task(play=play, task=task, count=1)
+        self._write_record({"task": task})
 
     def _play_stats(self) -> None:
-        """Calculate the play's stats based on it's tasks."""
-        for idx, play in enumerate(self._plays.value):
-            total = ["__ok", "__skipped", "__failed", "__unreachable", "__ignored", "__in progress"]
-            self._plays.value[idx].update(
-                {
-                    tot: len([t for t in play["tasks"] if t["__result"].lower() == tot[2:]])
-                    for tot in total
-                },
-            )
-            self._plays.value[idx]["__changed"] = len(
-                [t for t in play["tasks"] if t["__changed"] is True],
-            )
-            task_count = len(play["tasks"])
-            self._plays.value[idx]["__task_count"] = task_count
-            completed = task_count - self._plays.value[idx]["__in progress"]
+        """Calculate the play's progress based on it's running task counters."""
+        for play in self._plays.value:
+            task_count = play["__task_count"]
+            completed = task_count - play["__in progress"]
             if completed:
                 new = floor(completed / task_count * 100)
-                current = self._plays.value[idx].get("__percent_complete", 0)
-                self._plays.value[idx]["__percent_complete"] = max(new, current)
-                self._plays.value[idx]["__progress"] = str(max(new, current)) + "%"
+                current = play.get("__percent_complete", 0)
+                play["__percent_complete"] = max(new, current)
+                play["__progress"] = str(max(new, current)) + "%"
             else:
-                self._plays.value[idx]["__progress"] = "0%"
+                play["__progress"] = "0%"
+
+    @staticmethod
+    def _tally_task(play: dict[str, Any], task: dict[str, Any], count: int) -> None:
+        """Add or remove a task's result from the play's running counters.
+
+        :param play: The play the task belongs to
+        :param task: The task
+        :param count: 1 to add the task's result, -1 to remove it
+        """
+        result = f"__{task['__result'].lower()}"
+        play[result] = play.get(result, 0) + count
+        if task["__changed"] is True:
+            play["__changed"] += count
+
+    def _count_play_stats(self, play: dict[str, Any]) -> None:
+        """Reset a play's running counters and count all of it's tasks.
+
+        :param play: The play to count
+        """
+        play.update(dict.fromkeys(PLAY_COUNTERS, 0))
+        play["__task_count"] = len(play["tasks"])
+        for task in play["tasks"]:
+            self._tally_task(play=play, task=task, count=1)
 
     def _prepare_to_quit(self, interaction: Interaction) -> bool:
         """Pre-quit tasks.
@@ -810,15 +956,33 @@ class Action(ActionBase):
         :returns: The menu step
         """
         value = self.steps.current.selected["tasks"]
+        select_func = self._task_from_task_list
+        if self._artifact_reader is not None:
+            tasks = self._artifact_tasks_for_play(self.steps.current.selected)
+            value = list(tasks)
+            select_func = partial(self._task_from_artifact, tasks)
         step = Step(
             name="task_list",
             step_type="menu",
             columns=self._task_list_columns,
-            select_func=self._task_from_task_list,
+            select_func=select_func,
             value=value,
         )
         return step
 
+    def _artifact_tasks_for_play(self, play: dict[str, Any]) -> ArtifactTasks:
+        """Read the tasks of a play from the replayed streaming artifact.
+
+        :param play: The play
+        :returns: The tasks of the play
+        """
+        if play["uuid"] not in self._artifact_tasks:
+            assert self._artifact_reader is not None  # noqa:S101
+            offset = self._artifact_task_index[play["uuid"]]
+            task_index = self._artifact_reader.read_record(offset)["task_index"]
+            self._artifact_tasks[play["uuid"]] = ArtifactTasks(self._artifact_reader, task_index)
+        return self._artifact_tasks[play["uuid"]]
+
     def _task_from_task_list(self) -> Step:
         """Generate task content for the selected task.
 
@@ -829,16 +993,26 @@ class Action(ActionBase):
         step = Step(name="task", step_type="content", index=index, value=value)
         return step
 
+    def _task_from_artifact(self, tasks: ArtifactTasks) -> Step:
+        """Generate task content for the selected task, read from the artifact.
+
+        :param tasks: The tasks of the play
+        :returns: Content which shows a task
+        """
+        index = self.steps.current.index
+        step = Step(name="task", step_type="content", index=index, value=tasks)
+        return step
+
     def update(self) -> None:
         """Drain the queue, set the status and write the artifact if needed."""
         # let the calling app update as well
         self._calling_app.update()
 
         if hasattr(self, "runner"):
-            self._dequeue()
+            runner_finished = self._dequeue()
             self._set_status()
 
-            if self.runner.finished and not self._runner_finished:
+            if runner_finished and not self._runner_finished:
                 self._logger.debug("runner finished")
                 self._logger.info("Playbook complete")
                 self.write_artifact()
@@ -872,54 +1046,186 @@ class Action(ActionBase):
         status, status_color = self._get_status()
         self._interaction.ui.update_status(status, status_color)
 
+    def _artifact_filename(self, filename: str, status: str, time_stamp: str) -> Path:
+        """Format and resolve the artifact file name.
+
+        :param filename: The artifact file name, with placeholders
+        :param status: The playbook status
+        :param time_stamp: The time stamp
+        :returns: The resolved artifact file name
+        """
+        playbook = self._args.playbook
+        if self._playbook_type == "fqcn" and len(self._plays.value) > 0:
+            playbook = next(k["playbook"] for k in self._plays.value)
+        filename = filename.format(
+            playbook_dir=Path(playbook).parent,
+            playbook_name=Path(playbook).stem,
+            playbook_status=status,
+            time_stamp=time_stamp,
+        )
+        self._logger.debug("Formatted artifact file name set to %s", filename)
+        path = expand_path(filename)
+        self._logger.debug("Resolved artifact file name set to %s", path)
+        return path
+
+    def _artifact_header(self) -> dict[str, Any]:
+        """Build the settings details included in every artifact.
+
+        :returns: The settings entries and their sources
+        """
+        return {
+            "settings_entries": to_effective(self._args),
+            "settings_sources": to_sources(self._args),
+        }
+
+    def _open_artifact_stream(self) -> None:
+        """Start writing a streaming artifact as the playbook runs, if requested.
+
+        The artifact is written using the status 'running' and moved once the playbook
+        status is known.
+        """
+        self._artifact_writer = None
+        if self._args.playbook_artifact_enable is not True:
+            return
+        if not is_streaming(self._args.playbook_artifact_save_as):
+            return
+        self._artifact_time_stamp = now_iso(self._args.time_zone)
+        path = self._artifact_filename(
+            filename=self._args.playbook_artifact_save_as,
+            status="running",
+            time_stamp=self._artifact_time_stamp,
+        )
+        try:
+            self._artifact_writer = ArtifactWriter(path=path, header=self._artifact_header())
+        except OSError:
+            self._logger.exception("Opening the streaming artifact file failed")
+            return
+        self._logger.debug("Streaming artifact to %s", path)
+
+    def _write_record(self, record: dict[str, Any]) -> None:
+        """Append a record to the streaming artifact, if one is being written.
+
+        :param record: The record to append
+        """
+        if self._artifact_writer is None:
+            return
+        try:
+            self._artifact_writer.write(record)
+        except OSError:
+            self._logger.exception("Writing to the streaming artifact failed, streaming disabled")
+            self._artifact_writer = None
+
     def write_artifact(self, filename: str | None = None) -> None:
         """Write the artifact.
 
+        When a streaming artifact is being written for the current run and no filename
+        is provided, the streaming artifact is completed instead.
+
         :param filename: The file to write to
         :type filename: str
         """
+        if filename is None and self._artifact_writer is not None:
+            self._close_artifact_stream()
+            return
         if filename or self._args.playbook_artifact_enable is True:
             status, status_color = self._get_status()
-            playbook = self._args.playbook
-            if self._playbook_type == "fqcn" and len(self._plays.value) > 0:
-                playbook = next(k["playbook"] for k in self._plays.value)
             filename = filename or self._args.playbook_artifact_save_as
-            filename = filename.format(
-                playbook_dir=Path(playbook).parent,
-                playbook_name=Path(playbook).stem,
-                playbook_status=status,
+            path = self._artifact_filename(
+                filename=filename,
+                status=status,
                 time_stamp=now_iso(self._args.time_zone),
             )
-            self._logger.debug("Formatted artifact file name set to %s", filename)
-            filename = str(expand_path(filename))
-            self._logger.debug("Resolved artifact file name set to %s", filename)
+            filename = str(path)
 
             try:
                 Path(Path(filename).parent).mkdir(parents=True, exist_ok=True)
-                artifact = {
-                    "version": "2.0.0",
-                    "plays": self._plays.value,
-                    "stdout": self.stdout,
-                    "status": status,
-                    "status_color": status_color,
-                    "settings_entries": to_effective(self._args),
-                    "settings_sources": to_sources(self._args),
-                }
-                serialize_write_file(
-                    content=artifact,
-                    content_view=ContentView.NORMAL,
-                    file_mode="w",
-                    file=Path(filename),
-                    serialization_format=SerializationFormat.JSON,
-                )
+                if is_streaming(filename):
+                    self._write_artifact_stream(path=path, status=status, status_color=status_color)
+                elif is_compressed(filename):
+                    write_compressed_document(
+                        path=path,
+                        artifact=self._artifact_document(status=status, status_color=status_color),
+                    )
+                else:
+                    serialize_write_file(
+                        content=self._artifact_document(status=status, status_color=status_color),
+                        content_view=ContentView.NORMAL,
+                        file_mode="w",
+                        file=Path(filename),
+                        serialization_format=SerializationFormat.JSON,
+                    )
                 self._logger.info("Saved artifact as %s", filename)
 
             except OSError as exc:
                 error = (
-                    f"Saving the artifact file failed, resulted in the following error: f{exc!s}"
+                    f"Saving the artifact file failed, resulted in the following error: {exc!s}"
                 )
                 self._logger.exception(error)
 
+    def _artifact_document(self, status: str, status_color: int) -> dict[str, Any]:
+        """Build the artifact written as a single json document.
+
+        :param status: The playbook status
+        :param status_color: The playbook status color
+        :returns: The artifact
+        """
+        return {
+            "version": "2.0.0",
+            "plays": self._plays.value,
+            "stdout": list(self.stdout),
+            "status": status,
+            "status_color": status_color,
+            **self._artifact_header(),
+        }
+
+    def _write_artifact_stream(self, path: Path, status: str, status_color: int) -> None:
+        """Write the current plays and stdout as a streaming artifact.
+
+        :param path: The path of the artifact file
+        :param status: The playbook status
+        :param status_color: The playbook status color
+        """
+        writer = ArtifactWriter(path=path, header=self._artifact_header())
+        for start in range(0, len(self.stdout), ARTIFACT_STDOUT_LINES):
+            writer.write({"stdout": self.stdout[start : start + ARTIFACT_STDOUT_LINES]})
+        for play in self._plays.value:
+            writer.write({"play": {k: v for k, v in play.items() if k != "tasks"}})
+            for task in play["tasks"]:
+                writer.write({"task": task})
+        writer.close(
+            trailer={"status": status, "status_color": status_color},
+            plays=self._play_summaries(),
+        )
+
+    def _play_summaries(self) -> list[dict[str, Any]]:
+        """Summarize each play, without it's tasks, for the artifact trailer.
+
+        :returns: The play summaries
+        """
+        return [{k: v for k, v in play.items() if k != "tasks"} for play in self._plays.value]
+
+    def _close_artifact_stream(self) -> None:
+        """Complete the streaming artifact and move it to it's final name."""
+        if self._artifact_writer is None:
+            return
+        status, status_color = self._get_status()
+        path = self._artifact_filename(
+            filename=self._args.playbook_artifact_save_as,
+            status=status,
+            time_stamp=self._artifact_time_stamp,
+        )
+        try:
+            path = self._artifact_writer.close(
+                trailer={"status": status, "status_color": status_color},
+                plays=self._play_summaries(),
+                path=path,
+            )
+            self._logger.info("Saved artifact as %s", path)
+        except OSError as exc:
+            error = f"Saving the artifact file failed, resulted in the following error: {exc!s}"
+            self._logger.exception(error)
+        self._artifact_writer = None
+
     def rerun(self) -> None:
         """Rerun the current playbook.
 
@@ -930,9 +1236,12 @@ class Action(ActionBase):
             if self.runner.finished:
                 self._plays.value = []
                 self._plays.index = None
+                self._play_index.clear()
+                self._task_index.clear()
                 self._msg_from_plays = (None, None)
                 self._queue.queue.clear()
-                self.stdout = []
+                self.stdout.close()
+                self.stdout = StdoutStore()
                 self._run_runner()
                 self.steps.clear()
                 self.steps.append(self._plays)
@@ -39,9 +39,8 @@ class Action(ActionBase):
             new_scroll = len(self._calling_app.stdout)
             if auto_scroll:
                 interaction.ui.scroll(new_scroll)
-            obj = "\n".join(app.stdout)
             next_interaction: Interaction = interaction.ui.show(
-                obj=obj,
+                obj=app.stdout,
                 content_format=ContentFormat.ANSI,
             )
             if next_interaction.name != "refresh":
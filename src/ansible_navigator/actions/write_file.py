@@ -13,6 +13,7 @@ from ansible_navigator.ui_framework import Interaction
 from ansible_navigator.utils.functions import expand_path
 from ansible_navigator.utils.functions import remove_dbl_un
 from ansible_navigator.utils.serialize import serialize_write_file
+from ansible_navigator.utils.stdout_store import StdoutStore
 
 from . import _actions as actions
 
@@ -72,7 +73,7 @@ class Action:
                     if interaction.ui.menu_filter().search(" ".join(str(v) for v in e.values()))
                 ]
 
-        if isinstance(obj, str):
+        if isinstance(obj, (str, StdoutStore)):
             write_as = ".txt"
         elif re.match(r"^.*\.y(?:a)?ml$", filename):
             write_as = ".yaml"
@@ -84,7 +85,12 @@ class Action:
         if write_as == ".txt":
             file = expand_path(filename)
             with file.open(file_mode, encoding="utf-8") as fh:
-                fh.write(obj)
+                if isinstance(obj, StdoutStore):
+                    # Written a line at a time, the lines spilled to disk are not all read at once
+                    for idx, line in enumerate(obj):
+                        fh.write(f"\n{line}" if idx else line)
+                else:
+                    fh.write(obj)
         elif write_as == ".yaml":
             serialize_write_file(
                 content=obj,
@@ -11,6 +11,7 @@ from typing import NamedTuple
 
 if TYPE_CHECKING:
     from collections.abc import Callable
+    from collections.abc import Sequence
 
     from .configuration_subsystem.definitions import ApplicationConfiguration
     from .steps import Steps
@@ -26,7 +27,7 @@ class AppPublic(NamedTuple):
     args: ApplicationConfiguration
     name: str
     rerun: Callable[[], None]
-    stdout: list[str]
+    stdout: Sequence[str]
     steps: Steps
     update: Callable[..., None]
     write_artifact: Callable[..., None]
@@ -1,5 +1,6 @@
 # cspell:ignore getpid, gmtime, msecs
 """Navigator entry point."""
+
 from __future__ import annotations
 
 import filecmp
@@ -26,6 +27,8 @@ from .actions import run_action_stdout
 from .configuration_subsystem import Constants
 from .configuration_subsystem import NavigatorConfiguration
 from .image_manager import ImagePuller
+from .image_manager import PresenceCache
+from .image_manager.presence_cache import PRESENCE_CACHE_FILE
 from .initialization import error_and_exit_early
 from .initialization import parse_and_update
 from .logger import setup_logger
@@ -110,6 +113,10 @@ def pull_image(args: Any) -> None:
         image=args.execution_environment_image,
         arguments=args.pull_arguments,
         pull_policy=args.pull_policy,
+        presence_cache=PresenceCache(
+            Path(args.internals.cache_path, PRESENCE_CACHE_FILE),
+            ttl=args.pull_cache_ttl,
+        ),
     )
     image_puller.assess()
     if image_puller.assessment.exit_messages:
@@ -276,6 +276,40 @@ NavigatorConfiguration = ApplicationConfiguration(
             value=SettingsEntryValue(),
             version_added="v1.0",
         ),
+        SettingsEntry(
+            name="collection_doc_cache_compact",
+            choices=[True, False],
+            cli_parameters=CliParameters(short="--cdcc"),
+            short_description=(
+                "Remove unused collection documentation from the collection doc cache and"
+                " reclaim the space it used, before cataloging the collections"
+            ),
+            subcommands=["collections"],
+            value=SettingsEntryValue(default=False),
+            version_added="v25.1",
+        ),
+        SettingsEntry(
+            name="collection_doc_cache_max_age",
+            cli_parameters=CliParameters(short="--cdcma"),
+            short_description=(
+                "Remove collection documentation not used for this many days from the collection"
+                " doc cache, 0 keeps it indefinitely"
+            ),
+            subcommands=["collections"],
+            value=SettingsEntryValue(default=0),
+            version_added="v25.1",
+        ),
+        SettingsEntry(
+            name="collection_doc_cache_max_size",
+            cli_parameters=CliParameters(short="--cdcms"),
+            short_description=(
+                "Keep the collection doc cache below this many megabytes by removing the least"
+                " recently used collection documentation, 0 for no limit"
+            ),
+            subcommands=["collections"],
+            value=SettingsEntryValue(default=0),
+            version_added="v25.1",
+        ),
         SettingsEntry(
             name="collection_doc_cache_path",
             cli_parameters=CliParameters(short="--cdcp"),
@@ -286,6 +320,18 @@ NavigatorConfiguration = ApplicationConfiguration(
             ),
             version_added="v1.0",
         ),
+        SettingsEntry(
+            name="collection_doc_cache_shared_paths",
+            cli_parameters=CliParameters(action="append", nargs="+", short="--cdcsp"),
+            environment_variable_split_char=";",
+            short_description=(
+                "Specify read-only collection doc caches, shared by many users, consulted in order"
+                " before building collection documentation"
+                " (--cdcsp /mnt/shared/collection_doc_cache.db)"
+            ),
+            value=SettingsEntryValue(),
+            version_added="v25.1",
+        ),
         SettingsEntry(
             name="config",
             cli_parameters=CliParameters(short="-c"),
@@ -671,6 +717,17 @@ NavigatorConfiguration = ApplicationConfiguration(
             value=SettingsEntryValue(),
             version_added="v2.0",
         ),
+        SettingsEntry(
+            name="pull_cache_ttl",
+            cli_parameters=CliParameters(short="--pct"),
+            settings_file_path_override="execution-environment.pull.cache-ttl",
+            short_description=(
+                "Specify how many seconds an execution environment image found locally is assumed"
+                " to still be present without checking again, 0 to always check"
+            ),
+            value=SettingsEntryValue(default=0),
+            version_added="v25.1",
+        ),
         SettingsEntry(
             name="pull_policy",
             choices=["always", "missing", "never", "tag"],
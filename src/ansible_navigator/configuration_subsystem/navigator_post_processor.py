@@ -1,5 +1,6 @@
 # pylint: disable=too-many-lines
 """Post processing of ansible-navigator configuration."""
+
 from __future__ import annotations
 
 import contextlib
@@ -107,6 +108,30 @@ class NavigatorPostProcessor:
 
         return messages, exit_messages
 
+    @staticmethod
+    def _non_negative_integer(
+        entry: SettingsEntry,
+        config: ApplicationConfiguration,
+    ) -> PostProcessorReturn:
+        """Post process a value that is a whole number, zero or more.
+
+        :param entry: The current settings entry
+        :param config: The full application configuration
+        :returns: An instance of the standard post process return object
+        """
+        messages: list[LogMessage] = []
+        exit_messages: list[ExitMessage] = []
+        try:
+            entry.value.current = int(entry.value.current)
+        except ValueError as exc:
+            exit_msg = f"Value should be valid integer. Failed with error {exc!s}"
+            exit_messages.append(ExitMessage(message=exit_msg))
+            return messages, exit_messages
+        if entry.value.current < 0:
+            exit_msg = f"{entry.name} should be 0 or more, not {entry.value.current}"
+            exit_messages.append(ExitMessage(message=exit_msg))
+        return messages, exit_messages
+
     @staticmethod
     @_post_processor
     def ansible_runner_artifact_dir(
@@ -172,6 +197,15 @@ class NavigatorPostProcessor:
                 exit_messages.append(ExitMessage(message=exit_msg))
         return messages, exit_messages
 
+    # Post process collection_doc_cache_compact.
+    collection_doc_cache_compact = _true_or_false
+
+    # Post process collection_doc_cache_max_age.
+    collection_doc_cache_max_age = _non_negative_integer
+
+    # Post process collection_doc_cache_max_size.
+    collection_doc_cache_max_size = _non_negative_integer
+
     @staticmethod
     @_post_processor
     def collection_doc_cache_path(
@@ -189,6 +223,26 @@ class NavigatorPostProcessor:
         entry.value.current = str(expand_path(entry.value.current))
         return messages, exit_messages
 
+    @staticmethod
+    @_post_processor
+    def collection_doc_cache_shared_paths(
+        entry: SettingsEntry,
+        config: ApplicationConfiguration,
+    ) -> PostProcessorReturn:
+        """Post process collection doc cache shared paths.
+
+        :param entry: The current settings entry
+        :param config: The full application configuration
+        :returns: An instance of the standard post process return object
+        """
+        messages: list[LogMessage] = []
+        exit_messages: list[ExitMessage] = []
+        if entry.value.current is not C.NOT_SET:
+            entry.value.current = [
+                str(expand_path(path)) for path in flatten_list(entry.value.current)
+            ]
+        return messages, exit_messages
+
     @staticmethod
     @_post_processor
     def cmdline(entry: SettingsEntry, config: ApplicationConfiguration) -> PostProcessorReturn:
@@ -1072,6 +1126,9 @@ class NavigatorPostProcessor:
             entry.value.current = flatten_list(entry.value.current)
         return messages, exit_messages
 
+    # Post process pull_cache_ttl.
+    pull_cache_ttl = _non_negative_integer
+
     settings_effective = partialmethod(_forced_stdout, subcommand="settings")
     settings_sample = partialmethod(_forced_stdout, subcommand="settings")
     settings_sources = partialmethod(_forced_stdout, subcommand="settings")
@@ -132,7 +132,7 @@ class ContentBase(Generic[T]):
         return asdict(self).items()
 
 
-ContentTypeSingle = bool | float | int | str | dict[str, Any] | ContentBase[Any]
+ContentTypeSingle = bool | float | int | str | dict[str, Any] | ContentBase[Any] | Sequence[str]
 ContentTypeSequence = list[Any] | Sequence[ContentBase[Any]]
 ContentType = ContentTypeSingle | ContentTypeSequence
 
@@ -11,9 +11,13 @@ import os
 import re
 import subprocess
 import sys
+import threading
+import time
 
 from collections import Counter
 from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from datetime import timezone
 from json.decoder import JSONDecodeError
@@ -30,7 +34,10 @@ from yaml.error import YAMLError
 
 
 if TYPE_CHECKING:
+    import sqlite3
+
     from collections.abc import Generator
+    from collections.abc import Iterable
 
 
 try:
@@ -51,25 +58,164 @@ except ImportError:
 
 
 PROCESSES = (multiprocessing.cpu_count() - 1) or 1
+#: The most plugins sent to a worker process at once
+CHUNK_SIZE = 16
+#: The number of extracted docs written to the cache in each transaction
+COMMIT_BATCH = 200
+#: The ways documentation is extracted from a plugin, tried in this order
+DOC_TIERS = ("ast", "loader", "fallback")
+#: The variables of a plugin holding documentation, with their names in the extracted docs
+DOC_VARIABLES = {
+    "DOCUMENTATION": "doc",
+    "EXAMPLES": "plainexamples",
+    "RETURN": "returndocs",
+    "ANSIBLE_METADATA": "metadata",
+}
+#: Files modified more recently than this, in nanoseconds, may change again without a change
+#: to their modification time, so their checksums are not cached
+RACY_WINDOW_NS = 2_000_000_000
+#: How often, in seconds, the last access of a cached plugin doc is updated
+ACCESS_RESOLUTION = 86_400
+#: The share of the collection doc cache that may be free pages before it is vacuumed
+VACUUM_FREE_RATIO = 0.25
+
+
+def sha256_file(file_path: Path) -> str:
+    """Generate the sha256 checksum of a file.
+
+    :param file_path: The path to the file
+    :returns: The hex digest of the file contents
+    """
+    sha256_hash = hashlib.sha256()
+    with file_path.open("rb") as fh:
+        for byte_block in iter(lambda: fh.read(4096), b""):
+            sha256_hash.update(byte_block)
+    return sha256_hash.hexdigest()
+
+
+def load_yaml_file(file_path: Path) -> Any:
+    """Load a yaml file.
+
+    :param file_path: The path to the file
+    :returns: The loaded content of the file
+    """
+    with file_path.open(encoding="utf-8") as fh:
+        return yaml.load(fh, Loader=SafeLoader)
+
+
+class ChecksumCache:
+    """Checksums of plugin files, stored in a table of the collection doc cache.
+
+    A file is read and hashed only when its inode, size or modification time differ from those
+    recorded with it's checksum. The checksums of files no longer found are removed when saved.
+    """
+
+    def __init__(self, connection: sqlite3.Connection) -> None:
+        """Initialize the checksum cache, loading the known checksums.
+
+        :param connection: The connection to the collection doc cache
+        """
+        self._conn = connection
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS file_checksums"
+            " (path text primary key, inode integer, size integer, mtime_ns integer,"
+            " checksum text)",
+        )
+        self._known: dict[str, tuple[int, int, int, str]] = {
+            row[0]: row[1:]
+            for row in self._conn.execute(
+                "SELECT path, inode, size, mtime_ns, checksum FROM file_checksums",
+            )
+        }
+        self._lock = threading.Lock()
+        self._updated: dict[str, tuple[int, int, int, str]] = {}
+        self._seen: set[str] = set()
+        self.reused = 0
+
+    def checksum(self, file_path: Path) -> str:
+        """Get the sha256 checksum of a file, from the cache when the file is unchanged.
+
+        :param file_path: The path to the file
+        :returns: The hex digest of the file contents
+        """
+        path = str(file_path)
+        stat = file_path.stat()
+        signature = (stat.st_ino, stat.st_size, stat.st_mtime_ns)
+        known = self._known.get(path)
+        if known is not None and known[:3] == signature:
+            with self._lock:
+                self._seen.add(path)
+                self.reused += 1
+            return known[3]
+        checksum = sha256_file(file_path)
+        with self._lock:
+            self._seen.add(path)
+            if time.time_ns() - stat.st_mtime_ns > RACY_WINDOW_NS:
+                self._updated[path] = (*signature, checksum)
+        return checksum
+
+    def save(self, roots: Iterable[str] = ()) -> None:
+        """Store the new and changed checksums, and remove those of files no longer found.
+
+        :param roots: The directories cataloged, checksums of files not seen within them are removed
+        """
+        prefixes = tuple(f"{root}{os.sep}" for root in roots)
+        removed = [
+            path for path in self._known if path.startswith(prefixes) and path not in self._seen
+        ]
+        if not self._updated and not removed:
+            return
+        self._conn.executemany(
+            "DELETE FROM file_checksums WHERE path = ?",
+            ((path,) for path in removed),
+        )
+        self._conn.executemany(
+            "REPLACE INTO file_checksums (path, inode, size, mtime_ns, checksum)"
+            " VALUES (?, ?, ?, ?, ?)",
+            ((path, *entry) for path, entry in self._updated.items()),
+        )
+        self._conn.commit()
+        for path in removed:
+            del self._known[path]
+        self._known.update(self._updated)
+        self._updated.clear()
 
 
 class CollectionCatalog:
     """A collection cataloger."""
 
-    def __init__(self, directories: list[Path]) -> None:
+    def __init__(
+        self,
+        directories: list[Path],
+        checksum_cache: ChecksumCache | None = None,
+    ) -> None:
         """Initialize the collection cataloger.
 
         :param directories: A list of directories that may contain collections
+        :param checksum_cache: A cache of plugin file checksums, to avoid hashing unchanged files
         """
+        self._checksum_cache = checksum_cache
         self._directories: list[Path] = directories
         self._collections: OrderedDict[str, dict[Any, Any]] = OrderedDict()
         self._errors: list[dict[str, str]] = []
         self._messages: list[str] = []
+        self._yaml_executor: ProcessPoolExecutor | None = None
 
-    def _catalog_plugins(self, collection: dict[Any, Any]) -> None:
+    def _load_yaml(self, file_path: Path) -> Any:
+        """Load a yaml file, in a worker process while the directories are being processed.
+
+        :param file_path: The path to the file
+        :returns: The loaded content of the file
+        """
+        if self._yaml_executor is None:
+            return load_yaml_file(file_path)
+        return self._yaml_executor.submit(load_yaml_file, file_path).result()
+
+    def _catalog_plugins(self, collection: dict[Any, Any], errors: list[dict[str, str]]) -> None:
         """Catalog the plugins within a collection.
 
         :param collection: Details describing the collection
+        :param errors: The errors encountered cataloging the collection
         """
         file_checksums = {}
 
@@ -82,7 +228,7 @@ class CollectionCatalog:
                         loaded = json.load(fh)
                         file_checksums = {v["name"]: v for v in loaded["files"]}
                     except (JSONDecodeError, KeyError) as exc:
-                        self._errors.append({"path": str(file_path), "error": str(exc)})
+                        errors.append({"path": str(file_path), "error": str(exc)})
 
         exempt = ["action", "module_utils", "doc_fragments"]
         plugin_directory = Path(collection["path"], "plugins")
@@ -109,10 +255,11 @@ class CollectionCatalog:
                     collection,
                 )
 
-    def _catalog_roles(self, collection: dict[str, Any]) -> None:
+    def _catalog_roles(self, collection: dict[str, Any], errors: list[dict[str, str]]) -> None:
         """Catalog the roles within a collection.
 
         :param collection: Details describing the collection
+        :param errors: The errors encountered cataloging the collection
         """
         # pylint: disable=too-many-locals
 
@@ -138,18 +285,17 @@ class CollectionCatalog:
             role["argument_specs_path"] = ""
             error = {"path": str(argspec_path)}
             try:
-                with argspec_path.open(encoding="utf-8") as fh:
-                    role["argument_specs"] = yaml.load(fh, Loader=SafeLoader)["argument_specs"]
-                    role["argument_specs_path"] = str(argspec_path)
+                role["argument_specs"] = self._load_yaml(argspec_path)["argument_specs"]
+                role["argument_specs_path"] = str(argspec_path)
             except KeyError:
                 error["error"] = f"Malformed {argspec_name} for role in {collection_name}."
-                self._errors.append(error)
+                errors.append(error)
             except FileNotFoundError:
                 error["error"] = f"Failed to find {argspec_name} for role in {collection_name}."
-                self._errors.append(error)
+                errors.append(error)
             except YAMLError:
                 error["error"] = f"Failed to load {argspec_name} for role in {collection_name}."
-                self._errors.append(error)
+                errors.append(error)
 
             # Defaults cataloging, it is not required
             defaults_name = "main.yml"
@@ -158,14 +304,13 @@ class CollectionCatalog:
             role["defaults_path"] = ""
             error = {"path": str(defaults_path)}
             try:
-                with defaults_path.open(encoding="utf-8") as fh:
-                    role["defaults"] = yaml.load(fh, Loader=SafeLoader)
-                    role["defaults_path"] = str(defaults_path)
+                role["defaults"] = self._load_yaml(defaults_path)
+                role["defaults_path"] = str(defaults_path)
             except FileNotFoundError:
                 pass
             except YAMLError:
                 error["error"] = f"Failed to load {defaults_name} for role in {collection_name}."
-                self._errors.append(error)
+                errors.append(error)
                 error_cataloging_role = True
 
             # Meta/main.yml cataloging, it is required
@@ -175,16 +320,15 @@ class CollectionCatalog:
             role["info_path"] = ""
             error = {"path": str(meta_path)}
             try:
-                with meta_path.open(encoding="utf-8") as fh:
-                    role["info"] = yaml.load(fh, Loader=SafeLoader)
-                    role["info_path"] = str(meta_path)
+                role["info"] = self._load_yaml(meta_path)
+                role["info_path"] = str(meta_path)
             except FileNotFoundError:
                 error["error"] = f"Failed to find {meta_name} for role in {collection_name}."
-                self._errors.append(error)
+                errors.append(error)
                 error_cataloging_role = True
             except YAMLError:
                 error["error"] = f"Failed to load {meta_name} for role in {collection_name}."
-                self._errors.append(error)
+                errors.append(error)
                 error_cataloging_role = True
 
             # Readme.md cataloging, it is required
@@ -199,29 +343,28 @@ class CollectionCatalog:
                     role["readme_path"] = str(readme_path)
             except FileNotFoundError:
                 error["error"] = f"Failed to find {readme_name} for role in {collection_name}."
-                self._errors.append(error)
+                errors.append(error)
                 error_cataloging_role = True
 
             if not error_cataloging_role:
                 collection["roles"].append(role)
 
-    @staticmethod
-    def _generate_checksum(file_path: Path, relative_path: Path) -> dict[str, Any]:
+    def _generate_checksum(self, file_path: Path, relative_path: Path) -> dict[str, Any]:
         """Generate a standard checksum for a file.
 
         :param file_path: The path to the file to generate a checksum for
         :param relative_path: The relative path within the collection directory structure
         :returns: Details about the file, including the checksum
         """
-        sha256_hash = hashlib.sha256()
-        with file_path.open("rb") as fh:
-            for byte_block in iter(lambda: fh.read(4096), b""):
-                sha256_hash.update(byte_block)
+        if self._checksum_cache is None:
+            checksum = sha256_file(file_path)
+        else:
+            checksum = self._checksum_cache.checksum(file_path)
         res = {
             "name": relative_path,
             "ftype": "file",
             "chksum_type": "sha256",
-            "chksum_sha256": sha256_hash.hexdigest(),
+            "chksum_sha256": checksum,
             "format": 1,
         }
         return res
@@ -254,60 +397,74 @@ class CollectionCatalog:
                 "type": plugin_type,
             }
 
-    def _one_path(self, directory: Path) -> None:
-        """Process the contents of an <...>/ansible_collections/ directory.
+    def _one_path(self, directory: Path) -> list[Path]:
+        """Find the collection directories within an <...>/ansible_collections/ directory.
 
-        :param directory: The path to collections directory to walk and load
+        :param directory: The path to collections directory to walk
+        :returns: The directories that may contain a collection
         """
-        for directory_path in directory.glob("*/*/"):
-            manifest_file = directory_path / "MANIFEST.json"
-            galaxy_file = directory_path / "galaxy.yml"
-            collection = None
-            if manifest_file.exists():
-                with manifest_file.open(encoding="utf-8") as fh:
-                    try:
-                        collection = json.load(fh)
-                        collection["meta_source"] = "MANIFEST.json"
-                    except JSONDecodeError:
-                        error = {
-                            "path": str(manifest_file),
-                            "error": "failed to load MANIFEST.json",
-                        }
-                        self._errors.append(error)
-            elif galaxy_file.exists():
-                with galaxy_file.open(encoding="utf-8") as fh:
-                    try:
-                        collection = {"collection_info": yaml.load(fh, Loader=SafeLoader)}
-                        collection["meta_source"] = "galaxy.yml"
-                    except YAMLError:
-                        error = {
-                            "path": str(galaxy_file),
-                            "error": "failed to load galaxy.yml",
-                        }
-                        self._errors.append(error)
-            if collection:
-                collection_name = f"{collection['collection_info']['namespace']}"
-                collection_name += f".{collection['collection_info']['name']}"
-                collection["known_as"] = collection_name
-                collection["plugin_checksums"] = {}
-                collection["path"] = str(directory_path)
-
-                runtime_file = directory_path / "meta" / "runtime.yml"
-                collection["runtime"] = {}
-                if runtime_file.exists():
-                    with runtime_file.open(encoding="utf-8") as fh:
-                        try:
-                            collection["runtime"] = yaml.load(fh, Loader=SafeLoader)
-                        except YAMLError as exc:
-                            self._errors.append({"path": str(runtime_file), "error": str(exc)})
-
-                self._collections[collection["path"]] = collection
-            else:
-                msg = (
-                    f"collection path '{directory_path}' is ignored as it does not"
-                    " have 'MANIFEST.json' and/or 'galaxy.yml' file(s)."
-                )
-                self._messages.append(msg)
+        return list(directory.glob("*/*/"))
+
+    def _load_collection(
+        self,
+        directory_path: Path,
+    ) -> tuple[dict[Any, Any] | None, list[dict[str, str]]]:
+        """Load the details of the collection within a directory.
+
+        :param directory_path: The directory that may contain a collection
+        :returns: The details describing the collection, if one was found, and any errors
+        """
+        errors: list[dict[str, str]] = []
+        manifest_file = directory_path / "MANIFEST.json"
+        galaxy_file = directory_path / "galaxy.yml"
+        collection = None
+        if manifest_file.exists():
+            with manifest_file.open(encoding="utf-8") as fh:
+                try:
+                    collection = json.load(fh)
+                    collection["meta_source"] = "MANIFEST.json"
+                except JSONDecodeError:
+                    error = {
+                        "path": str(manifest_file),
+                        "error": "failed to load MANIFEST.json",
+                    }
+                    errors.append(error)
+        elif galaxy_file.exists():
+            try:
+                collection = {"collection_info": self._load_yaml(galaxy_file)}
+                collection["meta_source"] = "galaxy.yml"
+            except YAMLError:
+                error = {
+                    "path": str(galaxy_file),
+                    "error": "failed to load galaxy.yml",
+                }
+                errors.append(error)
+        if collection:
+            collection_name = f"{collection['collection_info']['namespace']}"
+            collection_name += f".{collection['collection_info']['name']}"
+            collection["known_as"] = collection_name
+            collection["plugin_checksums"] = {}
+            collection["path"] = str(directory_path)
+
+            runtime_file = directory_path / "meta" / "runtime.yml"
+            collection["runtime"] = {}
+            if runtime_file.exists():
+                try:
+                    collection["runtime"] = self._load_yaml(runtime_file)
+                except YAMLError as exc:
+                    errors.append({"path": str(runtime_file), "error": str(exc)})
+        return collection, errors
+
+    def _catalog_collection(self, collection: dict[Any, Any]) -> list[dict[str, str]]:
+        """Catalog the plugins and roles within a collection.
+
+        :param collection: Details describing the collection
+        :returns: The errors encountered cataloging the collection
+        """
+        errors: list[dict[str, str]] = []
+        self._catalog_plugins(collection, errors)
+        self._catalog_roles(collection, errors)
+        return errors
 
     def _find_shadows(self) -> None:
         """Determine which collections are hidden by another installation of the same."""
@@ -325,19 +482,56 @@ class CollectionCatalog:
                             i_collection["path"],
                         )
 
+    def _process_collection_directories(self, collection_directories: list[Path]) -> None:
+        """Find, load and catalog the collections within each ansible_collections directory.
+
+        :param collection_directories: The ansible_collections directories
+        """
+        with ThreadPoolExecutor() as executor:
+            directory_paths = [
+                directory_path
+                for directory_paths in executor.map(self._one_path, collection_directories)
+                for directory_path in directory_paths
+            ]
+            loaded = executor.map(self._load_collection, directory_paths)
+            for idx, (collection, errors) in enumerate(loaded):
+                self._errors.extend(errors)
+                if collection:
+                    self._collections[collection["path"]] = collection
+                else:
+                    msg = (
+                        f"collection path '{directory_paths[idx]}' is ignored as it does not"
+                        " have 'MANIFEST.json' and/or 'galaxy.yml' file(s)."
+                    )
+                    self._messages.append(msg)
+            self.add_pseudo_builtin()
+            for errors in executor.map(self._catalog_collection, self._collections.values()):
+                self._errors.extend(errors)
+
     def process_directories(self) -> tuple[dict[Any, Any], list[dict[str, str]]]:
         """Process each parent directory.
 
+        The directories are searched and each collection is loaded and cataloged in a thread,
+        with more than one CPU available the yaml files are loaded by worker processes. The
+        results are merged in the order of the directories, as if each collection was processed
+        in turn.
+
         :returns: All collections found and any errors
         """
-        for directory in self._directories:
-            collection_directory = directory / "ansible_collections"
-            if collection_directory.exists():
-                self._one_path(collection_directory)
-        self.add_pseudo_builtin()
-        for collection in self._collections.values():
-            self._catalog_plugins(collection)
-            self._catalog_roles(collection)
+        collection_directories = [
+            directory / "ansible_collections"
+            for directory in self._directories
+            if (directory / "ansible_collections").exists()
+        ]
+        if PROCESSES > 1:
+            with ProcessPoolExecutor(max_workers=PROCESSES) as yaml_executor:
+                # Start the worker processes before any thread, they are forked on some platforms
+                yaml_executor.submit(int).result()
+                self._yaml_executor = yaml_executor
+                self._process_collection_directories(collection_directories)
+                self._yaml_executor = None
+        else:
+            self._process_collection_directories(collection_directories)
         self._find_shadows()
         return self._collections, self._errors
 
@@ -355,68 +549,131 @@ class CollectionCatalog:
         self._messages.append(msg)
 
 
-def worker(
-    pending_queue: multiprocessing.Queue[Any],
-    completed_queue: multiprocessing.Queue[Any],
-) -> None:
-    """Extract the documentation from a plugin, place in completed queue.
+def get_doc_fast(plugin_path: Path, collection_name: str) -> tuple[Any, Any, Any, Any] | None:
+    """Get the documentation from a plugin without the ansible plugin loader.
 
-    :param pending_queue: A queue with plugins to process
-    :param completed_queue: The queue in which extracted documentation will be placed
+    The assignments in the body of the plugin are parsed the same way ``get_docstring`` does.
+    Documentation extending a doc fragment needs the plugin loader to resolve the fragment, so
+    it is left for ``get_docstring``, as is anything this does not parse the same way.
+
+    :param plugin_path: The path to the plugin
+    :param collection_name: The name of the collection
+    :returns: The documentation, examples, returndocs, and metadata, or None if not extracted
+    """
+    if plugin_path.suffix != ".py":
+        return None
+    data: dict[str, Any] = dict.fromkeys(DOC_VARIABLES.values())
+    try:
+        with plugin_path.open(mode="rb") as fh:
+            module = ast.parse(fh.read())
+        for node in module.body:
+            if not isinstance(node, ast.Assign):
+                continue
+            for target in node.targets:
+                if not isinstance(target, ast.Name) or target.id not in DOC_VARIABLES:
+                    continue
+                value = node.value
+                if isinstance(value, ast.Dict):
+                    data[DOC_VARIABLES[target.id]] = ast.literal_eval(value)
+                elif not (isinstance(value, ast.Constant) and isinstance(value.value, str)):
+                    return None
+                elif target.id == "EXAMPLES":
+                    data[DOC_VARIABLES[target.id]] = value.value
+                else:
+                    data[DOC_VARIABLES[target.id]] = yaml.load(value.value, Loader=SafeLoader)
+    except Exception:  # noqa: BLE001
+        return None
+
+    doc, returndocs = data["doc"], data["returndocs"]
+    if doc and (not isinstance(doc, dict) or "extends_documentation_fragment" in doc):
+        return None
+    if returndocs and not isinstance(returndocs, dict):
+        return None
+    if not ansible_version.startswith("2.9"):
+        # pylint: disable=import-outside-toplevel
+        from ansible.utils.plugin_docs import add_collection_to_versions_and_dates
+
+        if doc:
+            add_collection_to_versions_and_dates(doc, collection_name, is_module=False)
+        if returndocs:
+            add_collection_to_versions_and_dates(
+                returndocs,
+                collection_name,
+                is_module=False,
+                return_docs=True,
+            )
+    return doc, data["plainexamples"], returndocs, data["metadata"]
+
+
+def get_doc_loader(plugin_path: Path, collection_name: str) -> tuple[Any, Any, Any, Any]:
+    """Get the documentation from a plugin using the ansible plugin loader.
+
+    :param plugin_path: The path to the plugin
+    :param collection_name: The name of the collection
+    :returns: The documentation, examples, returndocs, and metadata
     """
     # pylint: disable=import-outside-toplevel
-    # pylint: disable=too-many-locals
 
     # load the fragment_loader _after_ the path is set
     from ansible.plugins.loader import fragment_loader
 
-    while True:
-        entry = pending_queue.get()
-        if entry is None:
-            break
-        collection_name, checksum, plugin_path = entry
+    if ansible_version.startswith("2.9"):
+        return get_docstring(  # type: ignore[no-any-return]
+            filename=str(plugin_path),
+            fragment_loader=fragment_loader,
+        )
+    return get_docstring(  # type: ignore[no-any-return]
+        filename=str(plugin_path),
+        fragment_loader=fragment_loader,
+        collection_name=collection_name,
+    )
+
 
-        try:
-            if ansible_version.startswith("2.9"):
-                (doc, examples, returndocs, metadata) = get_docstring(
-                    filename=str(plugin_path),
-                    fragment_loader=fragment_loader,
-                )
-            else:
-                (doc, examples, returndocs, metadata) = get_docstring(
-                    filename=str(plugin_path),
-                    fragment_loader=fragment_loader,
-                    collection_name=collection_name,
-                )
+def extract_doc(entry: tuple[str, str, Path]) -> tuple[str, tuple[Any, ...]]:
+    """Extract the documentation from a plugin.
+
+    The documentation is parsed from the plugin when it does not extend a doc fragment, and
+    ``get_docstring`` is only used to resolve the fragments. The tier used is returned with
+    the documentation.
 
+    :param entry: The collection name, checksum and path of the plugin
+    :returns: A message with either the extracted documentation or an error
+    """
+    collection_name, checksum, plugin_path = entry
+
+    tier = "ast"
+    docs = get_doc_fast(plugin_path, collection_name)
+    if docs is None:
+        tier = "loader"
+        try:
+            docs = get_doc_loader(plugin_path, collection_name)
         except Exception:  # noqa: BLE001
+            tier = "fallback"
             try:
                 with plugin_path.open(mode="r", encoding="utf-8") as f:
                     content = f.read()
-                doc, examples, returndocs, metadata = get_doc_withast(content)
-                doc, examples, returndocs, metadata = (
-                    yaml.load(value, Loader=yaml.SafeLoader)
-                    for value in (doc, examples, returndocs, metadata)
+                docs = tuple(
+                    yaml.load(value, Loader=yaml.SafeLoader) for value in get_doc_withast(content)
                 )
             except Exception as exc:  # noqa: BLE001
                 err_message = f"{type(exc).__name__} (get_docstring): {exc!s}"
-                completed_queue.put(("error", (checksum, plugin_path, err_message)))
-                continue
+                return ("error", (checksum, plugin_path, err_message))
+    doc, examples, returndocs, metadata = docs
 
-        try:
-            q_message = {
-                "plugin": {
-                    "doc": doc,
-                    "examples": examples,
-                    "returndocs": returndocs,
-                    "metadata": metadata,
-                },
-                "timestamp": datetime.now(timezone.utc).isoformat(),
-            }
-            completed_queue.put(("plugin", (checksum, json.dumps(q_message, default=str))))
-        except JSONDecodeError as exc:
-            err_message = f"{type(exc).__name__} (json_decode_doc): {exc!s}"
-            completed_queue.put(("error", (checksum, plugin_path, err_message)))
+    try:
+        q_message = {
+            "plugin": {
+                "doc": doc,
+                "examples": examples,
+                "returndocs": returndocs,
+                "metadata": metadata,
+            },
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+        }
+        return ("plugin", (checksum, json.dumps(q_message, default=str), tier))
+    except JSONDecodeError as exc:
+        err_message = f"{type(exc).__name__} (json_decode_doc): {exc!s}"
+        return ("error", (checksum, plugin_path, err_message))
 
 
 def identify_missing(
@@ -470,6 +727,32 @@ def parse_args() -> tuple[argparse.Namespace, list[Path]]:
         help="path to collection cache",
         required=True,
     )
+    parser.add_argument(
+        "-s",
+        dest="shared_collection_cache_paths",
+        action="append",
+        help="path to a read-only, shared collection cache, consulted in the order given",
+        default=[],
+    )
+    parser.add_argument(
+        "--max-age",
+        dest="max_age",
+        type=int,
+        help="evict plugin docs not used for this many days, 0 to keep them",
+        default=0,
+    )
+    parser.add_argument(
+        "--max-size",
+        dest="max_size",
+        type=int,
+        help="evict the least recently used plugin docs above this many megabytes, 0 for no limit",
+        default=0,
+    )
+    parser.add_argument(
+        "--compact",
+        action="store_true",
+        help="evict plugin docs as needed and vacuum the collection cache",
+    )
     parsed_args = parser.parse_args()
 
     adjacent = vars(parsed_args).get("adjacent")
@@ -509,43 +792,211 @@ def retrieve_collections_paths() -> dict[Any, Any]:
 def retrieve_docs(
     collection_cache: KeyValueStore,
     errors: list[dict[str, str]],
-    missing: list[str],
+    missing: list[tuple[str, str, Path]],
     stats: dict[Any, Any],
 ) -> None:
-    # pylint: disable=too-many-locals
     """Extract the docs from the plugins.
 
+    The plugins are sent to a pool of worker processes in chunks and each result is
+    written to the cache as soon as it is received. The cache is committed every
+    ``COMMIT_BATCH`` results, so the docs extracted before an interruption are kept.
+
     :param collection_cache: The key value interface to a sqlite database
     :param errors: Previous errors encountered
     :param missing: Plugins missing from the collection cache
     :param stats: Statistics related to the collection cataloging process
     """
-    pending_queue = multiprocessing.Manager().Queue()
-    completed_queue = multiprocessing.Manager().Queue()
-    processes = []
-    for _proc in range(PROCESSES):
-        proc = multiprocessing.Process(target=worker, args=(pending_queue, completed_queue))
-        processes.append(proc)
-        proc.start()
-
-    for entry in missing:
-        pending_queue.put(entry)
-    for _proc in range(PROCESSES):
-        pending_queue.put(None)
-    for proc in processes:
-        proc.join()
-
-    while not completed_queue.empty():
-        message_type, message = completed_queue.get()
-        if message_type == "plugin":
-            checksum, plugin = message
-            collection_cache[checksum] = plugin
-            stats["cache_added_success"] += 1
-        elif message_type == "error":
-            checksum, plugin_path, error = message
-            collection_cache[checksum] = json.dumps({"error": error})
-            errors.append({"path": str(plugin_path), "error": error})
-            stats["cache_added_errors"] += 1
+    chunk_size = max(1, min(CHUNK_SIZE, len(missing) // (PROCESSES * 4)))
+    uncommitted = 0
+    try:
+        with multiprocessing.Pool(processes=min(PROCESSES, len(missing))) as pool:
+            for message_type, message in pool.imap_unordered(
+                extract_doc,
+                missing,
+                chunksize=chunk_size,
+            ):
+                if message_type == "plugin":
+                    checksum, plugin, tier = message
+                    collection_cache[checksum] = plugin
+                    stats["cache_added_success"] += 1
+                    stats[f"docs_from_{tier}"] += 1
+                elif message_type == "error":
+                    checksum, plugin_path, error = message
+                    collection_cache[checksum] = json.dumps({"error": error})
+                    errors.append({"path": str(plugin_path), "error": error})
+                    stats["cache_added_errors"] += 1
+                uncommitted += 1
+                if uncommitted >= COMMIT_BATCH:
+                    collection_cache.conn.commit()
+                    uncommitted = 0
+    finally:
+        collection_cache.conn.commit()
+
+
+def plugin_summary(plugin_json: str, plugin_type: str) -> tuple[Any, ...]:
+    """Summarize the documentation of a plugin for the collection content menu.
+
+    :param plugin_json: The documentation of the plugin from the collection doc cache
+    :param plugin_type: The type of the plugin
+    :returns: Whether the plugin is documented, it's short name, short description,
+        version added and whether it is deprecated
+    """
+    try:
+        doc = json.loads(plugin_json)["plugin"]["doc"]
+    except (JSONDecodeError, KeyError, TypeError):
+        doc = None
+    if not isinstance(doc, dict):
+        return (False, None, None, None, False)
+    name = doc["name"] if "name" in doc else doc.get(plugin_type)
+    name, short_description, version_added = (
+        None if value is None else str(value)
+        for value in (name, doc.get("short_description"), doc.get("version_added"))
+    )
+    return (True, name, short_description, version_added, bool(doc.get("deprecated")))
+
+
+def summarize_plugins(
+    collection_cache: KeyValueStore,
+    collections: dict[Any, Any],
+    stats: dict[Any, Any],
+) -> None:
+    """Store a summary of each cached plugin doc not yet summarized.
+
+    The summaries are kept in the ``plugin_summaries`` table of the collection doc cache, so the
+    collection content menu can be built without loading the documentation of every plugin.
+
+    :param collection_cache: The key value interface to a sqlite database
+    :param collections: All plugins found across all collections
+    :param stats: Statistics related to the collection cataloging process
+    """
+    conn = collection_cache.conn
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS plugin_summaries"
+        " (checksum text, type text, documented integer, name text, short_description text,"
+        " version_added text, deprecated integer, PRIMARY KEY (checksum, type))",
+    )
+    known = set(conn.execute("SELECT checksum, type FROM plugin_summaries"))
+    pending = {
+        (checksum, details["type"])
+        for collection in collections.values()
+        for checksum, details in collection["plugin_checksums"].items()
+    } - known
+    plugin_jsons = collection_cache.get_many(checksum for checksum, _type in pending)
+    rows = [
+        (checksum, plugin_type, *plugin_summary(plugin_jsons[checksum], plugin_type))
+        for checksum, plugin_type in pending
+        if checksum in plugin_jsons
+    ]
+    with conn:
+        conn.executemany(
+            "REPLACE INTO plugin_summaries (checksum, type, documented, name, short_description,"
+            " version_added, deprecated) VALUES (?, ?, ?, ?, ?, ?, ?)",
+            rows,
+        )
+    stats["summaries_added"] = len(rows)
+
+
+def evict_docs(
+    collection_cache: KeyValueStore,
+    in_use: set[str],
+    added: list[str],
+    *,
+    max_age: int,
+    max_size: int,
+    compact: bool,
+    stats: dict[Any, Any],
+) -> None:
+    """Evict plugin docs from the cache that have not been used recently.
+
+    The last access of each cached plugin doc is kept in the ``doc_access`` table, updated at
+    most once every ``ACCESS_RESOLUTION`` seconds. Plugin docs not in use are evicted once they
+    are older than the maximum age, then the least recently used are evicted until the cache
+    is within the maximum size. The cache is vacuumed when too much of it is free pages, or
+    when compaction is requested, which also removes the checksums of files that no longer
+    exist.
+
+    :param collection_cache: The key value interface to a sqlite database
+    :param in_use: The checksums of the plugins found across all collections
+    :param added: The checksums of plugin docs added to the cache during this run
+    :param max_age: The days a plugin doc not in use is kept, 0 to keep it indefinitely
+    :param max_size: The megabytes the cache is kept within, 0 for no limit
+    :param compact: Whether to vacuum the cache, whatever it's free pages
+    :param stats: Statistics related to the collection cataloging process
+    """
+    conn = collection_cache.conn
+    now = int(time.time())
+    tables = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type='table'")}
+    with conn:
+        if "doc_access" not in tables:
+            conn.execute("CREATE TABLE doc_access (checksum text primary key, accessed integer)")
+            conn.execute(
+                "INSERT INTO doc_access (checksum, accessed)"
+                " SELECT key, ? FROM kv WHERE key != 'version'",
+                (now,),
+            )
+        conn.executemany(
+            "INSERT OR IGNORE INTO doc_access (checksum, accessed) VALUES (?, ?)",
+            ((checksum, now) for checksum in added),
+        )
+        conn.executemany(
+            "UPDATE doc_access SET accessed = ? WHERE checksum = ? AND accessed < ?",
+            ((now, checksum, now - ACCESS_RESOLUTION) for checksum in in_use),
+        )
+
+    evicted: set[str] = set()
+    if max_age:
+        cutoff = now - max_age * 86_400
+        rows = conn.execute("SELECT checksum FROM doc_access WHERE accessed < ?", (cutoff,))
+        evicted.update(checksum for (checksum,) in rows if checksum not in in_use)
+    if max_size:
+        page_size = conn.execute("PRAGMA page_size").fetchone()[0]
+        page_count = conn.execute("PRAGMA page_count").fetchone()[0]
+        free_count = conn.execute("PRAGMA freelist_count").fetchone()[0]
+        excess = (page_count - free_count) * page_size - max_size * 1024 * 1024
+        cursor = conn.cursor()
+        rows = cursor.execute(
+            "SELECT checksum, LENGTH(CAST(value AS BLOB)) FROM doc_access"
+            " JOIN kv ON kv.key = doc_access.checksum ORDER BY accessed",
+        )
+        for checksum, length in rows:
+            if excess <= 0:
+                break
+            if checksum in in_use or checksum in evicted:
+                continue
+            evicted.add(checksum)
+            excess -= length
+        cursor.close()
+
+    if evicted:
+        collection_cache.delete_many(evicted)
+        with conn:
+            for table in ("doc_access", "plugin_summaries"):
+                conn.executemany(
+                    f"DELETE FROM {table} WHERE checksum = ?",  # noqa: S608
+                    ((checksum,) for checksum in evicted),
+                )
+            # Stored catalogs may list plugins whose docs were evicted
+            if "collection_catalogs" in tables:
+                conn.execute("DELETE FROM collection_catalogs")
+    stats["docs_evicted"] = len(evicted)
+
+    if compact:
+        with conn:
+            conn.execute("DELETE FROM doc_access WHERE checksum NOT IN (SELECT key FROM kv)")
+            if "file_checksums" in tables:
+                paths = [row[0] for row in conn.execute("SELECT path FROM file_checksums")]
+                conn.executemany(
+                    "DELETE FROM file_checksums WHERE path = ?",
+                    ((path,) for path in paths if not Path(path).exists()),
+                )
+    page_count = conn.execute("PRAGMA page_count").fetchone()[0]
+    free_count = conn.execute("PRAGMA freelist_count").fetchone()[0]
+    vacuum = compact or free_count > page_count * VACUUM_FREE_RATIO
+    if vacuum:
+        conn.commit()
+        conn.execute("VACUUM")
+        conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+    stats["cache_vacuumed"] = bool(vacuum)
 
 
 def get_doc_withast(content: Any) -> tuple[Any, Any, Any, Any]:
@@ -603,13 +1054,22 @@ def main() -> dict[Any, Any]:
     stats = {}
     stats["cache_added_success"] = 0
     stats["cache_added_errors"] = 0
+    for tier in DOC_TIERS:
+        stats[f"docs_from_{tier}"] = 0
 
-    cc_obj = CollectionCatalog(directories=parent_directories)
+    collection_cache_path = Path(args.collection_cache_path).resolve().expanduser()
+    shared_caches = [
+        KeyValueStore(Path(shared_path).resolve().expanduser(), read_only=True)
+        for shared_path in args.shared_collection_cache_paths
+    ]
+    collection_cache = KeyValueStore(collection_cache_path, layers=shared_caches)
+    checksum_cache = ChecksumCache(collection_cache.conn)
+
+    cc_obj = CollectionCatalog(directories=parent_directories, checksum_cache=checksum_cache)
     collections, errors = cc_obj.process_directories()
+    checksum_cache.save(roots=collections)
     stats["collection_count"] = len(collections)
-
-    collection_cache_path = Path(args.collection_cache_path).resolve().expanduser()
-    collection_cache = KeyValueStore(collection_cache_path)
+    stats["checksums_reused"] = checksum_cache.reused
 
     handled, missing, plugin_count = identify_missing(collections, collection_cache)
     stats["plugin_count"] = plugin_count
@@ -618,13 +1078,25 @@ def main() -> dict[Any, Any]:
 
     if missing:
         retrieve_docs(collection_cache, errors, missing, stats)
+    summarize_plugins(collection_cache, collections, stats)
+
+    missing_checksums = [checksum for _name, checksum, _path in missing]
+    still_missing = {checksum for checksum in missing_checksums if checksum not in collection_cache}
+    evict_docs(
+        collection_cache,
+        handled,
+        [checksum for checksum in missing_checksums if checksum not in still_missing],
+        max_age=args.max_age,
+        max_size=args.max_size,
+        compact=args.compact,
+        stats=stats,
+    )
+    stats["cache_length"] = len(collection_cache)
 
-    cached_checksums = collection_cache.keys()
-    stats["cache_length"] = len(collection_cache.keys())
-
-    for collection in collections.values():
-        for no_doc in set(collection["plugin_checksums"].keys()) - set(cached_checksums):
-            del collection["plugin_checksums"][no_doc]
+    if still_missing:
+        for collection in collections.values():
+            for no_doc in still_missing.intersection(collection["plugin_checksums"]):
+                del collection["plugin_checksums"][no_doc]
 
     collection_cache.close()
     return {
@@ -5,11 +5,15 @@ from __future__ import annotations
 import json
 import os
 import re
+import shlex
 import subprocess
 import sys
-import threading
+import time
 
-from queue import Queue
+from concurrent.futures import FIRST_COMPLETED
+from concurrent.futures import Future
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import wait
 from types import SimpleNamespace
 from typing import TYPE_CHECKING
 from typing import Any
@@ -22,6 +26,43 @@ if TYPE_CHECKING:
 # https://github.com/python/typing/issues/182#issuecomment-1320974824
 JSONTypes: TypeAlias = dict[str, "JSONTypes"] | list["JSONTypes"] | str | int | float | bool | None
 
+#: The most commands run at the same time, most are python processes competing for the CPU
+MAX_WORKERS = 4
+
+#: Separates the fields of a package in the rpm query output
+RPM_FIELD_SEPARATOR = "\x1f"
+#: Ends each package in the rpm query output
+RPM_PACKAGE_SEPARATOR = "\x1e"
+#: The fields shown by ``rpm -qi``, with their query format and whether they are always shown,
+#: the description follows them
+RPM_FIELDS = (
+    ("name", "%{NAME}", True),
+    ("epoch", "%|EPOCH?{%{EPOCH}}|", False),
+    ("version", "%{VERSION}", True),
+    ("release", "%{RELEASE}", True),
+    ("architecture", "%{ARCH}", True),
+    ("install date", "%|INSTALLTIME?{%{INSTALLTIME:date}}:{(not installed)}|", True),
+    ("group", "%{GROUP}", True),
+    ("size", "%{LONGSIZE}", True),
+    ("license", "%{LICENSE}", True),
+    (
+        "signature",
+        (
+            "%|DSAHEADER?{%{DSAHEADER:pgpsig}}:{%|RSAHEADER?{%{RSAHEADER:pgpsig}}"
+            ":{%|SIGGPG?{%{SIGGPG:pgpsig}}:{%|SIGPGP?{%{SIGPGP:pgpsig}}:{(none)}|}|}|}|"
+        ),
+        True,
+    ),
+    ("source rpm", "%{SOURCERPM}", True),
+    ("build date", "%{BUILDTIME:date}", True),
+    ("build host", "%{BUILDHOST}", True),
+    ("packager", "%|PACKAGER?{%{PACKAGER}}|", False),
+    ("vendor", "%|VENDOR?{%{VENDOR}}|", False),
+    ("url", "%|URL?{%{URL}}|", False),
+    ("bug url", "%|BUGURL?{%{BUGURL}}|", False),
+    ("summary", "%{SUMMARY}", True),
+)
+
 
 class Command(SimpleNamespace):
     """Abstraction for a details about a shell command."""
@@ -29,6 +70,9 @@ class Command(SimpleNamespace):
     id_: str
     command: str
     parse: Callable[..., Any]
+    prepare: Callable[[Command, dict[str, Command]], None] | None = None
+    requires: tuple[str, ...] = ()
+    duration: float = 0.0
     stdout: str = ""
     stderr: str = ""
     details: list[str] | dict[Any, Any] | list[dict[Any, Any]] | str = ""
@@ -40,6 +84,9 @@ def run_command(command: Command) -> None:
 
     :param command: Details of the command to run
     """
+    if not command.command:
+        # The details are collected in process when parsed
+        return
     try:
         proc_out = subprocess.run(
             command.command,
@@ -54,80 +101,79 @@ def run_command(command: Command) -> None:
         command.errors = [str(exc.stderr)]
 
 
-def worker(pending_queue: Queue[Any], completed_queue: Queue[Any]) -> None:
-    """Run a command from pending, parse, and place in completed.
+def execute(command: Command, prerequisites: dict[str, Command]) -> Command:
+    """Prepare, run and parse a command, timing it.
 
-    :param pending_queue: A queue with plugins to process
-    :param completed_queue: The queue in which extracted documentation will be placed
+    :param command: Details of the command to run
+    :param prerequisites: The completed commands this command requires, by ID
+    :returns: The command, with its results
     """
-    while True:
-        command = pending_queue.get()
-        if command is None:
-            break
+    started = time.perf_counter()
+    try:
+        if command.prepare is not None:
+            command.prepare(command, prerequisites)
         run_command(command)
-        try:
-            command.parse(command)
-        except Exception as exc:  # noqa: BLE001
-            command.errors = command.errors + [str(exc)]
-        completed_queue.put(command)
+        command.parse(command)
+    except Exception as exc:  # noqa: BLE001
+        command.errors = command.errors + [str(exc)]
+    command.duration = round(time.perf_counter() - started, 3)
+    return command
 
 
 class CommandRunner:
     """A command runner.
 
-    Run commands using single or multiple processes.
+    Run commands in a bounded pool of threads, each once the commands it requires are complete.
     """
 
-    def __init__(self) -> None:
-        """Initialize the command runner."""
-        self._completed_queue: Queue[Any] | None = None
-        self._pending_queue: Queue[Any] | None = None
+    def __init__(self, max_workers: int = MAX_WORKERS) -> None:
+        """Initialize the command runner.
 
-    def run_multi_thread(self, command_classes: list[CmdParser]) -> list[CmdParser]:
-        """Run commands with multiple threads.
+        :param max_workers: The most commands run at the same time
+        """
+        self._max_workers = max_workers
 
-        Workers are started to read from pending queue.
-        Exit when the number of results is equal to the number
-        of commands needing to be run.
+    def run_multi_thread(self, command_classes: list[CmdParser]) -> list[Command]:
+        """Run the commands of all command classes with multiple threads.
 
         :param command_classes: All command classes to be run
         :returns: The results from running all commands
         """
-        if self._completed_queue is None:
-            self._completed_queue = Queue()
-        if self._pending_queue is None:
-            self._pending_queue = Queue()
-        all_commands = tuple(
-            command for command_class in command_classes for command in command_class.commands
+        return self.run(
+            [command for command_class in command_classes for command in command_class.commands],
         )
-        self.start_workers(all_commands)
-        results: list[CmdParser] = []
-        while len(results) != len(all_commands):
-            results.append(self._completed_queue.get())
-        return results
 
-    def start_workers(self, jobs: tuple[Command, ...]) -> None:
-        """Start workers and submit jobs to pending queue.
+    def run(self, commands: list[Command]) -> list[Command]:
+        """Run commands, starting each as soon as the commands it requires are complete.
+
+        A command requiring one which is not being run, or which is part of a cycle, is not run.
 
-        :param jobs: The jobs to be run
+        :param commands: The commands to be run
+        :returns: The results from running the commands, in the order completed
         """
-        worker_count = len(jobs)
-        processes = []
-        for _proc in range(worker_count):
-            proc = threading.Thread(
-                target=worker,
-                args=(self._pending_queue, self._completed_queue),
-            )
-            processes.append(proc)
-            proc.start()
-        if not self._pending_queue:
-            raise RuntimeError
-        for job in jobs:
-            self._pending_queue.put(job)
-        for _proc in range(worker_count):
-            self._pending_queue.put(None)
-        for proc in processes:
-            proc.join()
+        pending = list(commands)
+        completed: dict[str, Command] = {}
+        results: list[Command] = []
+        running: dict[Future[Command], Command] = {}
+        with ThreadPoolExecutor(max_workers=max(1, self._max_workers)) as executor:
+            while pending or running:
+                ready = [cmd for cmd in pending if set(cmd.requires) <= completed.keys()]
+                pending = [cmd for cmd in pending if not set(cmd.requires) <= completed.keys()]
+                for command in ready:
+                    prerequisites = {id_: completed[id_] for id_ in command.requires}
+                    running[executor.submit(execute, command, prerequisites)] = command
+                if not running:
+                    break
+                done, _not_done = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    command = running.pop(future)
+                    completed[command.id_] = command
+                    results.append(command)
+        for command in pending:
+            missing = ", ".join(sorted(set(command.requires) - completed.keys()))
+            command.errors = [*command.errors, f"Required commands did not run: {missing}"]
+            results.append(command)
+        return results
 
 
 class CmdParser:
@@ -138,6 +184,21 @@ class CmdParser:
         """List of commands to be executed."""
         return []
 
+    @staticmethod
+    def fall_back(command: Command, fallbacks: list[Command]) -> None:
+        """Use the result of other commands, when the faster way of collecting details fails.
+
+        :param command: The command which failed
+        :param fallbacks: The commands to run instead, one with the same ID providing the result
+        """
+        results = CommandRunner().run(fallbacks)
+        fallback = next(result for result in results if result.id_ == command.id_)
+        command.command = fallback.command
+        command.stdout = fallback.stdout
+        command.stderr = fallback.stderr
+        command.details = fallback.details
+        command.errors = fallback.errors
+
     @staticmethod
     def _strip(value: str) -> str:
         """Remove quotes, leading and trailing whitespace.
@@ -292,26 +353,43 @@ class PythonPackages(CmdParser):
 
     @property
     def commands(self) -> list[Command]:
-        """Define the pip command to list installed pip packages.
+        """Define the collection of installed python packages, from their metadata.
 
         :returns: The defined command
         """
-        pre = Command(
-            id_="pip_freeze",
-            command="/usr/bin/python3 -m pip freeze",
-            parse=self.parse_freeze,
-        )
-        run_command(pre)
-        pre.parse(pre)
-        pkgs = " ".join(pkg for pkg in pre.details[0]) if pre.details else ""
+        return [Command(id_="python_packages", command="", parse=self.parse_metadata)]
+
+    def pip_commands(self) -> list[Command]:
+        """Define the pip commands to list installed pip packages.
+
+        :returns: The defined commands, showing the packages once they have been listed
+        """
         return [
+            Command(
+                id_="pip_freeze",
+                command="/usr/bin/python3 -m pip freeze",
+                parse=self.parse_freeze,
+            ),
             Command(
                 id_="python_packages",
-                command=f"/usr/bin/python3 -m pip show {pkgs}",
+                command="",
                 parse=self.parse,
+                prepare=self.prepare_show,
+                requires=("pip_freeze",),
             ),
         ]
 
+    @staticmethod
+    def prepare_show(command: Command, prerequisites: dict[str, Command]) -> None:
+        """Show the packages listed by pip freeze.
+
+        :param command: The pip show command
+        :param prerequisites: The completed pip freeze command
+        """
+        freeze = prerequisites["pip_freeze"]
+        pkgs = " ".join(pkg for pkg in freeze.details[0]) if freeze.details else ""
+        command.command = f"/usr/bin/python3 -m pip show {pkgs}"
+
     def parse(self, command: Command) -> None:
         """Parse the output of the pip command.
 
@@ -337,6 +415,108 @@ class PythonPackages(CmdParser):
         parsed = self.splitter(lines, "(==|@)")
         command.details = parsed
 
+    def parse_metadata(self, command: Command) -> None:
+        """Collect the installed python packages from their metadata, falling back to pip.
+
+        :param command: The command to collect the details for
+        """
+        try:
+            command.details = self.distributions()
+        except Exception:  # noqa: BLE001
+            self.fall_back(command, self.pip_commands())
+
+    def distributions(self) -> list[dict[str, Any]]:
+        """Describe the installed python packages, as ``pip freeze`` and ``pip show`` would.
+
+        :returns: The details of each package
+        """
+        # pylint: disable=import-outside-toplevel
+        from importlib.metadata import distributions
+
+        try:
+            from packaging.requirements import Requirement
+        except ImportError:
+            from pip._vendor.packaging.requirements import Requirement  # type: ignore[assignment]
+
+        installed: dict[str, Any] = {}
+        for dist in distributions():
+            name = dist.metadata["Name"]
+            if name and self._canonical(name) not in installed:
+                installed[self._canonical(name)] = dist
+
+        requires: dict[str, list[str]] = {canonical: [] for canonical in installed}
+        required_by: dict[str, set[str]] = {canonical: set() for canonical in installed}
+        for canonical, dist in installed.items():
+            for req_string in dist.requires or []:
+                req = Requirement(req_string)
+                if req.marker and not req.marker.evaluate({"extra": ""}):
+                    continue
+                requires[canonical].append(req.name)
+                required_by.setdefault(self._canonical(req.name), set()).add(dist.metadata["Name"])
+
+        # Like pip freeze, skip packaging tools and editable installs
+        skip = {"pip"}
+        if sys.version_info < (3, 12):
+            skip.update(("setuptools", "distribute", "wheel"))
+        details = []
+        for canonical in sorted(
+            installed,
+            key=lambda name: installed[name].metadata["Name"].lower(),
+        ):
+            dist = installed[canonical]
+            if canonical in skip or self._editable(dist):
+                continue
+            metadata = dist.metadata
+            details.append(
+                {
+                    "name": self._field(metadata["Name"]),
+                    "version": self._field(metadata["Version"]),
+                    "summary": self._field(metadata["Summary"]),
+                    "home-page": self._field(metadata["Home-page"]),
+                    "author": self._field(metadata["Author"]),
+                    "author-email": self._field(metadata["Author-email"]),
+                    "license": self._field(metadata["License"]),
+                    "location": str(dist.locate_file("")),
+                    "requires": sorted(requires[canonical], key=str.lower),
+                    "required-by": sorted(required_by[canonical], key=str.lower),
+                },
+            )
+        return details
+
+    @staticmethod
+    def _canonical(name: str) -> str:
+        """Normalize a python package name, so differently written names are the same.
+
+        :param name: The name of the package
+        :returns: The normalized name
+        """
+        return re.sub(r"[-_.]+", "-", name).lower()
+
+    @staticmethod
+    def _editable(dist: Any) -> bool:
+        """Determine if a python package is an editable install.
+
+        :param dist: The distribution of the package
+        :returns: True if the package is installed in editable mode
+        """
+        direct_url = dist.read_text("direct_url.json")
+        if not direct_url:
+            return False
+        try:
+            return bool(json.loads(direct_url).get("dir_info", {}).get("editable"))
+        except (ValueError, AttributeError):
+            return False
+
+    def _field(self, value: str | None) -> str:
+        """Format a metadata field, as ``pip show`` output would be parsed.
+
+        :param value: The value of the metadata field
+        :returns: The value, with continuation lines joined
+        """
+        first, *continued = (value or "").splitlines() or [""]
+        # pip shows the first line after the field name and a space, so only trailing quotes go
+        return " ".join([self._strip(f" {first}"), *(self._strip(line) for line in continued)])
+
 
 class RedhatRelease(CmdParser):
     """Red Hat release collector."""
@@ -364,7 +544,24 @@ class SystemPackages(CmdParser):
 
     @property
     def commands(self) -> list[Command]:
-        """Define the command to list system packages.
+        """Define the command to list system packages, in a format split in one pass.
+
+        :returns: The defined command
+        """
+        query_format = RPM_FIELD_SEPARATOR.join(
+            [*(field_format for _key, field_format, _shown in RPM_FIELDS), "%{DESCRIPTION}"],
+        )
+        query_format += RPM_PACKAGE_SEPARATOR
+        return [
+            Command(
+                id_="system_packages",
+                command=f"rpm -qa --queryformat {shlex.quote(query_format)}",
+                parse=self.parse_query_format,
+            ),
+        ]
+
+    def info_commands(self) -> list[Command]:
+        """Define the command to list system packages with their information.
 
         :returns: The defined command
         """
@@ -393,6 +590,32 @@ class SystemPackages(CmdParser):
 
         command.details = parsed
 
+    def parse_query_format(self, command: Command) -> None:
+        """Parse the output of the rpm query, falling back to ``rpm -qai``.
+
+        :param command: The result of running the command
+        """
+        parsed: list[dict[str, str]] = []
+        for package in command.stdout.split(RPM_PACKAGE_SEPARATOR):
+            if not package.strip():
+                continue
+            *values, description = package.split(RPM_FIELD_SEPARATOR)
+            if len(values) != len(RPM_FIELDS):
+                parsed = []
+                break
+            result = {
+                key: self._strip(value)
+                for (key, _field_format, shown), value in zip(RPM_FIELDS, values, strict=True)
+                if shown or value
+            }
+            lines = description.splitlines()
+            result["description"] = " ".join(lines) if lines else "No description available"
+            parsed.append(result)
+        if command.errors or not parsed:
+            self.fall_back(command, self.info_commands())
+            return
+        command.details = parsed
+
 
 def main(serialize: bool = True) -> dict[str, JSONTypes] | None:
     """Enter the image introspection process.
@@ -417,6 +640,7 @@ def main(serialize: bool = True) -> dict[str, JSONTypes] | None:
         for result in results:
             result_as_dict = vars(result)
             result_as_dict.pop("parse")
+            result_as_dict.pop("prepare", None)
             for key in list(result_as_dict.keys()):
                 if key not in ["details", "errors"]:
                     result_as_dict[f"__{key}"] = result_as_dict[key]
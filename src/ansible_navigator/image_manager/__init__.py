@@ -1,10 +1,16 @@
 """Image manager."""
 
 from .inspector import inspect_all
+from .introspection_cache import IntrospectionCache
+from .introspection_cache import inspect_image_id
+from .presence_cache import PresenceCache
 from .puller import ImagePuller
 
 
 __all__ = (
     "ImagePuller",
+    "IntrospectionCache",
+    "PresenceCache",
     "inspect_all",
+    "inspect_image_id",
 )
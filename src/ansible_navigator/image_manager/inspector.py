@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import json
-import re
+import shlex
 
 from collections.abc import Iterable
 from typing import Any
@@ -13,6 +13,13 @@ from ansible_navigator.command_runner import CommandRunner
 from ansible_navigator.utils.functions import pascal_to_snake
 
 
+#: A template for the image listing of both docker and podman, one json object for each image
+LIST_FORMAT = (
+    '{"repository":{{json .Repository}},"tag":{{json .Tag}},"image_id":{{json .ID}},'
+    '"created":{{json .CreatedSince}},"size":{{json .Size}}}'
+)
+
+
 class ImagesInspect:
     """Functionality for inspecting container images."""
 
@@ -27,28 +34,48 @@ class ImagesInspect:
 
     @property
     def commands(self) -> list[Command]:
-        """Generate image inspection commands.
+        """Generate the image inspection command, inspecting all the images at once.
 
         :returns: List of image inspection command objects
         """
         return [
             Command(
-                identity=image_id,
-                command=f"{self._container_engine} inspect {image_id}",
+                identity="inspect",
+                command=f"{self._container_engine} image inspect {shlex.join(self._image_ids)}",
                 post_process=self.parse,
-            )
-            for image_id in self._image_ids
+            ),
         ]
 
-    @staticmethod
-    def parse(command: Command) -> None:
+    def parse(self, command: Command) -> None:
         """Parse the image inspection command output.
 
+        The details are those of each image inspected, by image id. An image missing from the
+        output could not be inspected. When some images can not be inspected, the command fails
+        but the output may still include the others.
+
         :param command: Image inspection command object
         """
-        obj = json.loads(command.stdout)
-        snake = pascal_to_snake(obj[0])
-        command.details = snake
+        command.details = {}
+        if command.return_code:
+            command.errors = command.stderr
+        try:
+            inspections = json.loads(command.stdout)
+        except json.JSONDecodeError as exc:
+            if not command.return_code:
+                command.errors = str(exc)
+            return
+        if not isinstance(inspections, list):
+            return
+        # The listed image ids are a prefix of the full id of each image inspected
+        image_ids = set(self._image_ids)
+        lengths = {len(image_id) for image_id in image_ids}
+        details = {}
+        for inspection in inspections:
+            full_id = str(inspection.get("Id", "")).removeprefix("sha256:")
+            for length in lengths:
+                if full_id[:length] in image_ids:
+                    details[full_id[:length]] = pascal_to_snake(inspection)
+        command.details = details
 
 
 class ImagesList:
@@ -70,7 +97,7 @@ class ImagesList:
         return [
             Command(
                 identity="images",
-                command=f"{self._container_engine} images",
+                command=f"{self._container_engine} images --format {shlex.quote(LIST_FORMAT)}",
                 post_process=self.parse,
             ),
         ]
@@ -82,12 +109,11 @@ class ImagesList:
         :param command: Image lister command object
         """
         if command.stdout:
-            images = command.stdout.splitlines()
-            re_2omo = re.compile(r"\s{2,}")
-            headers = [key.lower().replace(" ", "_") for key in re_2omo.split(images.pop(0))]
-            local_images = [
-                dict(zip(headers, re_2omo.split(line), strict=False)) for line in images
-            ]
+            try:
+                local_images = [json.loads(line) for line in command.stdout_lines if line.strip()]
+            except json.JSONDecodeError as exc:
+                command.errors = f"Unable to parse the image list: {exc!s}"
+                return
             valid_images = [image for image in local_images if image["tag"] != "<none>"]
             command.details = valid_images
 
@@ -95,6 +121,10 @@ class ImagesList:
 def inspect_all(container_engine: str) -> tuple[list[dict[str, Any]], str]:
     """Run inspect against all images in the list.
 
+    The images are inspected with a single command. If an image was removed since being listed,
+    the images are listed again and those still present but not yet inspected are inspected
+    again with a single command.
+
     :param container_engine: Name of the container engine
     :returns: List of all image values and stderr, if applicable
     """
@@ -109,9 +139,25 @@ def inspect_all(container_engine: str) -> tuple[list[dict[str, Any]], str]:
     if not isinstance(images_list.details, Iterable):
         raise TypeError
     images = {image["image_id"]: image for image in images_list.details}
-    image_ids = [image["image_id"] for image in images.values()]
-    images_inspect_class = ImagesInspect(container_engine=container_engine, ids=image_ids)
-    inspects = cmd_runner.run_single_process(commands=images_inspect_class.commands)
-    for inspect in inspects:
-        images[inspect.identity]["inspect"] = {"details": inspect.details, "errors": inspect.errors}
+    if not images:
+        return [], images_list.stderr
+    images_inspect_class = ImagesInspect(container_engine=container_engine, ids=list(images))
+    inspected = cmd_runner.run_single_process(commands=images_inspect_class.commands)[0]
+    details = dict(inspected.details) if isinstance(inspected.details, dict) else {}
+    errors = {image_id: inspected.errors for image_id in images if image_id not in details}
+    if errors:
+        relisted = cmd_runner.run_single_process(commands=images_list_class.commands)[0]
+        present = relisted.details if isinstance(relisted.details, list) else []
+        retry_ids = [image["image_id"] for image in present if image["image_id"] in errors]
+        if retry_ids:
+            retry_class = ImagesInspect(container_engine=container_engine, ids=retry_ids)
+            retried = cmd_runner.run_single_process(commands=retry_class.commands)[0]
+            if isinstance(retried.details, dict):
+                details.update(retried.details)
+            errors.update(dict.fromkeys(retry_ids, retried.errors))
+    for image_id, image in images.items():
+        image["inspect"] = {
+            "details": details.get(image_id),
+            "errors": "" if image_id in details else errors.get(image_id, ""),
+        }
     return list(images.values()), images_list.stderr
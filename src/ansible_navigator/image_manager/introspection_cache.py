@@ -0,0 +1,125 @@
+"""Image introspection results stored on disk.
+
+An image with a given ID never changes, so the result of introspecting it is stored using the
+container engine and ID and reused, rather than starting a container to introspect the image
+again. The results are discarded when the application version changes, since the introspection
+script may have too.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+import subprocess
+
+from typing import TYPE_CHECKING
+
+from ansible_navigator.utils.key_value_store import KeyValueStore
+from ansible_navigator.version import __version__
+
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from pathlib import Path
+
+
+#: The file name of the image introspection cache, within the application cache directory
+INTROSPECTION_CACHE_FILE = "image_introspection_cache.db"
+
+
+def inspect_image_id(container_engine: str, image: str) -> str | None:
+    """Determine the ID of a local image.
+
+    :param container_engine: The name of the container engine
+    :param image: The name of the image
+    :returns: The ID of the image, or None if it could not be inspected
+    """
+    cmd_parts = [container_engine, "image", "inspect", "--format={{.Id}}", image]
+    try:
+        proc_out = subprocess.run(cmd_parts, capture_output=True, check=True, text=True)
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return proc_out.stdout.strip() or None
+
+
+class IntrospectionCache:
+    """Image introspection results, stored by container engine and image ID."""
+
+    def __init__(self, filename: str | Path) -> None:
+        """Initialize the image introspection cache.
+
+        :param filename: The full path to the image introspection cache
+        """
+        self._path = str(filename)
+
+    @staticmethod
+    def _key(container_engine: str, image_id: str) -> str:
+        """Build the key an introspection result is stored with.
+
+        :param container_engine: The name of the container engine
+        :param image_id: The ID of the image
+        :returns: The key
+        """
+        return f"{container_engine} {image_id}"
+
+    def _open(self) -> KeyValueStore:
+        """Open the image introspection cache, emptying it if from another application version.
+
+        :returns: The image introspection cache
+        """
+        store = KeyValueStore(self._path)
+        if store.get("version") != __version__:
+            store.delete_many(list(store.keys()))
+            store["version"] = __version__
+        return store
+
+    def get(self, container_engine: str, image_id: str) -> str | None:
+        """Get the introspection result for an image.
+
+        :param container_engine: The name of the container engine
+        :param image_id: The ID of the image
+        :returns: The output of the introspection script, or None if not stored or unavailable
+        """
+        try:
+            store = self._open()
+        except sqlite3.Error:
+            return None
+        try:
+            return store.get(self._key(container_engine, image_id))
+        finally:
+            store.close()
+
+    def put(self, container_engine: str, image_id: str, output: str) -> None:
+        """Store the introspection result for an image.
+
+        :param container_engine: The name of the container engine
+        :param image_id: The ID of the image
+        :param output: The output of the introspection script
+        """
+        try:
+            store = self._open()
+        except sqlite3.Error:
+            return
+        try:
+            store[self._key(container_engine, image_id)] = output
+        finally:
+            store.close()
+
+    def evict(self, container_engine: str, image_ids: Iterable[str]) -> int:
+        """Remove the introspection results for images no longer available to a container engine.
+
+        :param container_engine: The name of the container engine
+        :param image_ids: The IDs of all local images of the container engine
+        :returns: The number of introspection results removed
+        """
+        try:
+            store = self._open()
+        except sqlite3.Error:
+            return 0
+        try:
+            current = {self._key(container_engine, image_id) for image_id in image_ids}
+            prefix = self._key(container_engine, "")
+            stale = {key for key in store if key.startswith(prefix)} - current
+            store.delete_many(stale)
+        finally:
+            store.close()
+        return len(stale)
@@ -0,0 +1,109 @@
+"""Local image presence stored on disk.
+
+Checking for the execution environment image starts the container engine on every
+invocation. When an image was found locally, its ID and the time it was found are stored,
+and trusted for a configurable number of seconds instead of checking again.
+"""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+import time
+
+from pathlib import Path
+
+from ansible_navigator.utils.key_value_store import KeyValueStore
+
+
+#: The file name of the image presence cache, within the application cache directory
+PRESENCE_CACHE_FILE = "image_presence_cache.db"
+
+
+class PresenceCache:
+    """Local images found by the container engine, by engine and image name."""
+
+    def __init__(self, filename: str | Path, ttl: int) -> None:
+        """Initialize the image presence cache.
+
+        :param filename: The full path to the image presence cache
+        :param ttl: The number of seconds an image found is trusted to be present, 0 to disable
+        """
+        self._path = str(filename)
+        self._ttl = ttl
+
+    @staticmethod
+    def _key(container_engine: str, image: str) -> str:
+        """Build the key an image is stored with.
+
+        :param container_engine: The name of the container engine
+        :param image: The name of the image
+        :returns: The key
+        """
+        return f"{container_engine} {image}"
+
+    def get(self, container_engine: str, image: str) -> str | None:
+        """Get the ID of an image found recently enough.
+
+        :param container_engine: The name of the container engine
+        :param image: The name of the image
+        :returns: The ID of the image, or None if not found within the time to live
+        """
+        if self._ttl <= 0:
+            return None
+        try:
+            store = KeyValueStore(self._path)
+        except sqlite3.Error:
+            return None
+        try:
+            value = store.get(self._key(container_engine, image))
+        finally:
+            store.close()
+        if value is None:
+            return None
+        try:
+            entry = json.loads(value)
+            age = time.time() - float(entry["found"])
+            image_id = str(entry["id"])
+        except (ValueError, TypeError, KeyError):
+            return None
+        if 0 <= age < self._ttl:
+            return image_id
+        return None
+
+    def put(self, container_engine: str, image: str, image_id: str) -> None:
+        """Store an image as found now.
+
+        :param container_engine: The name of the container engine
+        :param image: The name of the image
+        :param image_id: The ID of the image
+        """
+        if self._ttl <= 0:
+            return
+        try:
+            store = KeyValueStore(self._path)
+        except sqlite3.Error:
+            return
+        try:
+            store[self._key(container_engine, image)] = json.dumps(
+                {"id": image_id, "found": time.time()},
+            )
+        finally:
+            store.close()
+
+    def discard(self, container_engine: str, image: str) -> None:
+        """Remove an image, when missing or about to be pulled.
+
+        :param container_engine: The name of the container engine
+        :param image: The name of the image
+        """
+        if not Path(self._path).exists():
+            return
+        try:
+            store = KeyValueStore(self._path)
+        except sqlite3.Error:
+            return
+        try:
+            store.delete_many([self._key(container_engine, image)])
+        finally:
+            store.close()
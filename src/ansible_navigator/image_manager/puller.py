@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import json
 import logging
 import os
 import subprocess
@@ -19,6 +20,8 @@ from ansible_navigator.utils.functions import shlex_join
 if TYPE_CHECKING:
     from ansible_navigator.configuration_subsystem import Constants
 
+    from .presence_cache import PresenceCache
+
 
 @dataclass(frozen=False)
 class ImageAssessment:
@@ -43,6 +46,7 @@ class ImagePuller:
         image: str,
         arguments: Constants | list[str],
         pull_policy: str,
+        presence_cache: PresenceCache | None = None,
     ) -> None:
         """Initialize the container image puller.
 
@@ -50,6 +54,7 @@ class ImagePuller:
         :param image: The name of the image to pull
         :param arguments: Additional arguments to be appended to the pull policy
         :param pull_policy: The current pull policy from the settings
+        :param presence_cache: Images recently found locally, trusted instead of checking again
         """
         if isinstance(arguments, list):
             self._arguments = arguments
@@ -60,10 +65,12 @@ class ImagePuller:
         self._container_engine: str = container_engine
         self._exit_messages: list[ExitMessage] = []
         self._image: str = image
+        self._image_id: str | None = None
         self._image_present: bool
         self._image_tag: str
         self._logger = logging.getLogger(__name__)
         self._messages: list[LogMessage] = []
+        self._presence_cache = presence_cache
         self._pull_policy: str = pull_policy
         self._pull_required: bool = False
 
@@ -97,20 +104,45 @@ class ImagePuller:
         """
         return self._assessment
 
+    @property
+    def _pull_policy_pulls(self) -> bool:
+        """Determine if the pull policy pulls the image whether or not it is present.
+
+        :returns: True if the image is always pulled
+        """
+        return self._pull_policy == "always" or (
+            self._pull_policy == "tag" and self._image_tag == "latest"
+        )
+
     def _check_for_image(self) -> None:
-        """Check for the image."""
+        """Check for the image, trusting the presence cache unless the image will be pulled."""
+        cache = self._presence_cache
+        if cache is not None and self._pull_policy_pulls:
+            cache.discard(self._container_engine, self._image)
+        elif cache is not None:
+            self._image_id = cache.get(self._container_engine, self._image)
+            if self._image_id is not None:
+                self._image_present = True
+                message = f"Image present as {self._image_id}, from the image presence cache"
+                self._log_message(level=logging.DEBUG, message=message)
+                return
         try:
             cmd_parts = [self._container_engine, "image", "inspect", self._image]
             self._log_message(level=logging.DEBUG, message=f"Command: {shlex_join(cmd_parts)}")
-            subprocess.run(
+            proc_out = subprocess.run(
                 cmd_parts,
                 check=True,
                 capture_output=True,
             )
             self._image_present = True
+            self._image_id = self._parse_image_id(proc_out.stdout)
+            if cache is not None and self._image_id is not None and not self._pull_policy_pulls:
+                cache.put(self._container_engine, self._image, self._image_id)
 
         except subprocess.CalledProcessError as exc:
             self._image_present = False
+            if cache is not None:
+                cache.discard(self._container_engine, self._image)
             stdout = exc.stdout.decode()
             stderr = exc.stderr.decode()
             self._log_message(level=logging.DEBUG, message=f"stdout: {stdout}")
@@ -121,6 +153,19 @@ class ImagePuller:
                 self._log_message(level=logging.WARNING, message=f"stdout: {stdout}")
                 self._log_message(level=logging.WARNING, message=f"stderr: {stderr}")
 
+    @staticmethod
+    def _parse_image_id(stdout: bytes) -> str | None:
+        """Get the ID of the image from the output of the inspect command.
+
+        :param stdout: The output of the inspect command
+        :returns: The ID of the image, or None if it could not be found
+        """
+        try:
+            image_id = json.loads(stdout)[0]["Id"]
+        except (ValueError, LookupError, TypeError):
+            return None
+        return str(image_id) if image_id else None
+
     def _determine_pull(self) -> None:
         """Determine if a pull is required."""
         if self._pull_policy == "missing" and self._image_present is False:  # noqa: SIM114
@@ -223,6 +268,9 @@ class ImagePuller:
                 env=os.environ,
             )
             self._log_message(level=logging.INFO, message="Execution environment updated")
+            if self._presence_cache is not None:
+                # The image ID changed, the next invocation checks for it again
+                self._presence_cache.discard(self._container_engine, self._image)
             self._pull_required = False
             self._assessment.pull_required = False
         except subprocess.CalledProcessError as exc:
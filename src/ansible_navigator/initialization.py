@@ -7,6 +7,7 @@ from __future__ import annotations
 
 import logging
 import os
+import sqlite3
 import sys
 
 from pathlib import Path
@@ -25,6 +26,8 @@ from .utils.functions import console_width
 from .utils.functions import environment_variable_is_file_path
 from .utils.functions import find_settings_file
 from .utils.key_value_store import KeyValueStore
+from .utils.version_migration.collection_doc_cache import CollectionDocCacheMigrationError
+from .utils.version_migration.collection_doc_cache import migrate_collection_doc_cache
 
 
 if TYPE_CHECKING:
@@ -91,14 +94,61 @@ def find_config() -> tuple[list[LogMessage], list[ExitMessage], str | None, C]:
     return messages, exit_messages, config_path, settings_source
 
 
+def get_shared_collection_doc_caches(
+    shared_paths: list[str],
+) -> tuple[list[LogMessage], list[KeyValueStore]]:
+    """Open the shared collection doc caches with the current application version.
+
+    Shared caches are only read, any that cannot be read or have another version are skipped.
+
+    :param shared_paths: Paths for the shared collection documentation caches
+    :returns: All messages and the shared collection caches, in the order they are consulted
+    """
+    messages: list[LogMessage] = []
+    shared_caches: list[KeyValueStore] = []
+    for shared_path in shared_paths:
+        if not Path(shared_path).is_file():
+            message = f"Shared collection doc cache: '{shared_path}' not found, skipping"
+            messages.append(LogMessage(level=logging.WARNING, message=message))
+            continue
+        shared_cache: KeyValueStore | None = None
+        added = False
+        try:
+            shared_cache = KeyValueStore(shared_path, read_only=True)
+            cache_version = shared_cache.get("version", None)
+            if cache_version == VERSION_CDC:
+                shared_caches.append(shared_cache)
+                added = True
+                message = f"Shared collection doc cache: '{shared_path}' added"
+                messages.append(LogMessage(level=logging.DEBUG, message=message))
+            else:
+                message = (
+                    f"Shared collection doc cache: '{shared_path}' version is '{cache_version}',"
+                    f" not '{VERSION_CDC}', skipping"
+                )
+                messages.append(LogMessage(level=logging.WARNING, message=message))
+        except sqlite3.Error as exc:
+            message = f"Shared collection doc cache: '{shared_path}' not readable, skipping: {exc}"
+            messages.append(LogMessage(level=logging.WARNING, message=message))
+        finally:
+            # Only the caches added are left open
+            if shared_cache is not None and not added:
+                shared_cache.close()
+    return messages, shared_caches
+
+
 def get_and_check_collection_doc_cache(
     collection_doc_cache_path: str,
+    shared_paths: list[str] | None = None,
 ) -> tuple[list[LogMessage], list[ExitMessage], KeyValueStore | None]:
     """Ensure the collection doc cache has current application version as a safeguard.
 
-    Always delete and rebuild if not.
+    If not, migrate it in place, or delete and rebuild it when that is not possible. Shared
+    caches are layered below the collection doc cache, they are consulted for documentation it
+    does not have, but never changed.
 
     :param collection_doc_cache_path: Path for collection documentation cache
+    :param shared_paths: Paths for read-only, shared collection documentation caches
     :returns: All messages and collection cache or None
     """
     messages: list[LogMessage] = []
@@ -128,10 +178,24 @@ def get_and_check_collection_doc_cache(
         exit_messages.append(ExitMessage(message=exit_msg, prefix=ExitPrefix.HINT))
         return messages, exit_messages, None
 
+    new_messages, shared_caches = get_shared_collection_doc_caches(shared_paths or [])
+    messages.extend(new_messages)
+
     collection_cache: KeyValueStore = KeyValueStore(collection_doc_cache_path)
     cache_version = collection_cache.get("version", None)
     message = f"Collection doc cache: 'current version' is '{cache_version}'"
     messages.append(LogMessage(level=logging.DEBUG, message=message))
+    if cache_version is not None and cache_version != VERSION_CDC:
+        try:
+            migrated = migrate_collection_doc_cache(collection_cache, VERSION_CDC)
+        except CollectionDocCacheMigrationError as exc:
+            message = f"Collection doc cache: {exc!s}"
+            messages.append(LogMessage(level=logging.INFO, message=message))
+        else:
+            versions = " -> ".join((cache_version, *migrated))
+            message = f"Collection doc cache: migrated {versions}"
+            messages.append(LogMessage(level=logging.INFO, message=message))
+            cache_version = VERSION_CDC
     if cache_version is None or cache_version != VERSION_CDC:
         message = "Collection doc cache: version was empty or incorrect, rebuilding"
         messages.append(LogMessage(level=logging.INFO, message=message))
@@ -143,6 +207,9 @@ def get_and_check_collection_doc_cache(
         message = f"Collection doc cache: 'current version' is '{cache_version}'"
         messages.append(LogMessage(level=logging.INFO, message=message))
     collection_cache.close()
+    if shared_caches:
+        collection_cache = KeyValueStore(collection_doc_cache_path, layers=shared_caches)
+        collection_cache.close()
     return messages, exit_messages, collection_cache
 
 
@@ -223,12 +290,18 @@ def parse_and_update(
         mount_collection_cache = True
         message = "Collection doc cache path changed"
         messages.append(LogMessage(level=logging.DEBUG, message=message))
+    elif args.initial.collection_doc_cache_shared_paths != args.collection_doc_cache_shared_paths:
+        mount_collection_cache = True
+        message = "Collection doc cache shared paths changed"
+        messages.append(LogMessage(level=logging.DEBUG, message=message))
     else:
         mount_collection_cache = False
 
     if mount_collection_cache and isinstance(args.collection_doc_cache_path, str):
+        shared_paths = args.collection_doc_cache_shared_paths
         new_messages, new_exit_messages, cache = get_and_check_collection_doc_cache(
             args.collection_doc_cache_path,
+            shared_paths if isinstance(shared_paths, list) else None,
         )
         messages.extend(new_messages)
         exit_messages.extend(new_exit_messages)
@@ -4,10 +4,12 @@ from .ansible_config import AnsibleConfig
 from .ansible_doc import AnsibleDoc
 from .ansible_inventory import AnsibleInventory
 from .command import Command
+from .command_async import RUNNER_FINISHED
 from .command_async import CommandAsync
 
 
 __all__ = (
+    "RUNNER_FINISHED",
     "AnsibleConfig",
     "AnsibleDoc",
     "AnsibleInventory",
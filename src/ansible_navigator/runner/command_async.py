@@ -6,16 +6,39 @@ standard out and error from the command run and populates the
 queue with messages.
 """
 
-from copy import deepcopy
-from queue import Queue
-from threading import Thread
+from __future__ import annotations
+
+import logging
+import reprlib
+
+from typing import TYPE_CHECKING
 from typing import Any
 
+import ansible_runner
+
 from ansible_runner import run_command_async
 
 from .command_base import CommandBase
 
 
+if TYPE_CHECKING:
+    from queue import Queue
+    from threading import Thread
+
+    from ansible_runner import Runner
+
+
+#: Placed on the queue after the last event, once ``ansible-runner`` has finished
+RUNNER_FINISHED: dict[str, Any] = {"event": "ansible_navigator_runner_finished"}
+
+_event_repr = reprlib.Repr()
+_event_repr.maxlevel = 3
+_event_repr.maxdict = 20
+_event_repr.maxlist = 10
+_event_repr.maxstring = 200
+_event_repr.maxother = 200
+
+
 class CommandAsync(CommandBase):
     """A wrapper for the asynchronous runner."""
 
@@ -39,17 +62,33 @@ class CommandAsync(CommandBase):
         self._write_job_events = write_job_events
         super().__init__(executable_cmd, **kwargs)
 
-    def _event_handler(self, event: Any) -> bool:
+    def _event_handler(self, event: dict[str, Any]) -> bool:
         """Handle the event from ansible-runner.
 
+        The event is handed to the queue without a deep copy. When ``ansible-runner`` still needs
+        the event after this handler returns, to write the job event or for a runner plugin,
+        only the dictionaries the consumer updates are detached.
+
         :param event: The event from ansible-runner
         :returns: The value of ``self._write_job_events``, a boolean
         """
-        self._logger.debug("ansible-runner event handle: %s", event)
-        new_event = deepcopy(event)
-        self._queue.put(new_event)
+        if self._logger.isEnabledFor(logging.DEBUG):
+            self._logger.debug("ansible-runner event handle: %s", _event_repr.repr(event))
+        if self._write_job_events or ansible_runner.plugins:
+            event = event.copy()
+            if isinstance(event.get("event_data"), dict):
+                event["event_data"] = event["event_data"].copy()
+        self._queue.put(event)
         return self._write_job_events
 
+    def runner_finished_callback(self, runner: Runner) -> None:
+        """Call when runner finishes, signal the end of the events on the queue.
+
+        :param runner: A runner instance
+        """
+        super().runner_finished_callback(runner)
+        self._queue.put(RUNNER_FINISHED)
+
     def run(self) -> Thread:
         """Initiate the execution of the runner command in async mode.
 
@@ -11,10 +11,13 @@ import json
 import logging
 import re
 
+from collections import OrderedDict
+from collections.abc import Sequence
 from itertools import chain
 from pathlib import Path
 from typing import TYPE_CHECKING
 from typing import Any
+from typing import overload
 
 from ansible_navigator.tm_tokenize.grammars import Grammars
 from ansible_navigator.tm_tokenize.tokenize import tokenize
@@ -29,7 +32,9 @@ from .ui_constants import Decoration
 
 
 if TYPE_CHECKING:
+    from ansible_navigator.tm_tokenize.compiler import Compiler
     from ansible_navigator.tm_tokenize.region import Regions
+    from ansible_navigator.tm_tokenize.state import State
     from ansible_navigator.utils.compatibility import Traversable
 
 
@@ -45,6 +50,11 @@ CURSES_STYLES = {
     8: getattr(curses, "A_INVIS", None),
 }
 
+#: The number of lines tokenized and colored together, and between tokenizer checkpoints
+CHUNK_LINES = 256
+#: The number of tokenized and colored chunks kept for each document
+CACHED_CHUNKS = 32
+
 
 class ColorSchema:
     """A storage mechanism for the schema (theme)."""
@@ -101,6 +111,8 @@ class Colorize:
         self._schema: ColorSchema
         self._grammars = Grammars(str(grammar_dir))
         self._theme_path = Path(str(theme_path))
+        self._documents: dict[str, RenderedLines] = {}
+        """The most recently rendered document for each scope, for reuse by the next one"""
         self._load()
 
     def _load(self) -> None:
@@ -127,47 +139,248 @@ class Colorize:
         :param scope: The scope, aka the format of the string
         :returns: A list of lines, each a list of dicts
         """
+        rendered = self._rendered_lines(doc=doc, scope=scope)
+        assembled = rendered[:]
+        # Should tokenization fail part way through, render the whole document without color
+        if rendered.colored:
+            if scope == "text.html.markdown":
+                assembled = strip_markdown(assembled)
+            return assembled
+
+        res = [
+            [SimpleLinePart(column=0, chars=doc_line, color=None, style=None)]
+            for doc_line in doc.splitlines()
+        ]
+        return res
+
+    @functools.lru_cache(maxsize=10)  # noqa: B019
+    def render_lines(self, doc: str, scope: str) -> Sequence[list[SimpleLinePart]]:
+        """Render text lines into lines of columns and colors, only as the lines are requested.
+
+        Markdown is stripped from the document as a whole, so it is rendered all at once.
+
+        :param doc: The string to split, tokenize and color
+        :param scope: The scope, aka the format of the string
+        :returns: The lines, each a list of line parts
+        """
+        if scope == "text.html.markdown":
+            return self.render(doc=doc, scope=scope)
+        return self._rendered_lines(doc=doc, scope=scope)
+
+    def _rendered_lines(self, doc: str, scope: str) -> RenderedLines:
+        """Start rendering a document, reusing the work done for the previous one.
+
+        The tokenizer checkpoints and rendered chunks of the previous document with the same scope
+        are reused for the lines the documents have in common from the start. An updated log only
+        needs the lines after the nearest checkpoint tokenized.
+
+        :param doc: The string to split, tokenize and color
+        :param scope: The scope, aka the format of the string
+        :returns: The lines, each a list of line parts
+        """
         try:
             compiler = self._grammars.compiler_for_scope(scope)
         except KeyError:
             compiler = None
+        if scope == "no_color":
+            compiler = None
+        # Markdown lines are modified in place when stripped, so they are not shared
+        shared = scope != "text.html.markdown"
+        rendered = RenderedLines(
+            doc=doc,
+            compiler=compiler,
+            schema=self._schema,
+            scope=scope,
+            previous=self._documents.get(scope) if shared else None,
+        )
+        if shared and rendered.colored:
+            self._documents[scope] = rendered
+        return rendered
 
-        if compiler and scope != "no_color":
-            state = compiler.root_state
-            lines = []
-            for line_idx, line in enumerate(doc.splitlines()):
-                line += "\n"
-                first_line = line_idx == 0
-                try:
-                    state, regions = tokenize(compiler, state, line, first_line)
-                except Exception as exc:  # noqa: BLE001
-                    self._logger.critical(
-                        (
-                            "An unexpected error occurred within the tokenization"
-                            " subsystem.  Please log an issue with the following:"
-                        ),
-                    )
-                    self._logger.critical(
-                        "  Err: '%s', Scope: '%s', Line follows....",
-                        str(exc),
-                        scope,
-                    )
-                    self._logger.critical("  '%s'", line)
-                    self._logger.critical("  The current content will be rendered without color")
+
+class RenderedLines(Sequence[list[SimpleLinePart]]):
+    """The lines of a document, tokenized and colored one chunk at a time as they are requested.
+
+    The tokenizer state at the start of each chunk is kept as a checkpoint, so a chunk can be
+    tokenized without tokenizing the document from the beginning again. Reaching a chunk for the
+    first time tokenizes the chunks before it without coloring them.
+    """
+
+    def __init__(
+        self,
+        doc: str,
+        compiler: Compiler | None,
+        schema: ColorSchema,
+        scope: str,
+        previous: RenderedLines | None = None,
+    ) -> None:
+        """Initialize the rendered lines.
+
+        :param doc: The string to split, tokenize and color
+        :param compiler: The grammar compiler for the scope, or None for no color
+        :param schema: The color schema
+        :param scope: The scope, aka the format of the string
+        :param previous: A previously rendered document with the same scope to reuse work from
+        """
+        self._logger = logging.getLogger(__name__)
+        self._lines = doc.splitlines()
+        self._compiler = compiler
+        self._schema = schema
+        self._scope = scope
+        self._checkpoints: list[State] = [compiler.root_state] if compiler else []
+        """The tokenizer state at the start of each chunk, as far as the document is tokenized"""
+        self._chunks: OrderedDict[int, list[list[SimpleLinePart]]] = OrderedDict()
+        """The most recently used chunks of rendered lines using the chunk number as the key"""
+        if previous is not None and previous.colored and compiler is not None:
+            self._reuse(previous)
+
+    @property
+    def colored(self) -> bool:
+        """Determine if the lines are colored, they are not if tokenization failed.
+
+        :returns: True if the lines are colored
+        """
+        return self._compiler is not None
+
+    def _reuse(self, previous: RenderedLines) -> None:
+        """Reuse the checkpoints and chunks of a previous document for the lines in common.
+
+        :param previous: The previously rendered document
+        """
+        common = 0
+        limit = min(len(self._lines), len(previous._lines))
+        while common < limit:
+            stop = min(common + CHUNK_LINES, limit)
+            if self._lines[common:stop] != previous._lines[common:stop]:
+                while self._lines[common] == previous._lines[common]:
+                    common += 1
+                break
+            common = stop
+        self._checkpoints = previous._checkpoints[: common // CHUNK_LINES + 1]
+        for chunk, rendered in previous._chunks.items():
+            if (chunk + 1) * CHUNK_LINES <= common:
+                self._chunks[chunk] = rendered
+
+    def __len__(self) -> int:
+        """Count the lines.
+
+        :returns: The number of lines
+        """
+        return len(self._lines)
+
+    @overload
+    def __getitem__(self, index: int) -> list[SimpleLinePart]: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[list[SimpleLinePart]]: ...
+
+    def __getitem__(
+        self,
+        index: int | slice,
+    ) -> list[SimpleLinePart] | list[list[SimpleLinePart]]:
+        """Render a line or a slice of lines.
+
+        :param index: The index of the line or a slice
+        :raises IndexError: When the index is out of range
+        :returns: The rendered line or lines
+        """
+        if isinstance(index, slice):
+            return [self[idx] for idx in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            msg = "rendered lines index out of range"
+            raise IndexError(msg)
+        chunk, offset = divmod(index, CHUNK_LINES)
+        return self._chunk(chunk)[offset]
+
+    def _chunk(self, chunk: int) -> list[list[SimpleLinePart]]:
+        """Get a chunk of rendered lines, rendering it if needed.
+
+        :param chunk: The chunk number
+        :returns: The rendered lines of the chunk
+        """
+        if chunk in self._chunks:
+            self._chunks.move_to_end(chunk)
+            return self._chunks[chunk]
+        rendered = self._render_chunk(chunk)
+        self._chunks[chunk] = rendered
+        if len(self._chunks) > CACHED_CHUNKS:
+            self._chunks.popitem(last=False)
+        return rendered
+
+    def _render_chunk(self, chunk: int) -> list[list[SimpleLinePart]]:
+        """Tokenize and color the lines of one chunk.
+
+        :param chunk: The chunk number
+        :returns: The rendered lines of the chunk
+        """
+        start = chunk * CHUNK_LINES
+        lines = self._lines[start : start + CHUNK_LINES]
+        state = self._state_at(chunk)
+        if state is not None:
+            tokenized = []
+            for line_idx, line in enumerate(lines, start=start):
+                result = self._tokenize(state, line_idx)
+                if result is None:
                     break
-                else:
-                    lines.append((regions, line))
+                state, regions = result
+                tokenized.append((regions, line + "\n"))
             else:
-                assembled = columns_and_colors(lines, self._schema)
-                if scope == "text.html.markdown":
-                    assembled = strip_markdown(assembled)
-                return assembled
+                if len(self._checkpoints) == chunk + 1 and len(lines) == CHUNK_LINES:
+                    self._checkpoints.append(state)
+                return columns_and_colors(tokenized, self._schema)
+        return [[SimpleLinePart(column=0, chars=line, color=None, style=None)] for line in lines]
 
-        res = [
-            [SimpleLinePart(column=0, chars=doc_line, color=None, style=None)]
-            for doc_line in doc.splitlines()
-        ]
-        return res
+    def _state_at(self, chunk: int) -> State | None:
+        """Get the tokenizer state at the start of a chunk, tokenizing up to it if needed.
+
+        :param chunk: The chunk number
+        :returns: The tokenizer state or None if the lines are not colored
+        """
+        while self._compiler is not None and len(self._checkpoints) <= chunk:
+            state = self._checkpoints[-1]
+            start = (len(self._checkpoints) - 1) * CHUNK_LINES
+            for line_idx in range(start, start + CHUNK_LINES):
+                result = self._tokenize(state, line_idx)
+                if result is None:
+                    return None
+                state = result[0]
+            self._checkpoints.append(state)
+        return self._checkpoints[chunk] if self._compiler is not None else None
+
+    def _tokenize(self, state: State, line_idx: int) -> tuple[State, Regions] | None:
+        """Tokenize one line.
+
+        Should tokenization fail, the document is rendered without color from then on.
+
+        :param state: The tokenizer state at the start of the line
+        :param line_idx: The index of the line
+        :returns: The tokenizer state at the end of the line and the regions of the line
+        """
+        if self._compiler is None:
+            return None
+        line = self._lines[line_idx] + "\n"
+        try:
+            return tokenize(self._compiler, state, line, line_idx == 0)
+        except Exception as exc:  # noqa: BLE001
+            self._logger.critical(
+                (
+                    "An unexpected error occurred within the tokenization"
+                    " subsystem.  Please log an issue with the following:"
+                ),
+            )
+            self._logger.critical(
+                "  Err: '%s', Scope: '%s', Line follows....",
+                str(exc),
+                self._scope,
+            )
+            self._logger.critical("  '%s'", line)
+            self._logger.critical("  The current content will be rendered without color")
+        self._compiler = None
+        self._checkpoints.clear()
+        self._chunks.clear()
+        return None
 
 
 def scope_to_list(scope: str | list[Any]) -> list[Any]:
@@ -389,7 +602,7 @@ def strip_markdown(lines: list[list[SimpleLinePart]]) -> list[list[SimpleLinePar
     """
     full_dash_line = [
         SimpleLinePart(
-            chars=f"{'—'*132}\n",
+            chars=f"{'—' * 132}\n",
             column=0,
             color=(128, 128, 128),
             style=None,
@@ -437,3 +650,37 @@ def strip_markdown(lines: list[list[SimpleLinePart]]) -> list[list[SimpleLinePar
                 lines[line_idx][part_idx].chars = re.sub(r"\*(.*)\*", r"\1", part.chars)
 
     return lines
+
+
+class AnsiLines(Sequence[CursesLine]):
+    """Lines of ansi colored text, converted to curses lines only when they are displayed."""
+
+    def __init__(self, lines: Sequence[str]) -> None:
+        """Initialize the ansi lines.
+
+        :param lines: The lines of ansi colored text
+        """
+        self._lines = lines
+
+    def __len__(self) -> int:
+        """Count the lines.
+
+        :returns: The number of lines
+        """
+        return len(self._lines)
+
+    @overload
+    def __getitem__(self, index: int) -> CursesLine: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> tuple[CursesLine, ...]: ...
+
+    def __getitem__(self, index: int | slice) -> CursesLine | tuple[CursesLine, ...]:
+        """Convert a line or a slice of lines.
+
+        :param index: The index of the line or a slice
+        :returns: The converted line or lines
+        """
+        if isinstance(index, slice):
+            return tuple(ansi_to_curses(line) for line in self._lines[index])
+        return ansi_to_curses(self._lines[index])
@@ -19,6 +19,7 @@ from typing import TYPE_CHECKING
 from typing import Any
 from typing import NamedTuple
 from typing import Protocol
+from typing import overload
 
 from ansible_navigator.content_defs import ContentFormat
 from ansible_navigator.content_defs import ContentType
@@ -27,6 +28,7 @@ from ansible_navigator.content_defs import ContentView
 from ansible_navigator.utils.functions import templar
 from ansible_navigator.utils.serialize import serialize
 
+from .colorize import AnsiLines
 from .colorize import Colorize
 from .colorize import rgb_to_ansi
 from .curses_defs import CursesLine
@@ -142,6 +144,46 @@ class Interaction(NamedTuple):
     menu: Menu | None = None
 
 
+class DecoratedLines(Sequence[CursesLine]):
+    """Rendered lines, colored and decorated for curses only when they are displayed."""
+
+    def __init__(
+        self,
+        lines: Sequence[list[SimpleLinePart]],
+        decorate: Callable[[list[list[SimpleLinePart]]], CursesLines],
+    ) -> None:
+        """Initialize the decorated lines.
+
+        :param lines: The rendered lines
+        :param decorate: The function used to color and decorate a list of rendered lines
+        """
+        self._lines = lines
+        self._decorate = decorate
+
+    def __len__(self) -> int:
+        """Count the lines.
+
+        :returns: The number of lines
+        """
+        return len(self._lines)
+
+    @overload
+    def __getitem__(self, index: int) -> CursesLine: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> CursesLines: ...
+
+    def __getitem__(self, index: int | slice) -> CursesLine | CursesLines:
+        """Color and decorate a line or a slice of lines.
+
+        :param index: The index of the line or a slice
+        :returns: The colored and decorated line or lines
+        """
+        if isinstance(index, slice):
+            return self._decorate(list(self._lines[index]))
+        return self._decorate([self._lines[index]])[0]
+
+
 class UserInterface(CursesWindow):
     # pylint: disable=too-many-instance-attributes
     # pylint: disable=too-many-arguments
@@ -549,14 +591,20 @@ class UserInterface(CursesWindow):
         self._show_form(warning_notification(msgs))
         return None, None
 
-    def _serialize_color(self, obj: Any) -> CursesLines:
+    def _serialize_color(self, obj: Any) -> Sequence[CursesLine]:
         """Serialize, if necessary and color an obj.
 
+        The object is still serialized in full, the lines are tokenized, colored and decorated
+        one screen at a time, as they are displayed. A sequence of ansi colored lines is
+        converted in the same way.
+
         :param obj: the object to color
         :returns: The generated lines
         """
         if self.content_format() is ContentFormat.ANSI:
-            return self._colorizer.render_ansi(doc=obj)
+            if isinstance(obj, str):
+                return self._colorizer.render_ansi(doc=obj)
+            return AnsiLines(obj)
 
         content_view = ContentView.NORMAL if self._hide_keys else ContentView.FULL
         current_format = self.content_format()
@@ -573,9 +621,17 @@ class UserInterface(CursesWindow):
         if self._ui_config.color:
             scope = self.content_format().value.scope
 
-        rendered = self._colorizer.render(doc=string, scope=scope)
-        self._cache_init_colors(rendered)
-        return self._color_decorate_lines(rendered)
+        rendered = self._colorizer.render_lines(doc=string, scope=scope)
+        return DecoratedLines(lines=rendered, decorate=self._decorate_lines)
+
+    def _decorate_lines(self, lines: list[list[SimpleLinePart]]) -> CursesLines:
+        """Cache and init the colors of the lines, then color and decorate them.
+
+        :param lines: The lines to transform
+        :returns: The lines colored
+        """
+        self._cache_init_colors(lines)
+        return self._color_decorate_lines(lines)
 
     def _cache_init_colors(self, lines: list[list[SimpleLinePart]]) -> None:
         """Cache and init the unique colors for future use.
@@ -652,7 +708,10 @@ class UserInterface(CursesWindow):
             decoration=decoration,
         )
 
-    def _filter_and_serialize(self, obj: Any) -> tuple[CursesLines | None, CursesLines]:
+    def _filter_and_serialize(
+        self,
+        obj: Any,
+    ) -> tuple[CursesLines | None, Sequence[CursesLine]]:
         """Filter an obj and serialize.
 
         :param obj: the obj to serialize
@@ -709,7 +768,7 @@ class UserInterface(CursesWindow):
             line_numbers = tuple(range(first_line_idx, last_line_idx + 1))
 
             entry = self._display(
-                lines=CursesLines(lines[first_line_idx : last_line_idx + 1]),
+                lines=CursesLines(tuple(lines[first_line_idx : last_line_idx + 1])),
                 line_numbers=line_numbers,
                 heading=heading,
                 indent_heading=False,
@@ -0,0 +1,176 @@
+"""Collection catalogs stored in the collection doc cache.
+
+Cataloging the collections requires running the catalog script, often in an execution
+environment container. When nothing that affects the result has changed, the result of the
+previous run is used instead.
+
+A catalog is stored using a key built from the settings used to run the catalog script, for
+example the execution environment image and volume mounts. Along with it, the host directories
+it was built from are stored, and a signature of their state. A stored catalog is only used
+when the signature of those directories is unchanged.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import sqlite3
+
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+
+#: The number of catalogs kept, one for each of the most recently used settings
+CATALOGS_KEPT = 4
+#: The files of a collection that change when an installed collection changes
+MANIFEST_FILES = ("FILES.json", "MANIFEST.json", "galaxy.yml", "meta/runtime.yml")
+#: The directories of a collection walked when it has no file manifest
+CONTENT_DIRECTORIES = ("plugins", "roles")
+
+
+def _stat_entry(path: Path) -> tuple[str, int, int, int] | tuple[str]:
+    """Describe the state of a file or directory.
+
+    :param path: The path to the file or directory
+    :returns: The path with it's inode, size and modification time, or only the path if missing
+    """
+    try:
+        stat = path.stat()
+    except OSError:
+        return (str(path),)
+    return (str(path), stat.st_ino, stat.st_size, stat.st_mtime_ns)
+
+
+def _walk_entries(directory: Path) -> list[tuple[str, int, int, int] | tuple[str]]:
+    """Describe the state of every file and directory within a directory.
+
+    :param directory: The directory to walk
+    :returns: The state of each file and directory
+    """
+    entries: list[tuple[str, int, int, int] | tuple[str]] = []
+    for root, dirs, files in os.walk(directory):
+        dirs.sort()
+        entries.extend(_stat_entry(Path(root, name)) for name in sorted(files))
+        entries.append(_stat_entry(Path(root)))
+    return entries
+
+
+def _directory_entries(path: Path) -> list[tuple[str, int, int, int] | tuple[str]]:
+    """Describe the state of a collection directory or a directory searched for collections.
+
+    :param path: The directory
+    :returns: The state of the files and directories that change with the collections
+    """
+    collections_dir = path / "ansible_collections"
+    if (path / "MANIFEST.json").exists() or (path / "galaxy.yml").exists():
+        entries = [_stat_entry(path / name) for name in MANIFEST_FILES]
+        if not (path / "FILES.json").exists():
+            for directory in CONTENT_DIRECTORIES:
+                entries.extend(_walk_entries(path / directory))
+        return entries
+    if collections_dir.is_dir():
+        namespaces = sorted(child for child in collections_dir.iterdir() if child.is_dir())
+        return [_stat_entry(collections_dir), *(_stat_entry(ns) for ns in namespaces)]
+    return [_stat_entry(child) for child in sorted(path.iterdir())]
+
+
+def path_signature(paths: Iterable[str]) -> str:
+    """Generate a signature for the state of collection paths.
+
+    A path is either the directory of a collection or a directory searched for collections.
+    An installed collection changes with it's manifests, the content of a collection without a
+    file manifest, usually one being developed, is walked. Collections are added or removed when
+    the listing of a searched ``ansible_collections`` directory or it's namespaces change.
+    Any other directory, like the one of the ``ansible.builtin`` collection, changes with it's
+    listing and immediate children.
+
+    :param paths: The directories to include in the signature
+    :returns: The hex digest of the signature
+    """
+    entries: list[tuple[str, int, int, int] | tuple[str]] = []
+    for path in sorted({Path(path) for path in paths}):
+        entries.append(_stat_entry(path))
+        if not path.is_dir():
+            continue
+        try:
+            entries.extend(_directory_entries(path))
+        except OSError as exc:
+            entries.append((f"{path}: {exc}",))
+    return hashlib.sha256(json.dumps(entries).encode("utf-8")).hexdigest()
+
+
+class CatalogCache:
+    """Collection catalogs, stored in a table of the collection doc cache."""
+
+    def __init__(self, filename: str | Path) -> None:
+        """Initialize the catalog cache.
+
+        :param filename: The full path to the collection doc cache
+        """
+        self._path = str(filename)
+
+    def _connect(self) -> sqlite3.Connection:
+        """Connect to the collection doc cache and create the catalog table if needed.
+
+        :returns: A connection to the collection doc cache
+        """
+        conn = sqlite3.connect(self._path)
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS collection_catalogs"
+            " (settings text primary key, paths text, signature text, catalog text,"
+            " used integer)",
+        )
+        return conn
+
+    def get(self, settings: str) -> str | None:
+        """Get the catalog for the settings, if the collection paths are unchanged.
+
+        :param settings: The key for the settings used to build the catalog
+        :returns: The catalog, or None if there is none or it is out of date
+        """
+        conn = self._connect()
+        try:
+            row = conn.execute(
+                "SELECT paths, signature, catalog FROM collection_catalogs WHERE settings = ?",
+                (settings,),
+            ).fetchone()
+            if row is None or path_signature(json.loads(row[0])) != row[1]:
+                return None
+            with conn:
+                conn.execute(
+                    "UPDATE collection_catalogs SET used = (SELECT MAX(used) + 1"
+                    " FROM collection_catalogs) WHERE settings = ?",
+                    (settings,),
+                )
+            return str(row[2])
+        finally:
+            conn.close()
+
+    def put(self, settings: str, paths: list[str], catalog: str) -> None:
+        """Store the catalog for the settings, keeping only the most recently used catalogs.
+
+        :param settings: The key for the settings used to build the catalog
+        :param paths: The host directories the catalog was built from
+        :param catalog: The catalog
+        """
+        conn = self._connect()
+        try:
+            with conn:
+                conn.execute(
+                    "REPLACE INTO collection_catalogs (settings, paths, signature, catalog, used)"
+                    " VALUES (?, ?, ?, ?,"
+                    " (SELECT COALESCE(MAX(used), 0) + 1 FROM collection_catalogs))",
+                    (settings, json.dumps(paths), path_signature(paths), catalog),
+                )
+                conn.execute(
+                    "DELETE FROM collection_catalogs WHERE settings NOT IN"
+                    " (SELECT settings FROM collection_catalogs ORDER BY used DESC LIMIT ?)",
+                    (CATALOGS_KEPT,),
+                )
+        finally:
+            conn.close()
@@ -10,12 +10,18 @@ from collections.abc import KeysView
 from collections.abc import MutableMapping
 from collections.abc import ValuesView
 from typing import TYPE_CHECKING
+from urllib.parse import quote
 
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
     from pathlib import Path
 
 
+#: The most keys in a single ``IN (...)`` lookup, below the oldest sqlite variable limit
+MAX_VARIABLES = 999
+
+
 class KVSKeysView(KeysView[str]):
     """A glorified KeysView specific to, and returned by, methods in KeyValueStore."""
 
@@ -29,17 +35,53 @@ class KVSValuesView(ValuesView[str]):
 
 
 class KeyValueStore(MutableMapping[str, str]):
-    """An interface to use a sqlite database as a key-value store."""
-
-    def __init__(self, filename: str | Path) -> None:
+    """An interface to use a sqlite database as a key-value store.
+
+    The database uses write-ahead logging, so readers are not blocked while it is
+    being written to, for example when the collection catalog is being updated.
+
+    Read-only key-value stores can be layered below another, for example ones shared by
+    many users. A key not found in the key-value store is looked up in each layer in turn,
+    but changes are only made to the key-value store itself.
+    """
+
+    def __init__(
+        self,
+        filename: str | Path,
+        read_only: bool = False,
+        layers: Iterable[KeyValueStore] = (),
+    ) -> None:
         """Initialize the key-value store.
 
         :param filename: The full path to the sqlite database file
+        :param read_only: Open the existing database without the ability to change it
+        :param layers: Read-only key-value stores consulted, in order, for missing keys
         """
         self._path = str(filename)
-        self.conn = sqlite3.connect(self._path)
-        cursor = self.conn.cursor()
-        cursor.execute("CREATE TABLE IF NOT EXISTS kv (key text unique, value text)")
+        self._read_only = read_only
+        self._layers = tuple(layers)
+        self.conn = self._connect()
+        if not read_only:
+            cursor = self.conn.cursor()
+            cursor.execute("PRAGMA journal_mode=WAL")
+            cursor.execute("CREATE TABLE IF NOT EXISTS kv (key text unique, value text)")
+
+    def _connect(self) -> sqlite3.Connection:
+        """Connect to the database, read-only if requested.
+
+        :returns: A connection to the database
+        """
+        if not self._read_only:
+            return sqlite3.connect(self._path)
+        conn = sqlite3.connect(f"file:{quote(self._path)}?mode=ro", uri=True)
+        try:
+            conn.execute("SELECT 1 FROM sqlite_master LIMIT 1")
+        except sqlite3.OperationalError:
+            # Reading a database using write-ahead logging requires write access to the
+            # directory, a shared database may be in one without, so it is read as is
+            conn.close()
+            conn = sqlite3.connect(f"file:{quote(self._path)}?mode=ro&immutable=1", uri=True)
+        return conn
 
     @property
     def path(self) -> str:
@@ -49,17 +91,40 @@ class KeyValueStore(MutableMapping[str, str]):
         """
         return self._path
 
+    @property
+    def read_only(self) -> bool:
+        """Provide whether the key-value store was opened read-only.
+
+        :returns: True if the key-value store can not be changed
+        """
+        return self._read_only
+
+    @property
+    def layers(self) -> tuple[KeyValueStore, ...]:
+        """Provide the read-only key-value stores layered below this one.
+
+        :returns: The layers, in the order they are consulted
+        """
+        return self._layers
+
     def close(self) -> None:
-        """Close the connection to the database."""
+        """Close the connection to the database and any layers."""
         self.conn.commit()
         self.conn.close()
+        for layer in self._layers:
+            layer.close()
 
-    def open_(self) -> sqlite3.Connection:
-        """Establish the connection to the database.
+    def open_(self, read_only: bool | None = None) -> sqlite3.Connection:
+        """Establish the connection to the database and any layers.
 
+        :param read_only: Connect read-only, or not, rather than as previously connected
         :returns: A connection to the database
         """
-        self.conn = sqlite3.connect(self.path)
+        if read_only is not None:
+            self._read_only = read_only
+        self.conn = self._connect()
+        for layer in self._layers:
+            layer.open_()
         return self.conn
 
     def __len__(self) -> int:
@@ -67,6 +132,8 @@ class KeyValueStore(MutableMapping[str, str]):
 
         :returns: The number of keys
         """
+        if self._layers:
+            return sum(1 for _key in self.iterkeys())
         cursor = self.conn.cursor()
         rows = cursor.execute("SELECT COUNT(*) FROM kv").fetchone()[0]
         if not isinstance(rows, int):
@@ -78,6 +145,10 @@ class KeyValueStore(MutableMapping[str, str]):
 
         :yields: The keys in the key-value store
         """
+        if self._layers:
+            for key, _value in self.iteritems():
+                yield key
+            return
         cursor = self.conn.cursor()
         for row in cursor.execute("SELECT key FROM kv"):
             yield row[0]
@@ -87,6 +158,10 @@ class KeyValueStore(MutableMapping[str, str]):
 
         :yields: The values in the key-value store
         """
+        if self._layers:
+            for _key, value in self.iteritems():
+                yield value
+            return
         cursor = self.conn.cursor()
         for row in cursor.execute("SELECT value FROM kv"):
             yield row[0]
@@ -97,8 +172,15 @@ class KeyValueStore(MutableMapping[str, str]):
         :yields: The key-value store as items (key, value)
         """
         cursor = self.conn.cursor()
+        seen = set()
         for row in cursor.execute("SELECT key, value FROM kv"):
+            seen.add(row[0])
             yield row[0], row[1]
+        for layer in self._layers:
+            for key, value in layer.iteritems():
+                if key not in seen:
+                    seen.add(key)
+                    yield key, value
 
     def keys(self) -> KVSKeysView:
         """Return all keys in the key-value store.
@@ -135,7 +217,9 @@ class KeyValueStore(MutableMapping[str, str]):
         :returns: An indication of the provided key's existence in the key-value store
         """
         cursor = self.conn.cursor()
-        return cursor.execute("SELECT 1 FROM kv WHERE key = ?", (key,)).fetchone() is not None
+        if cursor.execute("SELECT 1 FROM kv WHERE key = ?", (key,)).fetchone() is not None:
+            return True
+        return any(key in layer for layer in self._layers)
 
     def __getitem__(self, key: str) -> str:
         """Return a value from the key-value store given a key.
@@ -146,9 +230,14 @@ class KeyValueStore(MutableMapping[str, str]):
         """
         cursor = self.conn.cursor()
         item = cursor.execute("SELECT value FROM kv WHERE key = ?", (key,)).fetchone()
-        if item is None:
-            raise KeyError(key)
-        return item[0]
+        if item is not None:
+            return item[0]
+        for layer in self._layers:
+            try:
+                return layer[key]
+            except KeyError:
+                continue
+        raise KeyError(key)
 
     def __setitem__(self, key: str, value: str) -> None:
         """Place a key-value combination in the key-value store.
@@ -162,13 +251,55 @@ class KeyValueStore(MutableMapping[str, str]):
     def __delitem__(self, key: str) -> None:
         """Delete a key-value combination in the key-value store.
 
+        Entries only found in a layer can not be deleted.
+
         :param key: The key of the entry to delete
         :raises KeyError: When the provided key does not exist in the key-value store
         """
-        if key not in self:
-            raise KeyError(key)
         cursor = self.conn.cursor()
         cursor.execute("DELETE FROM kv WHERE key = ?", (key,))
+        if cursor.rowcount == 0:
+            raise KeyError(key)
+
+    def get_many(self, keys: Iterable[str]) -> dict[str, str]:
+        """Return the values for many keys, using as few queries as possible.
+
+        Keys that do not exist in the key-value store are not included in the result.
+
+        :param keys: The keys to find
+        :returns: The value for each key found
+        """
+        keys = list(dict.fromkeys(keys))
+        found: dict[str, str] = {}
+        cursor = self.conn.cursor()
+        for start in range(0, len(keys), MAX_VARIABLES):
+            chunk = keys[start : start + MAX_VARIABLES]
+            placeholders = ",".join("?" * len(chunk))
+            query = f"SELECT key, value FROM kv WHERE key IN ({placeholders})"  # noqa: S608
+            found.update(cursor.execute(query, chunk))
+        for layer in self._layers:
+            if len(found) == len(keys):
+                break
+            found.update(layer.get_many(key for key in keys if key not in found))
+        return found
+
+    def set_many(self, items: Iterable[tuple[str, str]]) -> None:
+        """Place many key-value combinations in the key-value store in one transaction.
+
+        :param items: The key-value combinations to set
+        """
+        with self.conn:
+            self.conn.executemany("REPLACE INTO kv (key, value) VALUES (?,?)", items)
+
+    def delete_many(self, keys: Iterable[str]) -> None:
+        """Delete many entries from the key-value store in one transaction.
+
+        Keys that do not exist in the key-value store are ignored.
+
+        :param keys: The keys of the entries to delete
+        """
+        with self.conn:
+            self.conn.executemany("DELETE FROM kv WHERE key = ?", ((key,) for key in keys))
 
     def __iter__(self) -> Iterator[str]:
         """Yield values extracted from the key-value store one by one.
@@ -0,0 +1,374 @@
+"""Streaming playbook artifacts.
+
+A streaming playbook artifact is a JSON Lines file. The first line is a header
+with the artifact version and the settings, each following line is a record
+written as the playbook runs, and the last line is a trailer written when the
+playbook completes. An artifact without a trailer is from a run that did not
+complete, everything written up to that point can still be replayed.
+
+The records are:
+
+- ``{"stdout": [...]}``: lines of standard output
+- ``{"play": {...}}``: a play, without it's tasks
+- ``{"task": {...}}``: a task for one host, a later record for the same task
+  uuid and host supersedes an earlier one
+- ``{"task_index": [[offset, {...}], ...]}``: the offset of the latest record and
+  a summary for each task of a play, written when the artifact is closed
+- ``{"trailer": {...}}``: the final status of the playbook, a summary of each play
+  and the offsets of the stdout, play and task index records
+
+The offsets allow a replay to show the plays without reading the whole artifact
+and to read the tasks of a play only when they are requested.
+
+Artifacts with a ``.gz`` suffix, in either format, are written compressed with gzip
+and are detected and decompressed when read. The offsets of a compressed artifact are
+offsets into the decompressed stream. gzip can not seek, so a compressed streaming artifact
+is decompressed in one pass when first read and the records are read from memory.
+"""
+
+from __future__ import annotations
+
+import gzip
+import io
+import json
+import logging
+import os
+import time
+import zlib
+
+from functools import lru_cache
+from pathlib import Path
+from typing import IO
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import BinaryIO
+
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+
+logger = logging.getLogger(__name__)
+
+STREAM_VERSION = "3.0.0"
+STREAM_SUFFIX = ".jsonl"
+COMPRESSED_SUFFIX = ".gz"
+GZIP_MAGIC = b"\x1f\x8b"
+#: The start of the header of a streaming artifact, older artifacts are a single json document
+STREAM_HEADER_PREFIX = b'{"version": "3.'
+#: A balance between the size of the artifact and the time spent compressing it
+COMPRESS_LEVEL = 6
+#: Seconds between flushes of the artifact to disk
+FLUSH_INTERVAL = 1.0
+
+#: The task keys kept in the task index, enough to build the task list for a play
+TASK_SUMMARY_KEYS = (
+    "__changed",
+    "__duration",
+    "__host",
+    "__number",
+    "__result",
+    "__task",
+    "__task_action",
+    "host",
+    "play_uuid",
+    "task",
+    "task_uuid",
+)
+
+
+def is_compressed(filename: str | Path) -> bool:
+    """Determine if an artifact file name requests compression.
+
+    :param filename: The artifact file name
+    :returns: True if the artifact should be compressed
+    """
+    return Path(filename).suffix == COMPRESSED_SUFFIX
+
+
+def is_streaming(filename: str | Path) -> bool:
+    """Determine if an artifact file name requests the streaming format.
+
+    :param filename: The artifact file name
+    :returns: True if the streaming format should be used
+    """
+    path = Path(filename)
+    if is_compressed(path):
+        path = path.with_suffix("")
+    return path.suffix == STREAM_SUFFIX
+
+
+def open_artifact(path: Path, mode: str) -> gzip.GzipFile | BinaryIO:
+    """Open an artifact file in binary mode, compressed or decompressed as needed.
+
+    When writing, the file name determines if the artifact is compressed, when reading
+    the content of the file does.
+
+    :param path: The path of the artifact file
+    :param mode: Either ``rb`` or ``wb``
+    :returns: The open artifact file
+    """
+    if mode == "wb":
+        compressed = is_compressed(path)
+    else:
+        with path.open(mode="rb") as file_handle:
+            compressed = file_handle.read(len(GZIP_MAGIC)) == GZIP_MAGIC
+    if compressed:
+        return gzip.GzipFile(filename=path, mode=mode, compresslevel=COMPRESS_LEVEL)
+    if mode == "wb":
+        return path.open(mode="wb")
+    return path.open(mode="rb")
+
+
+def write_compressed_document(path: Path, artifact: dict[str, Any]) -> None:
+    """Write an artifact as a single, compressed json document.
+
+    The document is encoded in chunks as it is compressed, without indentation.
+
+    :param path: The path of the artifact file
+    :param artifact: The artifact
+    """
+    with gzip.open(path, mode="wt", encoding="utf-8", compresslevel=COMPRESS_LEVEL) as fh:
+        json.dump(artifact, fh, ensure_ascii=False, default=str)
+
+
+def _json_line(record: dict[str, Any]) -> bytes:
+    """Serialize one record to a line of json.
+
+    :param record: The record to serialize
+    :returns: The serialized record, including the newline
+    """
+    return (json.dumps(record, ensure_ascii=False, default=str) + "\n").encode("utf-8")
+
+
+class ArtifactWriter:
+    """An append-only writer for a streaming playbook artifact."""
+
+    def __init__(self, path: Path, header: dict[str, Any]) -> None:
+        """Open the artifact file and write the header.
+
+        :param path: The path of the artifact file
+        :param header: The settings and any other details to include in the header
+        """
+        self.path = path
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open_artifact(self.path, mode="wb")
+        self._flushed = float("-inf")
+        self._offset = 0
+        self._stdout_offsets: list[int] = []
+        self._play_offsets: dict[str, int] = {}
+        self._task_offsets: dict[str, dict[tuple[str, str], list[Any]]] = {}
+        self.write({"version": STREAM_VERSION, **header})
+
+    def write(self, record: dict[str, Any]) -> int:
+        """Append a record to the artifact and keep track of where it was written.
+
+        :param record: The record to append
+        :returns: The offset of the record in the artifact
+        """
+        offset = self._offset
+        line = _json_line(record)
+        self._file.write(line)
+        self._offset += len(line)
+        if "stdout" in record:
+            self._stdout_offsets.append(offset)
+        elif "play" in record:
+            self._play_offsets[record["play"]["uuid"]] = offset
+            self._task_offsets[record["play"]["uuid"]] = {}
+        elif "task" in record:
+            task = record["task"]
+            tasks = self._task_offsets.get(task["play_uuid"])
+            if tasks is not None:
+                summary = {key: task[key] for key in TASK_SUMMARY_KEYS if key in task}
+                tasks[(task["task_uuid"], task["host"])] = [offset, summary]
+        return offset
+
+    def flush(self) -> None:
+        """Flush the written records to disk, at most once per flush interval."""
+        now = time.monotonic()
+        if now - self._flushed >= FLUSH_INTERVAL:
+            self._file.flush()
+            self._flushed = now
+
+    def close(
+        self,
+        trailer: dict[str, Any],
+        plays: list[dict[str, Any]],
+        path: Path | None = None,
+    ) -> Path:
+        """Write the task indices and trailer, close the artifact and move it to it's final path.
+
+        :param trailer: The final status of the playbook
+        :param plays: A summary of each play, without it's tasks
+        :param path: The final path of the artifact, if different
+        :returns: The final path of the artifact
+        """
+        index: dict[str, Any] = {"stdout": self._stdout_offsets, "plays": {}}
+        for play_uuid, tasks in self._task_offsets.items():
+            index["plays"][play_uuid] = {
+                "offset": self._play_offsets[play_uuid],
+                "task_index": self.write({"task_index": list(tasks.values())}),
+            }
+        self.write({"trailer": {**trailer, "plays": plays, "index": index}})
+        self._file.close()
+        if path is not None and path != self.path:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            self.path.replace(path)
+            self.path = path
+        return self.path
+
+
+class ArtifactReader:
+    """A reader for a streaming playbook artifact.
+
+    An uncompressed artifact file is opened for each read, so nothing is held open between
+    reads. A compressed artifact is decompressed once and kept in memory.
+    """
+
+    def __init__(self, path: Path) -> None:
+        """Read the header of the artifact.
+
+        Only the start of the artifact is read to determine the format, so an artifact written
+        as a single json document is left to be read once by the caller.
+
+        :param path: The path of the artifact file
+        """
+        self.path = path
+        self.read_record = lru_cache(maxsize=16)(self._read_record)
+        self._decompressed: bytes | None = None
+        self._records_offset = 0
+        self.header: dict[str, Any] | None = None
+        with open_artifact(self.path, mode="rb") as file_handle:
+            self._compressed = isinstance(file_handle, gzip.GzipFile)
+            try:
+                prefix = file_handle.read(len(STREAM_HEADER_PREFIX))
+            except (EOFError, gzip.BadGzipFile):
+                prefix = b""
+        if prefix != STREAM_HEADER_PREFIX:
+            return
+        with self._open() as file_handle:
+            line = file_handle.readline()
+            self._records_offset = file_handle.tell()
+        try:
+            header = json.loads(line)
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            return
+        if isinstance(header, dict):
+            self.header = header
+
+    def _open(self) -> IO[bytes]:
+        """Open the artifact for reading at any offset.
+
+        :returns: The open artifact file, or the decompressed artifact
+        """
+        if not self._compressed:
+            return self.path.open(mode="rb")
+        if self._decompressed is None:
+            self._decompressed = self._decompress()
+        return io.BytesIO(self._decompressed)
+
+    def _decompress(self) -> bytes:
+        """Decompress the artifact in one pass.
+
+        A compressed artifact from a run that did not complete ends part way through, everything
+        that can be decompressed is kept.
+
+        :returns: The decompressed artifact
+        """
+        data = self.path.read_bytes()
+        chunks: list[bytes] = []
+        while data:
+            decompressor = zlib.decompressobj(wbits=zlib.MAX_WBITS | 16)
+            try:
+                chunks.append(decompressor.decompress(data))
+            except zlib.error:
+                logger.warning("Discarded corrupt data from the compressed playbook artifact")
+                break
+            if not decompressor.eof:
+                logger.warning("The compressed playbook artifact is incomplete")
+                break
+            data = decompressor.unused_data
+        return b"".join(chunks)
+
+    def _read_record(self, offset: int) -> dict[str, Any]:
+        """Read the record at an offset.
+
+        :param offset: The offset of the record in the artifact
+        :returns: The record
+        """
+        with self._open() as file_handle:
+            file_handle.seek(offset)
+            return json.loads(file_handle.readline())
+
+    def records(self) -> Iterator[dict[str, Any]]:
+        """Read the records of the artifact, one line at a time.
+
+        A partially written last line, from a run that did not complete, is skipped.
+
+        :yields: Each record
+        """
+        with self._open() as file_handle:
+            file_handle.seek(self._records_offset)
+            for line in file_handle:
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError:
+                    logger.warning("Discarded an incomplete record from the playbook artifact")
+
+    def trailer(self) -> dict[str, Any] | None:
+        """Read the trailer from the end of the artifact.
+
+        :returns: The trailer, or None if the artifact is incomplete
+        """
+        last_line = self._last_line()
+        try:
+            record = json.loads(last_line)
+        except json.JSONDecodeError:
+            return None
+        if isinstance(record, dict) and "trailer" in record:
+            return record["trailer"]
+        return None
+
+    def _last_line(self) -> bytes:
+        """Read the last line of the artifact, reading backwards from the end.
+
+        :returns: The last line
+        """
+        block_size = 64 * 1024
+        with self._open() as file_handle:
+            position = file_handle.seek(0, os.SEEK_END)
+            data = b""
+            while position > self._records_offset and data.count(b"\n") < 2:
+                step = min(block_size, position - self._records_offset)
+                position -= step
+                file_handle.seek(position)
+                data = file_handle.read(step) + data
+        return data.rstrip(b"\n").rsplit(b"\n", 1)[-1]
+
+
+class ArtifactTasks(list[dict[str, Any]]):
+    """The task summaries of a play, indexing returns the complete task from the artifact."""
+
+    def __init__(
+        self,
+        reader: ArtifactReader,
+        task_index: list[tuple[int, dict[str, Any]]],
+    ) -> None:
+        """Initialize the task list from a task index.
+
+        :param reader: The artifact reader
+        :param task_index: The offset and summary of each task
+        """
+        super().__init__(summary for _offset, summary in task_index)
+        self._offsets = [offset for offset, _summary in task_index]
+        self._reader = reader
+
+    def __getitem__(self, index: Any) -> Any:
+        """Read the complete task for an index, slices return the summaries.
+
+        :param index: The index of the task
+        :returns: The complete task or summaries
+        """
+        if isinstance(index, slice):
+            return super().__getitem__(index)
+        return self._reader.read_record(self._offsets[index])["task"]
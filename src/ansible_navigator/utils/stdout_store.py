@@ -0,0 +1,169 @@
+"""A store for lines of standard output with a bounded number of lines in memory."""
+
+from __future__ import annotations
+
+import os
+import tempfile
+
+from array import array
+from collections.abc import Sequence
+from typing import IO
+from typing import TYPE_CHECKING
+from typing import overload
+
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from collections.abc import Iterator
+
+
+#: The number of the most recent lines kept in memory
+MEMORY_LINES = 10_000
+#: The number of lines read from the spill file at once when iterating
+READ_LINES = 10_000
+
+
+class StdoutStore(Sequence[str]):
+    """A sequence of lines of standard output.
+
+    The most recent lines are kept in memory. Once there are more than ``memory_lines``
+    of them, the oldest are appended to an anonymous temporary file, the spill file, along
+    with the offset of each line, so any line can be read back without reading the file.
+    """
+
+    def __init__(self, memory_lines: int = MEMORY_LINES) -> None:
+        """Initialize the stdout store.
+
+        :param memory_lines: The number of the most recent lines to keep in memory
+        """
+        self._memory_lines = memory_lines
+        self._lines: list[str] = []
+        self._file: IO[bytes] | None = None
+        self._offsets = array("Q", [0])
+        """The offset of each spilled line and the end of the spill file"""
+
+    @property
+    def spilled(self) -> int:
+        """Provide the number of lines in the spill file.
+
+        :returns: The number of spilled lines
+        """
+        return len(self._offsets) - 1
+
+    def append(self, line: str) -> None:
+        """Add a line to the store.
+
+        :param line: The line to add
+        """
+        self._lines.append(line)
+        if len(self._lines) > self._memory_lines:
+            self._spill()
+
+    def extend(self, lines: Iterable[str]) -> None:
+        """Add lines to the store.
+
+        :param lines: The lines to add
+        """
+        self._lines.extend(lines)
+        if len(self._lines) > self._memory_lines:
+            self._spill()
+
+    def clear(self) -> None:
+        """Remove all lines from the store and the spill file."""
+        self.close()
+        self._lines = []
+        self._offsets = array("Q", [0])
+
+    def close(self) -> None:
+        """Close and remove the spill file."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def _spill(self) -> None:
+        """Move the oldest lines to the spill file, leaving half of the lines in memory."""
+        split = len(self._lines) - self._memory_lines // 2
+        spill, self._lines = self._lines[:split], self._lines[split:]
+        if self._file is None:
+            self._file = tempfile.TemporaryFile(prefix="ansible-navigator-stdout-")  # noqa: SIM115
+        encoded = [line.encode("utf-8", errors="surrogateescape") for line in spill]
+        offset = self._offsets[-1]
+        for line in encoded:
+            offset += len(line)
+            self._offsets.append(offset)
+        self._file.seek(0, os.SEEK_END)
+        self._file.write(b"".join(encoded))
+
+    def _read_spilled(self, start: int, stop: int) -> list[str]:
+        """Read a range of lines from the spill file with a single read.
+
+        :param start: The index of the first line
+        :param stop: The index after the last line
+        :returns: The lines
+        """
+        if self._file is None or start >= stop:
+            return []
+        base = self._offsets[start]
+        self._file.seek(base)
+        data = self._file.read(self._offsets[stop] - base)
+        return [
+            data[self._offsets[idx] - base : self._offsets[idx + 1] - base].decode(
+                "utf-8",
+                errors="surrogateescape",
+            )
+            for idx in range(start, stop)
+        ]
+
+    def __len__(self) -> int:
+        """Count the lines in the store.
+
+        :returns: The number of lines
+        """
+        return self.spilled + len(self._lines)
+
+    @overload
+    def __getitem__(self, index: int) -> str: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[str]: ...
+
+    def __getitem__(self, index: int | slice) -> str | list[str]:
+        """Get a line or a list of lines from the store.
+
+        :param index: The index of the line or a slice
+        :raises IndexError: When the index is out of range
+        :returns: The line or lines
+        """
+        spilled = self.spilled
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            if step != 1:
+                return [self[idx] for idx in range(start, stop, step)]
+            lines = self._read_spilled(start, min(stop, spilled))
+            lines.extend(self._lines[max(start - spilled, 0) : max(stop - spilled, 0)])
+            return lines
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            msg = "stdout store index out of range"
+            raise IndexError(msg)
+        if index >= spilled:
+            return self._lines[index - spilled]
+        return self._read_spilled(index, index + 1)[0]
+
+    def __iter__(self) -> Iterator[str]:
+        """Yield each line, reading the spill file in chunks.
+
+        :yields: Each line
+        """
+        spilled = self.spilled
+        for start in range(0, spilled, READ_LINES):
+            yield from self._read_spilled(start, min(start + READ_LINES, spilled))
+        yield from self._lines
+
+    def __str__(self) -> str:
+        """Provide the lines as text.
+
+        :returns: The lines joined by newlines
+        """
+        return "\n".join(self)
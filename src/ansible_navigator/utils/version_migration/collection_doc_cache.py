@@ -0,0 +1,157 @@
+"""Migrations of the collection doc cache from one schema version to the next.
+
+Unlike the settings file migrations, these are run without prompting during initialization,
+so the plugin docs already extracted are kept when the schema of the collection doc cache
+changes. A cache that can not be migrated is rebuilt.
+"""
+
+from __future__ import annotations
+
+import time
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from ansible_navigator.utils.key_value_store import KeyValueStore
+
+
+class CollectionDocCacheMigrationError(Exception):
+    """The collection doc cache could not be migrated."""
+
+
+@dataclass(frozen=True)
+class CollectionDocCacheMigration:
+    """A migration of the collection doc cache from one version to the next."""
+
+    from_version: str
+    """The version of the collection doc cache being migrated"""
+    to_version: str
+    """The version of the collection doc cache once migrated"""
+    function: Callable[[KeyValueStore], None]
+    """Migrate the collection doc cache in place"""
+
+
+collection_doc_cache_migrations: dict[str, CollectionDocCacheMigration] = {}
+"""The registered migrations, by the version they migrate from."""
+
+
+def register(
+    from_version: str,
+    to_version: str,
+) -> Callable[[Callable[[KeyValueStore], None]], Callable[[KeyValueStore], None]]:
+    """Register a function as the migration of the collection doc cache from a version.
+
+    :param from_version: The version of the collection doc cache being migrated
+    :param to_version: The version of the collection doc cache once migrated
+    :returns: The decorator registering the function
+    """
+
+    def wrapper(func: Callable[[KeyValueStore], None]) -> Callable[[KeyValueStore], None]:
+        """Register the migration function.
+
+        :param func: The function to register
+        :returns: The function, unchanged
+        """
+        collection_doc_cache_migrations[from_version] = CollectionDocCacheMigration(
+            from_version=from_version,
+            to_version=to_version,
+            function=func,
+        )
+        return func
+
+    return wrapper
+
+
+def migration_path(from_version: str, to_version: str) -> list[CollectionDocCacheMigration]:
+    """Find the migrations from one version of the collection doc cache to another.
+
+    :param from_version: The current version of the collection doc cache
+    :param to_version: The version the collection doc cache should be migrated to
+    :raises CollectionDocCacheMigrationError: When no migrations lead to the version
+    :returns: The migrations, in the order they are run
+    """
+    path: list[CollectionDocCacheMigration] = []
+    version = from_version
+    while version != to_version:
+        migration = collection_doc_cache_migrations.get(version)
+        if migration is None or migration in path:
+            msg = f"No migration from version '{version}' to '{to_version}'"
+            raise CollectionDocCacheMigrationError(msg)
+        path.append(migration)
+        version = migration.to_version
+    return path
+
+
+def migrate_collection_doc_cache(collection_cache: KeyValueStore, to_version: str) -> list[str]:
+    """Migrate the collection doc cache in place, in a single transaction.
+
+    Either every migration is applied and the version of the cache updated, or the cache
+    is left unchanged.
+
+    :param collection_cache: The collection doc cache
+    :param to_version: The version the collection doc cache should be migrated to
+    :raises CollectionDocCacheMigrationError: When the collection doc cache could not be migrated
+    :returns: The versions the collection doc cache was migrated to, in order
+    """
+    from_version = collection_cache.get("version", None)
+    if from_version is None:
+        msg = "The collection doc cache has no version"
+        raise CollectionDocCacheMigrationError(msg)
+    path = migration_path(from_version, to_version)
+
+    conn = collection_cache.conn
+    conn.commit()
+    # An explicit transaction, so changes to tables are rolled back too
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        for migration in path:
+            migration.function(collection_cache)
+        collection_cache["version"] = to_version
+    except Exception as exc:
+        conn.rollback()
+        msg = f"Migration from version '{from_version}' to '{to_version}' failed: {exc!s}"
+        raise CollectionDocCacheMigrationError(msg) from exc
+    conn.commit()
+    return [migration.to_version for migration in path]
+
+
+@register("1.1", "2.0")
+def add_catalog_tables(collection_cache: KeyValueStore) -> None:
+    """Add the tables kept alongside the plugin docs.
+
+    The tables are the checksums of plugin files, the plugin summaries, the last access of each
+    plugin doc and the stored collection catalogs. Each is created with the same schema as the
+    catalog script and catalog cache use. The summaries are filled in the next time collections
+    are cataloged. The docs already cached are recorded as accessed now, so they are not evicted
+    as unused.
+
+    :param collection_cache: The collection doc cache
+    """
+    conn = collection_cache.conn
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS file_checksums"
+        " (path text primary key, inode integer, size integer, mtime_ns integer,"
+        " checksum text)",
+    )
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS plugin_summaries"
+        " (checksum text, type text, documented integer, name text, short_description text,"
+        " version_added text, deprecated integer, PRIMARY KEY (checksum, type))",
+    )
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS doc_access (checksum text primary key, accessed integer)",
+    )
+    conn.execute(
+        "INSERT OR IGNORE INTO doc_access (checksum, accessed)"
+        " SELECT key, ? FROM kv WHERE key != 'version'",
+        (int(time.time()),),
+    )
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS collection_catalogs"
+        " (settings text primary key, paths text, signature text, catalog text,"
+        " used integer)",
+    )
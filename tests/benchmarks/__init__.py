@@ -0,0 +1 @@
+"""Benchmarks, run as modules rather than collected by pytest."""
@@ -0,0 +1,129 @@
+"""Benchmark the handling of ``ansible-runner`` events by the async runner.
+
+The current event handler is compared with the deep copy and unconditional debug logging it
+replaced, using a ``runner_on_ok`` event carrying the package facts of a host::
+
+    python -m tests.benchmarks.event_handler [--packages 2000] [--seconds 2]
+
+The throughput is printed in events per second for each handler and log level.
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import os
+import time
+
+from copy import deepcopy
+from pathlib import Path
+from queue import Queue
+from typing import TYPE_CHECKING
+from typing import Any
+
+from ansible_navigator.runner import CommandAsync
+
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+def facts_event(packages: int) -> dict[str, Any]:
+    """Build a runner event with the package facts of a host.
+
+    :param packages: The number of packages in the facts
+    :returns: The runner event
+    """
+    facts = {
+        f"package-{number}": [
+            {
+                "arch": "x86_64",
+                "epoch": None,
+                "name": f"package-{number}",
+                "release": "1.el9",
+                "source": "rpm",
+                "version": f"{number}.0.0",
+            },
+        ]
+        for number in range(packages)
+    }
+    return {
+        "event": "runner_on_ok",
+        "uuid": "00000000-0000-0000-0000-000000000000",
+        "stdout": "ok: [host]",
+        "event_data": {
+            "host": "host",
+            "task": "Gather the package facts",
+            "res": {"ansible_facts": {"packages": facts}, "changed": False},
+        },
+    }
+
+
+def replaced_handler(logger: logging.Logger, queue: Queue[Any]) -> Callable[[Any], bool]:
+    """Build the event handler as it was before events were handed to the queue as is.
+
+    :param logger: The logger used by the handler
+    :param queue: The queue the handler places events on
+    :returns: The event handler
+    """
+
+    def handler(event: Any) -> bool:
+        """Log and deep copy the event onto the queue.
+
+        :param event: The event from ansible-runner
+        :returns: Whether job events are written
+        """
+        logger.debug("ansible-runner event handle: %s", event)
+        queue.put(deepcopy(event))
+        return False
+
+    return handler
+
+
+def throughput(handler: Callable[[Any], bool], event: dict[str, Any], seconds: float) -> float:
+    """Measure the events handled per second.
+
+    :param handler: The event handler
+    :param event: The event to handle
+    :param seconds: The minimum time to spend handling events
+    :returns: The number of events handled per second
+    """
+    count = 0
+    started = time.perf_counter()
+    elapsed = 0.0
+    while elapsed < seconds:
+        handler(event)
+        count += 1
+        elapsed = time.perf_counter() - started
+    return count / elapsed
+
+
+def main() -> None:
+    """Run the benchmark and print the throughput of each handler at each log level."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--packages", type=int, default=2000, help="packages in the facts")
+    parser.add_argument("--seconds", type=float, default=2.0, help="time for each measurement")
+    args = parser.parse_args()
+
+    event = facts_event(args.packages)
+    with Path(os.devnull).open(mode="w", encoding="utf-8") as devnull:
+        logging.basicConfig(stream=devnull, force=True)
+        for level in (logging.WARNING, logging.DEBUG):
+            logging.getLogger().setLevel(level)
+            queue: Queue[Any] = Queue()
+            runner = CommandAsync(executable_cmd="true", queue=queue, write_job_events=False)
+            # pylint: disable=protected-access
+            handlers = {
+                "deepcopy": replaced_handler(runner._logger, queue),
+                "current": runner._event_handler,
+            }
+            for name, handler in handlers.items():
+                rate = throughput(handler, event, args.seconds)
+                queue.queue.clear()
+                print(f"{logging.getLevelName(level).lower():<8} {name:<9} {rate:>12,.0f} events/s")
+        # The runners log when they are deleted, after the log file is closed
+        logging.getLogger().setLevel(logging.WARNING)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,143 @@
+"""Test the collection content menu and plugin content."""
+
+from __future__ import annotations
+
+import json
+
+from copy import deepcopy
+from typing import TYPE_CHECKING
+from typing import Any
+
+import pytest
+
+from ansible_navigator.actions.collections import Action
+from ansible_navigator.actions.collections import CollectionContents
+from ansible_navigator.configuration_subsystem import NavigatorConfiguration
+from ansible_navigator.data.catalog_collections import summarize_plugins
+from ansible_navigator.steps import Step
+from ansible_navigator.utils.key_value_store import KeyValueStore
+
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from pytest_mock import MockerFixture
+
+
+def _collection() -> dict[str, Any]:
+    """Provide a collection with two modules.
+
+    :returns: The collection
+    """
+    return {
+        "collection_info": {},
+        "hidden_by": [],
+        "known_as": "company.name",
+        "path": "/collections/company/name",
+        "plugin_checksums": {
+            "checksum_0": {"path": "plugins/modules/ping.py", "type": "module"},
+            "checksum_1": {"path": "plugins/modules/pong.py", "type": "module"},
+        },
+        "roles": [],
+        "runtime": {"plugin_routing": {"modules": {"pong": {"deprecation": {}}}}},
+    }
+
+
+@pytest.fixture(name="action")
+def fixture_action(tmp_path: Path) -> Action:
+    """Provide a collections action with a populated collection doc cache.
+
+    :param tmp_path: A temporary directory
+    :returns: The collections action
+    """
+    collection_cache = KeyValueStore(tmp_path / "collection_doc_cache.db")
+    for idx, name in enumerate(("ping", "pong")):
+        doc = {"module": name, "short_description": f"The {name} module"}
+        collection_cache[f"checksum_{idx}"] = json.dumps({"plugin": {"doc": doc}})
+    collection_cache.close()
+
+    action = Action(args=deepcopy(NavigatorConfiguration))
+    # pylint: disable=protected-access
+    action._collection_cache = collection_cache
+    action._collections = [_collection()]
+    action.steps.append(Step(name="all_collections", step_type="menu", value=[], index=0))
+    return action
+
+
+@pytest.mark.parametrize("summarized", (True, False), ids=("summarized", "not-summarized"))
+def test_collection_content_menu(action: Action, mocker: MockerFixture, summarized: bool) -> None:
+    """Test the menu is the same with or without summaries and docs are loaded when selected.
+
+    :param action: The collections action
+    :param mocker: The mocker fixture
+    :param summarized: Whether the plugin summaries have been stored
+    """
+    # pylint: disable=protected-access
+    collection_cache = action._collection_cache
+    if summarized:
+        collection_cache.open_()
+        collections = {"path": action._collections[0]}
+        summarize_plugins(collection_cache, collections, {})
+        collection_cache.close()
+    get_docs = mocker.spy(collection_cache, "get_many")
+    get_doc = mocker.spy(KeyValueStore, "__getitem__")
+
+    step = action._build_collection_content_menu()
+    menu = [{key: entry[key] for key in step.columns} for entry in step.value]
+    assert menu == [
+        {
+            "__company.name": "ping",
+            "__type": "module",
+            "__added": None,
+            "__deprecated": "False",
+            "__description": "The ping module",
+        },
+        {
+            "__company.name": "pong",
+            "__type": "module",
+            "__added": None,
+            "__deprecated": "True",
+            "__description": "The pong module",
+        },
+    ]
+    assert len(get_docs.spy_return) == (0 if summarized else 2)
+    assert get_doc.call_count == 0
+
+    action.steps.append(step)
+    action.steps.current.index = 1
+    assert step.select_func is not None
+    content = step.select_func()
+    assert isinstance(content.value, CollectionContents)
+    plugin = content.value[1]
+    assert plugin["full_name"] == "company.name.pong"
+    assert plugin["doc"]["module"] == "pong"
+    assert plugin["additional_information"] == {"deprecation": {}}
+    assert content.value[1] is plugin
+    assert get_doc.call_count == (1 if summarized else 0)
+
+
+def test_collection_content_menu_shared(action: Action, tmp_path: Path) -> None:
+    """Test plugin summaries missing from the collection doc cache are read from a shared one.
+
+    :param action: The collections action
+    :param tmp_path: A temporary directory
+    """
+    # pylint: disable=protected-access
+    collections = {"path": action._collections[0]}
+    shared = action._collection_cache
+    shared.open_()
+    summarize_plugins(shared, collections, {})
+    shared.close()
+    local = KeyValueStore(
+        tmp_path / "local.db",
+        layers=[KeyValueStore(shared.path, read_only=True)],
+    )
+    local.close()
+    action._collection_cache = local
+
+    step = action._build_collection_content_menu()
+    assert [entry["__description"] for entry in step.value] == [
+        "The ping module",
+        "The pong module",
+    ]
+    assert all("__checksum" in entry for entry in step.value)
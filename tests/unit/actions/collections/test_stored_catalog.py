@@ -0,0 +1,85 @@
+"""Test the collection catalog is stored and used while the collections are unchanged."""
+
+from __future__ import annotations
+
+import json
+
+from copy import deepcopy
+from typing import TYPE_CHECKING
+
+from ansible_navigator.actions.collections import Action
+from ansible_navigator.configuration_subsystem import NavigatorConfiguration
+from ansible_navigator.initialization import parse_and_update
+
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from pytest_mock import MockerFixture
+
+
+def test_stored_catalog(tmp_path: Path, mocker: MockerFixture) -> None:
+    """Test the catalog script is only run again when a collection changes, or to compact.
+
+    :param tmp_path: A temporary directory
+    :param mocker: The mocker fixture
+    """
+    collections_dir = tmp_path / "collections"
+    collection_path = collections_dir / "ansible_collections" / "company" / "name"
+    collection_path.mkdir(parents=True)
+    (collection_path / "galaxy.yml").write_text("version: 1.0.0", encoding="utf-8")
+    collection = {
+        "collection_info": {"version": "1.0.0"},
+        "hidden_by": [],
+        "known_as": "company.name",
+        "path": str(collection_path),
+        "plugin_checksums": {},
+        "roles": [],
+    }
+    output = json.dumps(
+        {
+            "collection_scan_paths": str(collections_dir),
+            "collections": {str(collection_path): collection},
+            "errors": [],
+            "messages": [],
+            "stats": {},
+        },
+    )
+
+    settings = deepcopy(NavigatorConfiguration)
+    settings.internals.initializing = True
+    cdc_path = tmp_path / "collection_doc_cache.db"
+    params = ["collections", "--ee", "false", "--cdcp", str(cdc_path), "--pp", "never"]
+    _messages, exit_messages = parse_and_update(params=params, args=settings, attach_cdc=True)
+    assert not exit_messages
+    collection_cache = settings.internals.collection_doc_cache
+    command = mocker.patch("ansible_navigator.actions.collections.Command")
+    command.return_value.run.return_value = (output, "", 0)
+
+    def catalog() -> list[str]:
+        """Catalog the collections with a new action.
+
+        :returns: The names of the collections
+        """
+        action = Action(args=settings)
+        # pylint: disable=protected-access
+        action._calling_app = mocker.Mock(args=settings)
+        action._collection_cache = collection_cache
+        action._collection_cache_path = str(cdc_path)
+        action._run_runner()
+        return [collection["__name"] for collection in action._collections]
+
+    assert catalog() == ["company.name"]
+    assert command.call_count == 1
+    assert catalog() == ["company.name"]
+    assert command.call_count == 1
+
+    (collection_path / "galaxy.yml").write_text("version: 1.0.1", encoding="utf-8")
+    assert catalog() == ["company.name"]
+    assert command.call_count == 2
+
+    # Compacting the collection doc cache requires the catalog script
+    settings.entry("collection_doc_cache_compact").value.current = True
+    assert catalog() == ["company.name"]
+    assert command.call_count == 3
+    assert "--compact" in command.call_args.kwargs["cmdline"]
@@ -25,6 +25,7 @@ from ansible_navigator.actions.run import Action as action
 from ansible_navigator.configuration_subsystem import NavigatorConfiguration
 from ansible_navigator.configuration_subsystem.definitions import Constants
 from ansible_navigator.initialization import parse_and_update
+from ansible_navigator.utils.playbook_artifact import ArtifactReader
 from tests.defaults import BaseScenario
 
 
@@ -271,3 +272,239 @@ def test_artifact_contents(monkeypatch: pytest.MonkeyPatch, mocker: MockerFixtur
 
     settings_sources = mocked_write.call_args[1]["content"]["settings_sources"]
     assert settings_sources["ansible-navigator.app"] == Constants.USER_CLI.value
+
+
+def test_artifact_stream(
+    monkeypatch: pytest.MonkeyPatch,
+    mocker: MockerFixture,
+    tmp_path: pathlib.Path,
+) -> None:
+    """Test a streaming artifact is written as events are handled and can be replayed.
+
+    :param monkeypatch: The monkeypatch fixture
+    :param mocker: The mocker fixture
+    :param tmp_path: A temporary directory
+    """
+    # pylint: disable=protected-access
+    monkeypatch.setattr(action, "_get_status", get_status)
+    args = deepcopy(NavigatorConfiguration)
+    args.entry("playbook").value.current = "site.yml"
+    args.entry("playbook_artifact_enable").value.current = True
+    args.entry("time_zone").value.current = "UTC"
+    args.entry("playbook_artifact_save_as").value.current = str(
+        tmp_path / "{playbook_status}.jsonl",
+    )
+
+    run_action = action(args=args)
+    run_action._open_artifact_stream()
+    messages: list[dict[str, Any]] = [
+        {"stdout": "PLAY [all]", "event": "playbook_on_play_start", "event_data": {"name": "all"}},
+        {"event": "runner_on_start", "event_data": {"task": "t", "task_action": "debug"}},
+        {"stdout": "ok: [host]", "event": "runner_on_ok", "event_data": {"duration": 1}},
+    ]
+    ids = {"play_uuid": "p1", "task_uuid": "t1", "host": "host", "ignore_errors": False}
+    messages[0]["event_data"]["uuid"] = "p1"
+    messages[1]["event_data"].update(ids)
+    messages[2]["event_data"].update({**ids, "task": "t", "res": {"changed": True}})
+    for message in messages:
+        run_action._queue.put(message)
+    run_action._dequeue()
+
+    running = tmp_path / "running.jsonl"
+    assert running.read_text(encoding="utf-8").count("\n") == 6
+
+    run_action.write_artifact()
+    assert not running.exists()
+    artifact = tmp_path / "successful.jsonl"
+    reader = ArtifactReader(artifact)
+    assert reader.header is not None
+    assert reader.header["version"] == "3.0.0"
+    trailer = reader.trailer()
+    assert trailer is not None
+    assert trailer["status"] == "successful"
+
+    args.entry("app").value.current = "replay"
+    args.entry("mode").value.current = "interactive"
+    replay_action = action(args=args)
+    replay_action._interaction = mocker.Mock()
+    assert replay_action._replay_stream(reader) is True
+    replay_action._interaction.ui.update_status.assert_called_once_with("successful", 0)
+    assert list(replay_action.stdout) == list(run_action.stdout)
+
+    # The plays are shown right away, the tasks are read when the play is selected
+    (replay_play,) = replay_action._plays.value
+    (run_play,) = run_action._plays.value
+    assert not replay_play["tasks"]
+    assert replay_play["__changed"] == run_play["__changed"] == 1
+    replay_action.steps.append(replay_action._plays)
+    replay_action._plays.index = 0
+    task_list = replay_action._task_list_for_play()
+    assert task_list.value[0]["__result"] == "Ok"
+    assert "res" not in task_list.value[0]
+
+    replay_action.steps.append(task_list)
+    task_list.index = 0
+    task = replay_action._task_from_artifact(replay_action._artifact_tasks["p1"])
+    assert task.selected == run_play["tasks"][0]
+
+
+def test_artifact_stream_incomplete(
+    mocker: MockerFixture,
+    tmp_path: pathlib.Path,
+) -> None:
+    """Test a streaming artifact without a trailer is replayed from every record.
+
+    :param mocker: The mocker fixture
+    :param tmp_path: A temporary directory
+    """
+    # pylint: disable=protected-access
+    artifact = tmp_path / "artifact.jsonl"
+    artifact.write_text(
+        '{"version": "3.0.0"}\n'
+        '{"stdout": ["PLAY [all]"]}\n'
+        '{"play": {"uuid": "p1", "__play_name": "all"}}\n'
+        '{"task": {"play_uuid": "p1", "task_uuid": "t1", "host": "host", '
+        '"__result": "In progress", "__changed": "unknown"}}\n'
+        '{"task": {"play_uuid": "p1", "task_uuid": "t1", "host": "host", '
+        '"__result": "Ok", "__changed": false}}\n'
+        '{"stdout": ["ok: [ho',
+        encoding="utf-8",
+    )
+    args = deepcopy(NavigatorConfiguration)
+    args.entry("app").value.current = "replay"
+    args.entry("mode").value.current = "interactive"
+    replay_action = action(args=args)
+    replay_action._interaction = mocker.Mock()
+
+    reader = ArtifactReader(artifact)
+    assert reader.trailer() is None
+    assert replay_action._replay_stream(reader) is True
+    replay_action._interaction.ui.update_status.assert_called_once_with("incomplete", 13)
+    assert list(replay_action.stdout) == ["PLAY [all]"]
+    (play,) = replay_action._plays.value
+    assert [task["__result"] for task in play["tasks"]] == ["Ok"]
+    assert play["__ok"] == 1
+
+
+@pytest.mark.parametrize("suffix", (".json.gz", ".jsonl.gz"), ids=("document", "stream"))
+def test_artifact_compressed(
+    monkeypatch: pytest.MonkeyPatch,
+    capsys: pytest.CaptureFixture[str],
+    tmp_path: pathlib.Path,
+    suffix: str,
+) -> None:
+    """Test a compressed artifact is written and replayed transparently.
+
+    :param monkeypatch: The monkeypatch fixture
+    :param capsys: The capture fixture
+    :param tmp_path: A temporary directory
+    :param suffix: The artifact file name suffix
+    """
+    # pylint: disable=protected-access
+    monkeypatch.setattr(action, "_get_status", get_status)
+    args = deepcopy(NavigatorConfiguration)
+    args.entry("playbook").value.current = "site.yml"
+    args.entry("time_zone").value.current = "UTC"
+    run_action = action(args=args)
+    run_action.stdout.extend(["PLAY [all]", "ok: [host]"])
+    task = {"play_uuid": "p1", "task_uuid": "t1", "host": "host", "__result": "Ok", "res": {}}
+    run_action._plays.value = [{"uuid": "p1", "__play_name": "all", "tasks": [task]}]
+
+    artifact = tmp_path / f"artifact{suffix}"
+    run_action.write_artifact(filename=str(artifact))
+    assert artifact.read_bytes()[:2] == b"\x1f\x8b"
+
+    args.entry("app").value.current = "replay"
+    args.entry("mode").value.current = "stdout"
+    args.entry("display_color").value.current = False
+    args.entry("playbook_artifact_replay").value.current = str(artifact)
+    replay_action = action(args=args)
+    assert replay_action._init_replay() is True
+    assert capsys.readouterr().out.splitlines() == list(run_action.stdout)
+
+    reader = ArtifactReader(artifact)
+    if suffix == ".jsonl.gz":
+        assert reader.header is not None
+        trailer = reader.trailer()
+        assert trailer is not None
+        task_index = trailer["index"]["plays"]["p1"]["task_index"]
+        ((offset, _summary),) = reader.read_record(task_index)["task_index"]
+        assert reader.read_record(offset)["task"] == task
+    else:
+        assert reader.header is None
+
+
+@pytest.mark.parametrize("suffix", (".json.gz", ".jsonl.gz"), ids=("document", "stream"))
+def test_artifact_compressed_truncated(
+    monkeypatch: pytest.MonkeyPatch,
+    capsys: pytest.CaptureFixture[str],
+    tmp_path: pathlib.Path,
+    suffix: str,
+) -> None:
+    """Test a compressed artifact cut short, by a run that did not complete, does not fail replay.
+
+    :param monkeypatch: The monkeypatch fixture
+    :param capsys: The capture fixture
+    :param tmp_path: A temporary directory
+    :param suffix: The artifact file name suffix
+    """
+    # pylint: disable=protected-access
+    monkeypatch.setattr(action, "_get_status", get_status)
+    args = deepcopy(NavigatorConfiguration)
+    args.entry("playbook").value.current = "site.yml"
+    args.entry("time_zone").value.current = "UTC"
+    run_action = action(args=args)
+    monkeypatch.setattr("ansible_navigator.actions.run.ARTIFACT_STDOUT_LINES", 100)
+    run_action.stdout.extend(f"ok: [{os.urandom(16).hex()}]" for _number in range(2000))
+    run_action._plays.value = [{"uuid": "p1", "__play_name": "all", "tasks": []}]
+    artifact = tmp_path / f"artifact{suffix}"
+    run_action.write_artifact(filename=str(artifact))
+    artifact.write_bytes(artifact.read_bytes()[: artifact.stat().st_size // 2])
+
+    args.entry("app").value.current = "replay"
+    args.entry("mode").value.current = "stdout"
+    args.entry("display_color").value.current = False
+    args.entry("playbook_artifact_replay").value.current = str(artifact)
+    replay_action = action(args=args)
+    if suffix == ".json.gz":
+        # Nothing can be replayed from part of a single json document
+        assert replay_action._init_replay() is False
+        return
+    assert ArtifactReader(artifact).trailer() is None
+    assert replay_action._init_replay() is True
+    replayed = capsys.readouterr().out.splitlines()
+    assert replayed
+    assert replayed == list(run_action.stdout)[: len(replayed)]
+
+
+def test_artifact_compressed_decompressed_once(
+    monkeypatch: pytest.MonkeyPatch,
+    mocker: MockerFixture,
+    tmp_path: pathlib.Path,
+) -> None:
+    """Test the records of a compressed streaming artifact are read without decompressing again.
+
+    :param monkeypatch: The monkeypatch fixture
+    :param mocker: The mocker fixture
+    :param tmp_path: A temporary directory
+    """
+    # pylint: disable=protected-access
+    monkeypatch.setattr(action, "_get_status", get_status)
+    args = deepcopy(NavigatorConfiguration)
+    args.entry("playbook").value.current = "site.yml"
+    args.entry("time_zone").value.current = "UTC"
+    run_action = action(args=args)
+    run_action.stdout.extend(["PLAY [all]", "ok: [host]"])
+    run_action._plays.value = [{"uuid": "p1", "__play_name": "all", "tasks": []}]
+    artifact = tmp_path / "artifact.jsonl.gz"
+    run_action.write_artifact(filename=str(artifact))
+
+    reader = ArtifactReader(artifact)
+    decompress = mocker.spy(reader, "_decompress")
+    trailer = reader.trailer()
+    assert trailer is not None
+    stdout = [reader.read_record(offset)["stdout"] for offset in trailer["index"]["stdout"]]
+    assert stdout == [["PLAY [all]", "ok: [host]"]]
+    assert list(reader.records())
+    # The artifact was decompressed when the header was read
+    assert decompress.call_count == 0
@@ -0,0 +1,196 @@
+"""Unit tests for runner message handling in the run action."""
+
+from __future__ import annotations
+
+from copy import deepcopy
+from typing import TYPE_CHECKING
+from typing import Any
+
+import pytest
+
+from ansible_navigator.actions.run import Action as action
+from ansible_navigator.configuration_subsystem import NavigatorConfiguration
+from ansible_navigator.runner import RUNNER_FINISHED
+
+
+if TYPE_CHECKING:
+    from pytest_mock import MockerFixture
+
+
+def play_start(play_uuid: str, name: str) -> dict[str, Any]:
+    """Build a play start message.
+
+    :param play_uuid: The uuid of the play
+    :param name: The name of the play
+    :returns: The runner message
+    """
+    return {
+        "event": "playbook_on_play_start",
+        "event_data": {"name": name, "uuid": play_uuid},
+    }
+
+
+def runner_on(
+    runner_event: str,
+    play_uuid: str,
+    task_uuid: str,
+    host: str,
+    **kwargs: Any,
+) -> dict[str, Any]:
+    """Build a runner on event message.
+
+    :param runner_event: The runner event suffix, e.g. ok
+    :param play_uuid: The uuid of the parent play
+    :param task_uuid: The uuid of the task
+    :param host: The host the task ran against
+    :param kwargs: Additional event data
+    :returns: The runner message
+    """
+    event_data = {
+        "duration": 1,
+        "host": host,
+        "ignore_errors": False,
+        "play_uuid": play_uuid,
+        "task": "task",
+        "task_action": "debug",
+        "task_uuid": task_uuid,
+    }
+    event_data.update(kwargs)
+    return {"event": f"runner_on_{runner_event}", "event_data": event_data}
+
+
+@pytest.fixture(name="run_action")
+def fixture_run_action() -> action:
+    """Provide a run action instance.
+
+    :returns: The run action
+    """
+    args = deepcopy(NavigatorConfiguration)
+    args.entry("playbook").value.current = "site.yml"
+    return action(args=args)
+
+
+def test_task_lookup(run_action: action) -> None:
+    """Test the finished task event updates the matching play and task.
+
+    :param run_action: The run action
+    """
+    # pylint: disable=protected-access
+    run_action._handle_message(play_start("p1", "play_1"))
+    run_action._handle_message(play_start("p2", "play_2"))
+    for host in ("host_1", "host_2"):
+        run_action._handle_message(runner_on("start", "p2", "t1", host))
+    run_action._handle_message(runner_on("ok", "p2", "t1", "host_2", res={"changed": True}))
+
+    play_1, play_2 = run_action._plays.value
+    assert not play_1["tasks"]
+    task_1, task_2 = play_2["tasks"]
+    assert task_1["__result"] == "In progress"
+    assert task_2["__result"] == "Ok"
+    assert task_2["__changed"] is True
+
+
+def test_orphaned_events(run_action: action, caplog: pytest.LogCaptureFixture) -> None:
+    """Test events without a parent play or task are discarded.
+
+    :param run_action: The run action
+    :param caplog: The log capture fixture
+    """
+    # pylint: disable=protected-access
+    run_action._handle_message(runner_on("start", "missing", "t1", "host_1"))
+    assert "Playbook event without parent play" in caplog.text
+
+    run_action._handle_message(play_start("p1", "play_1"))
+    run_action._handle_message(runner_on("ok", "p1", "t1", "host_1"))
+    assert "Task event without parent task" in caplog.text
+    assert not run_action._plays.value[0]["tasks"]
+
+
+def test_play_counters(run_action: action) -> None:
+    """Test the play counters follow tasks from in progress to their result.
+
+    :param run_action: The run action
+    """
+    # pylint: disable=protected-access
+    run_action._handle_message(play_start("p1", "play_1"))
+    for host in ("host_1", "host_2", "host_3"):
+        run_action._handle_message(runner_on("start", "p1", "t1", host))
+    play = run_action._plays.value[0]
+    assert play["__in progress"] == 3
+    assert play["__task_count"] == 3
+
+    run_action._handle_message(runner_on("ok", "p1", "t1", "host_1", res={"changed": True}))
+    run_action._handle_message(runner_on("failed", "p1", "t1", "host_2"))
+    run_action._handle_message(runner_on("failed", "p1", "t1", "host_3", ignore_errors=True))
+    run_action._play_stats()
+
+    expected = {
+        "__ok": 1,
+        "__changed": 1,
+        "__failed": 1,
+        "__ignored": 1,
+        "__in progress": 0,
+        "__skipped": 0,
+        "__task_count": 3,
+        "__progress": "100%",
+    }
+    assert {key: play[key] for key in expected} == expected
+
+
+def test_count_play_stats(run_action: action) -> None:
+    """Test the play counters can be rebuilt from the tasks, as done for a replay.
+
+    :param run_action: The run action
+    """
+    # pylint: disable=protected-access
+    run_action._handle_message(play_start("p1", "play_1"))
+    run_action._handle_message(runner_on("start", "p1", "t1", "host_1"))
+    run_action._handle_message(runner_on("skipped", "p1", "t1", "host_1"))
+    run_action._handle_message(runner_on("start", "p1", "t2", "host_1"))
+    play = run_action._plays.value[0]
+    counted = {key: value for key, value in play.items() if key.startswith("__")}
+
+    run_action._count_play_stats(play)
+    assert {key: value for key, value in play.items() if key.startswith("__")} == counted
+    assert play["__skipped"] == 1
+    assert play["__in progress"] == 1
+
+
+def test_dequeue(run_action: action) -> None:
+    """Test the queue is drained in one pass until the runner signals it has finished.
+
+    :param run_action: The run action
+    """
+    # pylint: disable=protected-access
+    assert run_action._dequeue(timeout=0.01) is False
+    assert run_action._first_message_received is False
+
+    run_action._queue.put(play_start("p1", "play_1"))
+    run_action._queue.put(runner_on("start", "p1", "t1", "host_1"))
+    assert run_action._dequeue(timeout=0.01) is False
+    assert run_action._first_message_received is True
+    assert run_action._queue.empty()
+
+    run_action._queue.put(runner_on("ok", "p1", "t1", "host_1"))
+    run_action._queue.put(RUNNER_FINISHED)
+    assert run_action._dequeue() is True
+    assert run_action._plays.value[0]["__ok"] == 1
+
+
+def test_rerun_closes_stdout(mocker: MockerFixture) -> None:
+    """Test the stdout of the previous run, and it's spill file, is closed on rerun.
+
+    :param mocker: The mocker fixture
+    """
+    # pylint: disable=protected-access
+    run_action = action(args=deepcopy(NavigatorConfiguration))
+    run_action._subaction_type = "run"
+    run_action.runner = mocker.Mock(finished=True)
+    mocker.patch.object(run_action, "_run_runner")
+    previous = run_action.stdout
+    close = mocker.spy(previous, "close")
+
+    run_action.rerun()
+
+    close.assert_called_once_with()
+    assert run_action.stdout is not previous
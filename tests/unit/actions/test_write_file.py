@@ -0,0 +1,43 @@
+"""Unit tests for the ``:write`` action."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from ansible_navigator.actions.write_file import Action as action
+from ansible_navigator.configuration_subsystem import NavigatorConfiguration
+from ansible_navigator.utils.stdout_store import StdoutStore
+
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from pytest_mock import MockerFixture
+
+
+@pytest.mark.parametrize("filename", ("out.txt", "out.json", "out.yaml"))
+def test_write_stdout(tmp_path: Path, mocker: MockerFixture, filename: str) -> None:
+    """Test the stdout of a run, including lines spilled to disk, is written as text.
+
+    :param tmp_path: A temporary directory
+    :param mocker: The mocker fixture
+    :param filename: The name of the file written
+    """
+    stdout = StdoutStore(memory_lines=4)
+    stdout.extend(f"line {number}" for number in range(10))
+    assert stdout.spilled
+    interaction = mocker.Mock()
+    interaction.action.match.groupdict.return_value = {
+        "append": None,
+        "filename": str(tmp_path / filename),
+        "force": None,
+    }
+    interaction.content.showing = stdout
+
+    action(args=NavigatorConfiguration).run(interaction=interaction, app=mocker.Mock())
+
+    expected = "\n".join(f"line {number}" for number in range(10))
+    assert (tmp_path / filename).read_text(encoding="utf-8") == expected
+    stdout.close()
@@ -0,0 +1,110 @@
+"""Unit tests for image inspection."""
+
+from __future__ import annotations
+
+import json
+import subprocess
+
+from typing import TYPE_CHECKING
+from typing import Any
+
+import pytest
+
+from ansible_navigator.image_manager import inspect_all
+
+
+if TYPE_CHECKING:
+    from pytest_mock import MockerFixture
+
+
+IMAGES = {
+    "0123456789ab": {"repository": "quay.io/org/ee", "tag": "latest"},
+    "ba9876543210": {"repository": "docker.io/library/python", "tag": "3.12"},
+    "aaaaaaaaaaaa": {"repository": "localhost/untagged", "tag": "<none>"},
+}
+
+
+def fake_engine(removed: set[str], partial: bool) -> Any:
+    """Build a stand in for the container engine, listing and inspecting the images.
+
+    :param removed: The ids of images removed after first being listed
+    :param partial: Whether the images found are output when another can not be inspected
+    :returns: A replacement for ``subprocess.run``
+    """
+    listings = []
+
+    def run(command: str, **_kwargs: Any) -> subprocess.CompletedProcess[str]:
+        """Respond to a container engine command.
+
+        :param command: The command line
+        :param _kwargs: The other arguments to ``subprocess.run``
+        :raises CalledProcessError: When an image to inspect was removed
+        :returns: The completed process
+        """
+        args = command.split(" ")
+        if args[1] == "images":
+            lines = [
+                json.dumps({**image, "image_id": image_id, "created": "2 days", "size": "1GB"})
+                for image_id, image in IMAGES.items()
+                if not listings or image_id not in removed
+            ]
+            listings.append(command)
+            return subprocess.CompletedProcess(command, 0, stdout="\n".join(lines) + "\n")
+        image_ids = args[3:]
+        inspections = [
+            {"Id": f"sha256:{image_id}{'f' * 52}", "Config": {"WorkingDir": "/runner"}}
+            for image_id in image_ids
+            if image_id not in removed
+        ]
+        if removed.intersection(image_ids):
+            output = json.dumps(inspections) if partial else ""
+            raise subprocess.CalledProcessError(1, command, output=output, stderr="no such image")
+        return subprocess.CompletedProcess(command, 0, stdout=json.dumps(inspections))
+
+    return run
+
+
+@pytest.mark.parametrize(
+    ("removed", "partial", "calls"),
+    (
+        pytest.param(set(), False, 2, id="together"),
+        pytest.param({"ba9876543210"}, True, 3, id="one-removed-partial"),
+        pytest.param({"ba9876543210"}, False, 4, id="one-removed-relisted"),
+        pytest.param({"0123456789ab"}, False, 4, id="first-removed-relisted"),
+    ),
+)
+def test_inspect_all(
+    mocker: MockerFixture,
+    removed: set[str],
+    partial: bool,
+    calls: int,
+) -> None:
+    """Test images are listed, then inspected together, again only if one could not be.
+
+    :param mocker: The mocker fixture
+    :param removed: The ids of images removed after being listed
+    :param partial: Whether the images found are output when another can not be inspected
+    :param calls: The number of container engine commands expected
+    """
+    run = mocker.patch(
+        "ansible_navigator.command_runner.command_runner.subprocess.run",
+        side_effect=fake_engine(removed, partial),
+    )
+
+    images, error = inspect_all(container_engine="podman")
+
+    assert not error
+    assert [image["image_id"] for image in images] == ["0123456789ab", "ba9876543210"]
+    for image in images:
+        if image["image_id"] in removed:
+            assert image["inspect"] == {"details": None, "errors": "no such image"}
+        else:
+            assert image["inspect"]["details"]["id"].startswith(f"sha256:{image['image_id']}")
+            assert image["inspect"]["details"]["config"] == {"working_dir": "/runner"}
+            assert image["inspect"]["errors"] == ""
+    assert run.call_count == calls
+    # Only the images still present are inspected again, together
+    inspections = [call.args[0] for call in run.call_args_list if " inspect " in call.args[0]]
+    assert inspections[0] == "podman image inspect 0123456789ab ba9876543210"
+    remaining = " ".join(image["image_id"] for image in images if image["image_id"] not in removed)
+    assert inspections[1:] in ([], [f"podman image inspect {remaining}"])
@@ -0,0 +1,50 @@
+"""Unit tests for the image introspection cache."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from ansible_navigator.image_manager import IntrospectionCache
+from ansible_navigator.image_manager import introspection_cache
+
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from pytest_mock import MockerFixture
+
+
+def test_introspection_cache(tmp_path: Path, mocker: MockerFixture) -> None:
+    """Test introspections are stored by engine and image ID until the image or version is gone.
+
+    :param tmp_path: A temporary directory
+    :param mocker: The mocker fixture
+    """
+    cache = IntrospectionCache(tmp_path / introspection_cache.INTROSPECTION_CACHE_FILE)
+    assert cache.get("podman", "image_1") is None
+    cache.put("podman", "image_1", '{"python_version": "3.11"}')
+    cache.put("podman", "image_2", '{"python_version": "3.12"}')
+    cache.put("docker", "image_1", '{"python_version": "3.13"}')
+    assert cache.get("podman", "image_1") == '{"python_version": "3.11"}'
+    assert cache.get("docker", "image_1") == '{"python_version": "3.13"}'
+    assert cache.get("docker", "image_2") is None
+
+    # Only the images of the container engine listed are evicted
+    assert cache.evict("podman", ["image_2", "image_3"]) == 1
+    assert cache.get("podman", "image_1") is None
+    assert cache.get("podman", "image_2") == '{"python_version": "3.12"}'
+    assert cache.get("docker", "image_1") == '{"python_version": "3.13"}'
+
+    mocker.patch.object(introspection_cache, "__version__", "0.0.0")
+    assert cache.get("podman", "image_2") is None
+
+
+def test_introspection_cache_unavailable(tmp_path: Path) -> None:
+    """Test introspection continues without a cache when it can not be opened.
+
+    :param tmp_path: A temporary directory
+    """
+    cache = IntrospectionCache(tmp_path / "missing" / introspection_cache.INTROSPECTION_CACHE_FILE)
+    cache.put("podman", "image_1", "{}")
+    assert cache.get("podman", "image_1") is None
+    assert cache.evict("podman", ["image_1"]) == 0
@@ -0,0 +1,142 @@
+"""Unit tests for the image presence cache."""
+
+from __future__ import annotations
+
+import json
+import subprocess
+
+from typing import TYPE_CHECKING
+from typing import Any
+
+import pytest
+
+from ansible_navigator.configuration_subsystem import Constants
+from ansible_navigator.image_manager import ImagePuller
+from ansible_navigator.image_manager import PresenceCache
+from ansible_navigator.image_manager import presence_cache
+from ansible_navigator.utils.key_value_store import KeyValueStore
+
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from pytest_mock import MockerFixture
+
+
+def expire(path: Path, container_engine: str, image: str) -> None:
+    """Store an image as found long ago.
+
+    :param path: The path to the image presence cache
+    :param container_engine: The name of the container engine
+    :param image: The name of the image
+    """
+    store = KeyValueStore(path)
+    store[f"{container_engine} {image}"] = json.dumps({"id": "sha256:1", "found": 0})
+    store.close()
+
+
+def test_presence_cache(tmp_path: Path) -> None:
+    """Test images found are trusted to be present until the time to live passes.
+
+    :param tmp_path: A temporary directory
+    """
+    path = tmp_path / presence_cache.PRESENCE_CACHE_FILE
+    cache = PresenceCache(path, ttl=60)
+    assert cache.get("podman", "ee:1") is None
+    cache.put("podman", "ee:1", "sha256:1")
+    assert cache.get("podman", "ee:1") == "sha256:1"
+    assert cache.get("docker", "ee:1") is None
+
+    expire(path, "podman", "ee:1")
+    assert cache.get("podman", "ee:1") is None
+
+    cache.put("podman", "ee:1", "sha256:1")
+    cache.discard("podman", "ee:1")
+    assert cache.get("podman", "ee:1") is None
+
+    disabled = PresenceCache(tmp_path / "disabled.db", ttl=0)
+    disabled.put("podman", "ee:1", "sha256:1")
+    disabled.discard("podman", "ee:1")
+    assert disabled.get("podman", "ee:1") is None
+    assert not (tmp_path / "disabled.db").exists()
+
+
+@pytest.mark.parametrize(
+    ("pull_policy", "inspect_calls", "pull_required"),
+    (
+        pytest.param("missing", 1, False, id="missing"),
+        pytest.param("never", 1, False, id="never"),
+        pytest.param("tag", 2, True, id="tag"),
+        pytest.param("always", 2, True, id="always"),
+    ),
+)
+def test_puller_presence_cache(
+    tmp_path: Path,
+    mocker: MockerFixture,
+    pull_policy: str,
+    inspect_calls: int,
+    pull_required: bool,
+) -> None:
+    """Test the image is only inspected again when the pull policy pulls it anyway.
+
+    :param tmp_path: A temporary directory
+    :param mocker: The mocker fixture
+    :param pull_policy: The pull policy
+    :param inspect_calls: The number of times the image is expected to be inspected
+    :param pull_required: Whether a pull is expected to be required
+    """
+    run = mocker.patch(
+        "ansible_navigator.image_manager.puller.subprocess.run",
+        return_value=subprocess.CompletedProcess(
+            args=[],
+            returncode=0,
+            stdout=json.dumps([{"Id": "sha256:1"}]).encode(),
+        ),
+    )
+    cache = PresenceCache(tmp_path / presence_cache.PRESENCE_CACHE_FILE, ttl=60)
+
+    def assess() -> Any:
+        """Assess the need to pull the image.
+
+        :returns: The image assessment
+        """
+        image_puller = ImagePuller(
+            container_engine="podman",
+            image="ee:latest",
+            arguments=Constants.NOT_SET,
+            pull_policy=pull_policy,
+            presence_cache=cache,
+        )
+        image_puller.assess()
+        return image_puller.assessment
+
+    assert assess().pull_required is pull_required
+    assert assess().pull_required is pull_required
+    assert run.call_count == inspect_calls
+    expected = None if pull_required else "sha256:1"
+    assert cache.get("podman", "ee:latest") == expected
+
+
+def test_puller_presence_cache_missing(tmp_path: Path, mocker: MockerFixture) -> None:
+    """Test an image no longer present is removed from the presence cache.
+
+    :param tmp_path: A temporary directory
+    :param mocker: The mocker fixture
+    """
+    mocker.patch(
+        "ansible_navigator.image_manager.puller.subprocess.run",
+        side_effect=subprocess.CalledProcessError(1, [], output=b"", stderr=b"no such image"),
+    )
+    path = tmp_path / presence_cache.PRESENCE_CACHE_FILE
+    expire(path, "podman", "ee:1")
+    cache = PresenceCache(path, ttl=60)
+    image_puller = ImagePuller(
+        container_engine="podman",
+        image="ee:1",
+        arguments=Constants.NOT_SET,
+        pull_policy="missing",
+        presence_cache=cache,
+    )
+    image_puller.assess()
+    assert image_puller.assessment.pull_required is True
+    assert KeyValueStore(path).get("podman ee:1") is None
@@ -0,0 +1,61 @@
+"""Unit tests for the async runner event handler."""
+
+from __future__ import annotations
+
+from queue import Queue
+from typing import TYPE_CHECKING
+from typing import Any
+
+import pytest
+
+from ansible_navigator.runner import RUNNER_FINISHED
+from ansible_navigator.runner import CommandAsync
+
+
+if TYPE_CHECKING:
+    from pytest_mock import MockerFixture
+
+
+@pytest.mark.parametrize(
+    ("write_job_events", "detached"),
+    ((False, False), (True, True)),
+    ids=("handed-off", "detached"),
+)
+def test_event_handler(write_job_events: bool, detached: bool) -> None:
+    """Test events are only detached when ansible-runner still needs them.
+
+    :param write_job_events: Whether ansible-runner writes the job events
+    :param detached: Whether the queued event should be a copy
+    """
+    queue: Queue[dict[str, Any]] = Queue()
+    runner = CommandAsync(executable_cmd="true", queue=queue, write_job_events=write_job_events)
+    res = {"changed": False, "stdout_lines": ["line"] * 100}
+    event = {"event": "runner_on_ok", "event_data": {"host": "host", "res": res}}
+
+    # pylint: disable=protected-access
+    assert runner._event_handler(event) is write_job_events
+    queued = queue.get_nowait()
+    assert queued == event
+    assert (queued is not event) is detached
+    assert (queued["event_data"] is not event["event_data"]) is detached
+
+    queued["event_data"]["__result"] = "Ok"
+    assert ("__result" in event["event_data"]) is not detached
+    # The task result itself is never copied
+    assert queued["event_data"]["res"] is res
+
+
+def test_finished_callback(mocker: MockerFixture) -> None:
+    """Test the end of the run is signaled on the queue after the last event.
+
+    :param mocker: The mocker fixture
+    """
+    queue: Queue[dict[str, Any]] = Queue()
+    runner = CommandAsync(executable_cmd="true", queue=queue, write_job_events=False)
+    runner._event_handler({"event": "playbook_on_stats"})  # pylint: disable=protected-access
+    runner.runner_finished_callback(mocker.Mock(status="successful"))
+
+    assert runner.finished is True
+    assert runner.status == "successful"
+    assert queue.get_nowait() == {"event": "playbook_on_stats"}
+    assert queue.get_nowait() is RUNNER_FINISHED
@@ -1,58 +1,365 @@
 """Unit tests for catalog collections."""
 
-import multiprocessing
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import time
 
 from pathlib import Path
+from typing import TYPE_CHECKING
 from typing import Any
 
-from ansible_navigator.data.catalog_collections import worker
+import pytest
+
+from ansible_navigator.data import catalog_collections
+from ansible_navigator.data.catalog_collections import ChecksumCache
+from ansible_navigator.data.catalog_collections import CollectionCatalog
+from ansible_navigator.data.catalog_collections import evict_docs
+from ansible_navigator.data.catalog_collections import retrieve_docs
+from ansible_navigator.data.catalog_collections import sha256_file
+from ansible_navigator.data.catalog_collections import summarize_plugins
+from ansible_navigator.utils.key_value_store import KeyValueStore
+
+
+if TYPE_CHECKING:
+    from pytest_mock import MockerFixture
+
+
+def test_extract_doc_with_failed_get_docstring() -> None:
+    """Test the documentation is extracted from a plugin ``get_docstring`` can not load."""
+    plugin_path = Path("tests/fixtures/common/module_1.py")
+    entry = "microsoft.ad", "12345", plugin_path
+
+    message_type, data = catalog_collections.extract_doc(entry)
+
+    assert message_type == "plugin"
+    assert data[0] == "12345"
+    assert "vCenter" in data[1]
+
+
+def test_extract_doc_with_invalid_plugin_path() -> None:
+    """Test an error is returned for a plugin path that does not exist."""
+    plugin_path = Path("tests/fixtures/common/xyz.py")
+    entry = "microsoft.ad", "12345", plugin_path
+
+    message_type, data = catalog_collections.extract_doc(entry)
+
+    assert message_type == "error"
+    assert data[:2] == ("12345", plugin_path)
+    assert "FileNotFoundError (get_docstring)" in data[2]
 
 
-def test_worker_with_failed_get_docstring() -> None:
-    """Test worker function.
+def test_extract_doc_tiers(tmp_path: Path, mocker: MockerFixture) -> None:
+    """Test the plugin loader is only used for docs extending a doc fragment.
 
-    Test worker function when get_docstring fails and
-     get_doc_withast method is used to parse the content.
+    :param tmp_path: A temporary directory
+    :param mocker: The mocker fixture
     """
-    # Create the queues
-    pending_queue: multiprocessing.Queue[Any] = multiprocessing.Queue()
-    completed_queue: multiprocessing.Queue[Any] = multiprocessing.Queue()
+    plugin_path = tmp_path / "module_2.py"
+    plugin_path.write_text(
+        'DOCUMENTATION = """\nmodule: module_2\nversion_added: 1.0.0\n"""\n'
+        'EXAMPLES = "- name: Use it"\n'
+        "RETURN = {'changed': {'version_added': '1.1.0'}}\n",
+        encoding="utf-8",
+    )
+    from_loader = catalog_collections.get_doc_loader(plugin_path, "company.name")
+    get_doc_loader = mocker.spy(catalog_collections, "get_doc_loader")
+
+    message_type, (checksum, plugin, tier) = catalog_collections.extract_doc(
+        ("company.name", "12345", plugin_path),
+    )
+    assert (message_type, checksum, tier) == ("plugin", "12345", "ast")
+    get_doc_loader.assert_not_called()
+    plugin_doc = json.loads(plugin)["plugin"]
+    assert plugin_doc["doc"]["version_added_collection"] == "company.name"
+    assert plugin_doc["returndocs"]["changed"]["version_added_collection"] == "company.name"
+    assert [plugin_doc[key] for key in ("doc", "examples", "returndocs", "metadata")] == list(
+        from_loader,
+    )
 
+    # The doc fragment can not be found, so the docs are extracted without it
     plugin_path = Path("tests/fixtures/common/module_1.py")
-    collection_name = "microsoft.ad"
-    checksum = "12345"
+    message_type, (_checksum, plugin, tier) = catalog_collections.extract_doc(
+        ("microsoft.ad", "12345", plugin_path),
+    )
+    assert (message_type, tier) == ("plugin", "fallback")
+    get_doc_loader.assert_called_once_with(plugin_path, "microsoft.ad")
+    assert json.loads(plugin)["plugin"]["doc"]["module"] == "vcenter_mod"
+
 
-    # Add an entry to the pending queue
-    entry = collection_name, checksum, plugin_path
-    pending_queue.put(entry)
+def test_checksum_cache(tmp_path: Path, mocker: MockerFixture) -> None:
+    """Test a plugin file is only hashed again when it changes.
 
-    # Add a None entry to signal the end of processing
-    pending_queue.put(None)
+    :param tmp_path: A temporary directory
+    :param mocker: The mocker fixture
+    """
+    plugin_path = tmp_path / "module_1.py"
+    plugin_path.write_text("DOCUMENTATION = ''", encoding="utf-8")
+    an_hour_ago = time.time_ns() - 3_600_000_000_000
+    os.utime(plugin_path, ns=(an_hour_ago, an_hour_ago))
+    expected = hashlib.sha256(plugin_path.read_bytes()).hexdigest()
 
-    worker(pending_queue, completed_queue)
+    collection_cache = KeyValueStore(tmp_path / "collection_doc_cache.db")
+    checksum_cache = ChecksumCache(collection_cache.conn)
+    assert checksum_cache.checksum(plugin_path) == expected
+    checksum_cache.save()
+    collection_cache.close()
 
-    plugin_path, data = completed_queue.get()
-    assert "vCenter" in data[1]
+    collection_cache = KeyValueStore(tmp_path / "collection_doc_cache.db")
+    assert not list(collection_cache.keys())
+    checksum_cache = ChecksumCache(collection_cache.conn)
+    hashed = mocker.patch(
+        "ansible_navigator.data.catalog_collections.sha256_file",
+        side_effect=sha256_file,
+    )
+    assert checksum_cache.checksum(plugin_path) == expected
+    assert checksum_cache.reused == 1
+    hashed.assert_not_called()
 
+    plugin_path.write_text("DOCUMENTATION = 'changed'", encoding="utf-8")
+    assert checksum_cache.checksum(plugin_path) != expected
+    hashed.assert_called_once_with(plugin_path)
+    # Modified moments ago, the checksum could be stale by the next run
+    checksum_cache.save()
+    assert not checksum_cache._updated  # pylint: disable=protected-access
+    assert checksum_cache._known[str(plugin_path)][3] == expected  # pylint: disable=protected-access
+    collection_cache.close()
 
-def test_worker_with_invalid_plugin_path() -> None:
-    """Test the worker function when get_docstring has invalid plugin_path."""
-    pending_queue: multiprocessing.Queue[Any] = multiprocessing.Queue()
-    completed_queue: multiprocessing.Queue[Any] = multiprocessing.Queue()
 
-    plugin_path = Path("tests/fixtures/common/xyz.py")
-    collection_name = "microsoft.ad"
-    checksum = "12345"
+def test_checksum_cache_removed(tmp_path: Path) -> None:
+    """Test the checksums of files no longer found within the directories cataloged are removed.
 
-    # Add an entry to the pending queue
-    entry = collection_name, checksum, plugin_path
-    pending_queue.put(entry)
+    :param tmp_path: A temporary directory
+    """
+    collection_path = tmp_path / "collection"
+    collection_path.mkdir()
+    an_hour_ago = time.time_ns() - 3_600_000_000_000
+    plugin_paths = [collection_path / f"module_{idx}.py" for idx in range(2)]
+    other_path = tmp_path / "collection_other" / "module.py"
+    other_path.parent.mkdir()
+    for path in (*plugin_paths, other_path):
+        path.write_text("DOCUMENTATION = ''", encoding="utf-8")
+        os.utime(path, ns=(an_hour_ago, an_hour_ago))
 
-    # Add a None entry to signal the end of processing
-    pending_queue.put(None)
+    collection_cache = KeyValueStore(tmp_path / "collection_doc_cache.db")
+    checksum_cache = ChecksumCache(collection_cache.conn)
+    for path in (*plugin_paths, other_path):
+        checksum_cache.checksum(path)
+    checksum_cache.save(roots=[str(collection_path)])
 
-    worker(pending_queue, completed_queue)
+    checksum_cache = ChecksumCache(collection_cache.conn)
+    checksum_cache.checksum(plugin_paths[0])
+    checksum_cache.save(roots=[str(collection_path)])
+    rows = collection_cache.conn.execute("SELECT path FROM file_checksums ORDER BY path")
+    assert [row[0] for row in rows] == [str(plugin_paths[0]), str(other_path)]
+    collection_cache.close()
 
-    plugin_path, data = completed_queue.get()
-    assert plugin_path == "error"
-    assert "FileNotFoundError (get_docstring)" in data[2]
+
+def test_retrieve_docs(tmp_path: Path, mocker: MockerFixture) -> None:
+    """Test extracted docs are committed to the cache in batches as they are received.
+
+    :param tmp_path: A temporary directory
+    :param mocker: The mocker fixture
+    """
+    mocker.patch.object(catalog_collections, "COMMIT_BATCH", 2)
+    plugin_path = Path("tests/fixtures/common/module_1.py")
+    missing = [("microsoft.ad", f"checksum_{idx}", plugin_path) for idx in range(4)]
+    missing.append(("microsoft.ad", "checksum_4", Path("tests/fixtures/common/xyz.py")))
+    errors: list[dict[str, str]] = []
+    stats = {"cache_added_success": 0, "cache_added_errors": 0}
+    stats.update({f"docs_from_{tier}": 0 for tier in catalog_collections.DOC_TIERS})
+
+    collection_cache = KeyValueStore(tmp_path / "collection_doc_cache.db")
+    collection_cache.conn = mocker.Mock(wraps=collection_cache.conn)
+    retrieve_docs(collection_cache, errors, missing, stats)
+
+    # Two full batches and the remainder
+    assert collection_cache.conn.commit.call_count == 3
+    assert stats == {
+        "cache_added_success": 4,
+        "cache_added_errors": 1,
+        "docs_from_ast": 0,
+        "docs_from_loader": 0,
+        "docs_from_fallback": 4,
+    }
+    assert errors[0]["path"] == "tests/fixtures/common/xyz.py"
+    reopened = KeyValueStore(tmp_path / "collection_doc_cache.db")
+    assert sorted(reopened.keys()) == [f"checksum_{idx}" for idx in range(5)]
+    assert "vCenter" in reopened["checksum_0"]
+    reopened.close()
+
+
+def test_summarize_plugins(tmp_path: Path) -> None:
+    """Test plugin summaries are stored once for each cached plugin doc.
+
+    :param tmp_path: A temporary directory
+    """
+    collection_cache = KeyValueStore(tmp_path / "collection_doc_cache.db")
+    doc = {"module": "ping", "short_description": "Try to connect", "version_added": 2.9}
+    collection_cache["checksum_0"] = json.dumps({"plugin": {"doc": doc}})
+    collection_cache["checksum_1"] = json.dumps({"plugin": {"doc": None}})
+    collection_cache["checksum_2"] = json.dumps({"error": "SyntaxError"})
+    collections = {
+        "path": {
+            "plugin_checksums": {f"checksum_{idx}": {"type": "module"} for idx in (0, 1, 2, 3)},
+        },
+    }
+    stats: dict[str, Any] = {}
+    summarize_plugins(collection_cache, collections, stats)
+    assert stats["summaries_added"] == 3
+    rows = collection_cache.conn.execute(
+        "SELECT * FROM plugin_summaries ORDER BY checksum",
+    ).fetchall()
+    assert rows == [
+        ("checksum_0", "module", 1, "ping", "Try to connect", "2.9", 0),
+        ("checksum_1", "module", 0, None, None, None, 0),
+        ("checksum_2", "module", 0, None, None, None, 0),
+    ]
+
+    summarize_plugins(collection_cache, collections, stats)
+    assert stats["summaries_added"] == 0
+    collection_cache.close()
+
+
+def test_evict_docs(tmp_path: Path) -> None:
+    """Test plugin docs not in use are evicted by age, then least recently used first by size.
+
+    :param tmp_path: A temporary directory
+    """
+    collection_cache = KeyValueStore(tmp_path / "collection_doc_cache.db")
+    collection_cache["version"] = "1.0"
+    checksums = [f"checksum_{idx}" for idx in range(5)]
+    collection_cache.set_many((checksum, "x" * 300_000) for checksum in checksums)
+    conn = collection_cache.conn
+    with conn:
+        conn.execute("CREATE TABLE plugin_summaries (checksum text, type text)")
+        conn.executemany(
+            "INSERT INTO plugin_summaries VALUES (?, 'module')",
+            ((checksum,) for checksum in checksums),
+        )
+        conn.execute("CREATE TABLE collection_catalogs (settings text)")
+        conn.execute("INSERT INTO collection_catalogs VALUES ('settings')")
+    stats: dict[str, Any] = {}
+
+    # The existing docs are tracked as accessed now
+    evict_docs(
+        collection_cache,
+        {"checksum_0"},
+        [],
+        max_age=90,
+        max_size=0,
+        compact=False,
+        stats=stats,
+    )
+    assert stats == {"docs_evicted": 0, "cache_vacuumed": False}
+    assert conn.execute("SELECT COUNT(*) FROM doc_access").fetchone()[0] == 5
+
+    now = int(time.time())
+    with conn:
+        conn.executemany(
+            "UPDATE doc_access SET accessed = ? WHERE checksum = ?",
+            (
+                (now - days * 86_400, f"checksum_{idx}")
+                for idx, days in enumerate((200, 100, 10, 5, 1))
+            ),
+        )
+    evict_docs(
+        collection_cache,
+        {"checksum_0"},
+        [],
+        max_age=90,
+        max_size=0,
+        compact=False,
+        stats=stats,
+    )
+    assert stats["docs_evicted"] == 1
+    assert "checksum_1" not in collection_cache
+    accessed = dict(conn.execute("SELECT checksum, accessed FROM doc_access"))
+    assert "checksum_1" not in accessed
+    assert accessed["checksum_0"] >= now
+    assert conn.execute("SELECT COUNT(*) FROM plugin_summaries").fetchone()[0] == 4
+    assert conn.execute("SELECT COUNT(*) FROM collection_catalogs").fetchone()[0] == 0
+
+    # The least recently used doc not in use is enough to be within 1 megabyte
+    collection_cache["checksum_5"] = "x" * 100
+    # Compacting removes the checksums of files that no longer exist
+    ChecksumCache(conn)
+    with conn:
+        conn.executemany(
+            "INSERT INTO file_checksums VALUES (?, 0, 0, 0, 'checksum')",
+            ((str(tmp_path / "collection_doc_cache.db"),), (str(tmp_path / "removed.py"),)),
+        )
+    evict_docs(
+        collection_cache,
+        {"checksum_0", "checksum_5"},
+        ["checksum_5"],
+        max_age=0,
+        max_size=1,
+        compact=True,
+        stats=stats,
+    )
+    assert stats == {"docs_evicted": 1, "cache_vacuumed": True}
+    assert sorted(collection_cache.keys()) == [
+        "checksum_0",
+        "checksum_3",
+        "checksum_4",
+        "checksum_5",
+        "version",
+    ]
+    assert sorted(conn.execute("SELECT checksum FROM doc_access")) == [
+        ("checksum_0",),
+        ("checksum_3",),
+        ("checksum_4",),
+        ("checksum_5",),
+    ]
+    assert list(conn.execute("SELECT path FROM file_checksums")) == [
+        (str(tmp_path / "collection_doc_cache.db"),),
+    ]
+    collection_cache.close()
+    assert (tmp_path / "collection_doc_cache.db").stat().st_size < 1024 * 1024
+
+
+@pytest.mark.parametrize("processes", (1, 2), ids=("threads", "processes"))
+def test_process_directories(tmp_path: Path, mocker: MockerFixture, processes: int) -> None:
+    """Test collections are cataloged in order, whether yaml is loaded in threads or processes.
+
+    :param tmp_path: A temporary directory
+    :param mocker: The mocker fixture
+    :param processes: The number of worker processes
+    """
+    mocker.patch.object(catalog_collections, "PROCESSES", processes)
+    directories = [tmp_path / "first", tmp_path / "second"]
+    for directory in directories:
+        for name in ("one", "two"):
+            collection_path = directory / "ansible_collections" / "company" / name
+            (collection_path / "meta").mkdir(parents=True)
+            galaxy = {"namespace": "company", "name": name, "version": directory.name}
+            (collection_path / "galaxy.yml").write_text(json.dumps(galaxy), encoding="utf-8")
+            role_path = collection_path / "roles" / "role"
+            (role_path / "meta").mkdir(parents=True)
+            (role_path / "meta" / "main.yml").write_text("galaxy_info: {}", encoding="utf-8")
+            (role_path / "README.md").write_text("", encoding="utf-8")
+        (collection_path / "meta" / "runtime.yml").write_text("[", encoding="utf-8")
+
+    collections, errors = CollectionCatalog(directories=directories).process_directories()
+
+    paths = list(collections)
+    assert [collections[path]["collection_info"].get("version") for path in paths[:4]] == [
+        "first",
+        "first",
+        "second",
+        "second",
+    ]
+    assert collections[paths[-1]]["known_as"] == "ansible.builtin"
+    assert collections[paths[2]]["hidden_by"] == [paths[0]]
+    assert [role["info"] for role in collections[paths[3]]["roles"]] == [{"galaxy_info": {}}]
+    assert [Path(error["path"]).relative_to(tmp_path).parts[:4:3] for error in errors] == [
+        ("first", "two"),
+        ("second", "two"),
+        ("first", "one"),
+        ("first", "two"),
+        ("second", "one"),
+        ("second", "two"),
+    ]
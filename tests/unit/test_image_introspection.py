@@ -51,6 +51,54 @@ which contains NET-SNMP utilities.
 """
 
 
+#: ``rpm -qi`` for a package without an epoch, packager, vendor, URL or bug URL
+RPM_OUTPUT_MINIMAL = """Name        : hello
+Version     : 2.12.1
+Release     : 1
+Architecture: x86_64
+Install Date: Mon 02 Oct 2023 10:15:00 AM UTC
+Group       : Unspecified
+Size        : 187340
+License     : GPLv3+
+Signature   : (none)
+Source RPM  : hello-2.12.1-1.src.rpm
+Build Date  : Mon 02 Oct 2023 10:00:00 AM UTC
+Build Host  : localhost
+Summary     : Prints a familiar, friendly greeting
+Description :
+The GNU hello program produces a familiar, friendly greeting.
+"""
+
+#: ``rpm -qa --queryformat`` for the same packages, fields separated by \x1f, packages by \x1e
+RPM_QUERY_FORMAT_OUTPUT = (
+    "net-snmp\x1f1\x1f5.9.1\x1f4.fc34\x1fx86_64\x1fTue 19 Oct 2021 09:52:47 AM PDT\x1fUnspecified"
+    "\x1f901010\x1fBSD\x1fRSA/SHA256, Fri 30 Jul 2021 05:06:50 AM PDT, Key ID 1161ae6945719a39"
+    "\x1fnet-snmp-5.9.1-4.fc34.src.rpm\x1fFri 30 Jul 2021 12:23:51 AM PDT"
+    "\x1fbuildvm-x86-03.iad2.fedoraproject.org\x1fFedora Project\x1fFedora Project"
+    "\x1fhttp://net-snmp.sourceforge.net/\x1fhttps://bugz.fedoraproject.org/net-snmp"
+    "\x1fA collection of SNMP protocol tools and libraries"
+    "\x1fSNMP (Simple Network Management Protocol) is a protocol used for\n"
+    "network management. The NET-SNMP project includes various SNMP tools:\n"
+    "an extensible agent, an SNMP library, tools for requesting or setting\n"
+    "information from SNMP agents, tools for generating and handling SNMP\n"
+    "traps, a version of the netstat command which uses SNMP, and a Tk/Perl\n"
+    "mib browser. This package contains the snmpd and snmptrapd daemons,\n"
+    "documentation, etc.\n"
+    "\n"
+    "Name\n"
+    "Name:\n"
+    "Name :\n"
+    "summary: summary_string\n"
+    "version: version_string\n"
+    "\n"
+    "You will probably also want to install the net-snmp-utils package,\n"
+    "which contains NET-SNMP utilities.\x1e"
+    "hello\x1f\x1f2.12.1\x1f1\x1fx86_64\x1fMon 02 Oct 2023 10:15:00 AM UTC\x1fUnspecified"
+    "\x1f187340\x1fGPLv3+\x1f(none)\x1fhello-2.12.1-1.src.rpm\x1fMon 02 Oct 2023 10:00:00 AM UTC"
+    "\x1flocalhost\x1f\x1f\x1f\x1f\x1fPrints a familiar, friendly greeting"
+    "\x1fThe GNU hello program produces a familiar, friendly greeting.\x1e"
+)
+
 @pytest.fixture(scope="module", name="imported_ii")
 def image_introspection() -> types.ModuleType:
     """Import the image introspection script using the share directory.
@@ -104,3 +152,106 @@ def test_system_packages_parse_many(imported_ii: Any) -> None:
         assert entry["description"].endswith("utilities.")
         assert "summary: summary_string" in entry["description"]
         assert "version: version_string" in entry["description"]
+
+
+def test_system_packages_query_format(imported_ii: Any) -> None:
+    """Test the rpm query format output is parsed like the rpm info output of the same packages.
+
+    :param imported_ii: Image introspection
+    """
+    command = imported_ii.Command(
+        id="test",
+        parse=lambda x: x,
+        stdout=RPM_OUTPUT + RPM_OUTPUT_MINIMAL,
+    )
+    imported_ii.SystemPackages().parse(command)
+    expected = command.details
+    assert len(expected) == 2
+
+    command = imported_ii.Command(
+        id="test",
+        parse=lambda x: x,
+        stdout=RPM_QUERY_FORMAT_OUTPUT,
+        errors=[],
+    )
+    imported_ii.SystemPackages().parse_query_format(command)
+    assert command.details == expected
+    # Fields rpm only shows when set are left out, as they are by ``rpm -qi``
+    assert command.details[0]["epoch"] == "1"
+    assert {"epoch", "packager", "vendor", "url", "bug url"}.isdisjoint(command.details[1])
+
+
+def test_python_packages_fall_back(imported_ii: Any, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test python packages are collected with pip when their metadata can not be read.
+
+    :param imported_ii: Image introspection
+    :param monkeypatch: The monkeypatch fixture
+    """
+    python_packages = imported_ii.PythonPackages()
+    command = python_packages.commands[0]
+    command.parse(command)
+    assert {"ansible-core", "pytest"} <= {package["name"] for package in command.details}
+    assert command.command == ""
+
+    def fail() -> None:
+        """Fail to read the package metadata.
+
+        :raises ImportError: Always
+        """
+        raise ImportError
+
+    pip_show = imported_ii.Command(
+        id_="python_packages",
+        command="printf 'Name: ansible-core\nRequires: jinja2, PyYAML\nRequired-by: '",
+        parse=python_packages.parse,
+    )
+    monkeypatch.setattr(python_packages, "distributions", fail)
+    monkeypatch.setattr(python_packages, "pip_commands", lambda: [pip_show])
+    command = python_packages.commands[0]
+    command.parse(command)
+    assert command.command == pip_show.command
+    assert command.details == [
+        {"name": "ansible-core", "requires": ["jinja2", "PyYAML"], "required-by": []},
+    ]
+
+
+def test_command_runner_requires(imported_ii: Any) -> None:
+    """Test commands run once those they require are complete, and are timed.
+
+    :param imported_ii: Image introspection
+    """
+
+    def parse(command: Any) -> None:
+        """Keep the output of a command.
+
+        :param command: The result of running the command
+        """
+        command.details = command.stdout.strip()
+
+    def prepare(command: Any, prerequisites: dict[str, Any]) -> None:
+        """Build a command from the output of the command it requires.
+
+        :param command: The command to prepare
+        :param prerequisites: The completed commands required
+        """
+        command.command = f"echo {prerequisites['first'].details}-second"
+
+    commands = [
+        imported_ii.Command(
+            id_="second",
+            command="",
+            parse=parse,
+            prepare=prepare,
+            requires=("first",),
+        ),
+        imported_ii.Command(id_="first", command="sleep 0.1 && echo first", parse=parse),
+        imported_ii.Command(id_="other", command="echo other", parse=parse),
+        imported_ii.Command(id_="orphan", command="echo orphan", parse=parse, requires=("none",)),
+    ]
+    results = imported_ii.CommandRunner(max_workers=2).run(commands)
+
+    assert [result.id_ for result in results] == ["other", "first", "second", "orphan"]
+    assert results[2].details == "first-second"
+    assert results[1].duration >= 0.1
+    assert results[3].details == ""
+    assert results[3].errors == ["Required commands did not run: none"]
@@ -0,0 +1,188 @@
+"""Tests for the initialization helpers."""
+
+from __future__ import annotations
+
+import logging
+import sqlite3
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from ansible_navigator._version_doc_cache import __version_collection_doc_cache__ as VERSION_CDC
+from ansible_navigator.initialization import get_and_check_collection_doc_cache
+from ansible_navigator.initialization import get_shared_collection_doc_caches
+from ansible_navigator.utils.key_value_store import KeyValueStore
+from ansible_navigator.utils.version_migration import collection_doc_cache
+
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from pytest_mock import MockerFixture
+
+
+def test_shared_collection_doc_caches(tmp_path: Path) -> None:
+    """Test shared caches with the current version are layered below the collection doc cache.
+
+    :param tmp_path: A temporary directory
+    """
+    (tmp_path / "shared").mkdir()
+    shared_paths = []
+    for name, version in (("current", VERSION_CDC), ("old", "0.1"), ("also_current", VERSION_CDC)):
+        shared = KeyValueStore(tmp_path / "shared" / f"{name}.db")
+        shared.set_many([("version", version), ("checksum", name), (f"checksum_{name}", name)])
+        shared.close()
+        shared_paths.append(shared.path)
+    shared_paths.insert(1, str(tmp_path / "shared" / "missing.db"))
+
+    messages, exit_messages, collection_cache = get_and_check_collection_doc_cache(
+        str(tmp_path / "collection_doc_cache.db"),
+        shared_paths,
+    )
+
+    assert not exit_messages
+    assert collection_cache is not None
+    assert [layer.path for layer in collection_cache.layers] == [
+        shared_paths[0],
+        shared_paths[3],
+    ]
+    warnings = [message.message for message in messages if message.level == logging.WARNING]
+    assert len(warnings) == 2
+    assert "missing.db' not found" in warnings[0]
+    assert f"old.db' version is '0.1', not '{VERSION_CDC}'" in warnings[1]
+
+    collection_cache.open_()
+    assert collection_cache["version"] == VERSION_CDC
+    assert collection_cache.get_many(
+        ["checksum", "checksum_current", "checksum_old", "checksum_also_current"],
+    ) == {
+        "checksum": "current",
+        "checksum_current": "current",
+        "checksum_also_current": "also_current",
+    }
+    collection_cache.close()
+
+
+def test_shared_collection_doc_caches_closed(tmp_path: Path, mocker: MockerFixture) -> None:
+    """Test shared caches skipped are closed, including those that cannot be read.
+
+    :param tmp_path: A temporary directory
+    :param mocker: The mocker fixture
+    """
+    unreadable = tmp_path / "unreadable.db"
+    with sqlite3.connect(unreadable) as conn:
+        conn.execute("CREATE TABLE other (key text)")
+    conn.close()
+    old = KeyValueStore(tmp_path / "old.db")
+    old["version"] = "0.1"
+    old.close()
+    close = mocker.spy(KeyValueStore, "close")
+
+    messages, shared_caches = get_shared_collection_doc_caches([str(unreadable), old.path])
+
+    assert not shared_caches
+    assert close.call_count == 2
+    warnings = [message.message for message in messages if message.level == logging.WARNING]
+    assert "unreadable.db' not readable, skipping: no such table: kv" in warnings[0]
+    assert "old.db' version is '0.1'" in warnings[1]
+
+
+@pytest.mark.parametrize(
+    ("version", "migrated"),
+    (
+        pytest.param("0.8", True, id="migrated"),
+        pytest.param("0.7", False, id="failed"),
+        pytest.param("0.1", False, id="no-migration"),
+    ),
+)
+def test_collection_doc_cache_migration(
+    tmp_path: Path,
+    mocker: MockerFixture,
+    version: str,
+    migrated: bool,
+) -> None:
+    """Test the collection doc cache is migrated in place, or rebuilt if that is not possible.
+
+    :param tmp_path: A temporary directory
+    :param mocker: The mocker fixture
+    :param version: The version of the collection doc cache
+    :param migrated: Whether the cached docs are kept
+    """
+
+    def add_table(cache: KeyValueStore) -> None:
+        """Add a table to the collection doc cache.
+
+        :param cache: The collection doc cache
+        """
+        cache.conn.execute("CREATE TABLE added (checksum text)")
+
+    def fail(cache: KeyValueStore) -> None:
+        """Fail after changing the collection doc cache.
+
+        :param cache: The collection doc cache
+        """
+        cache["checksum"] = "changed"
+        raise ValueError
+
+    mocker.patch.dict(collection_doc_cache.collection_doc_cache_migrations, clear=True)
+    collection_doc_cache.register("0.7", "0.8")(fail)
+    collection_doc_cache.register("0.8", "0.9")(add_table)
+    collection_doc_cache.register("0.9", VERSION_CDC)(lambda cache: None)
+
+    cache_path = tmp_path / "collection_doc_cache.db"
+    cache = KeyValueStore(cache_path)
+    cache.set_many([("version", version), ("checksum", "doc")])
+    if version == "0.7":
+        # Rolled back, the cache is left as it was before being rebuilt
+        with pytest.raises(collection_doc_cache.CollectionDocCacheMigrationError):
+            collection_doc_cache.migrate_collection_doc_cache(cache, VERSION_CDC)
+        assert cache["checksum"] == "doc"
+        assert cache["version"] == "0.7"
+    cache.close()
+
+    messages, exit_messages, collection_cache = get_and_check_collection_doc_cache(
+        str(cache_path),
+    )
+
+    assert not exit_messages
+    assert collection_cache is not None
+    collection_cache.open_()
+    assert collection_cache["version"] == VERSION_CDC
+    assert ("checksum" in collection_cache) is migrated
+    tables = {row[0] for row in collection_cache.conn.execute("SELECT name FROM sqlite_master")}
+    assert ("added" in tables) is migrated
+    collection_cache.close()
+    info = [message.message for message in messages if message.level == logging.INFO]
+    if migrated:
+        assert info == [f"Collection doc cache: migrated 0.8 -> 0.9 -> {VERSION_CDC}"]
+    else:
+        assert "version was empty or incorrect, rebuilding" in info[1]
+
+
+def test_collection_doc_cache_upgrade(tmp_path: Path) -> None:
+    """Test a collection doc cache from before the catalog tables were added is upgraded in place.
+
+    :param tmp_path: A temporary directory
+    """
+    cache_path = tmp_path / "collection_doc_cache.db"
+    cache = KeyValueStore(cache_path)
+    cache.set_many([("version", "1.1"), ("checksum", '{"doc": {}}')])
+    cache.close()
+
+    messages, exit_messages, collection_cache = get_and_check_collection_doc_cache(
+        str(cache_path),
+    )
+
+    assert not exit_messages
+    assert collection_cache is not None
+    info = [message.message for message in messages if message.level == logging.INFO]
+    assert info == [f"Collection doc cache: migrated 1.1 -> {VERSION_CDC}"]
+    collection_cache.open_()
+    assert collection_cache["version"] == VERSION_CDC
+    assert collection_cache["checksum"] == '{"doc": {}}'
+    conn = collection_cache.conn
+    tables = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type='table'")}
+    assert {"file_checksums", "plugin_summaries", "doc_access", "collection_catalogs"} <= tables
+    assert [row[0] for row in conn.execute("SELECT checksum FROM doc_access")] == ["checksum"]
+    collection_cache.close()
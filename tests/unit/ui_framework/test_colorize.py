@@ -2,20 +2,19 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
 from typing import NamedTuple
 from unittest.mock import MagicMock  # pylint: disable=W0407
 from unittest.mock import patch  # pylint: disable=W0407
 
-
-if TYPE_CHECKING:
-    import pytest
+import pytest
 
 from ansible_navigator.constants import GRAMMAR_DIR
 from ansible_navigator.constants import THEME_PATH
 from ansible_navigator.content_defs import ContentFormat
 from ansible_navigator.content_defs import ContentView
 from ansible_navigator.content_defs import SerializationFormat
+from ansible_navigator.tm_tokenize.tokenize import tokenize
+from ansible_navigator.ui_framework.colorize import AnsiLines
 from ansible_navigator.ui_framework.colorize import Colorize
 from ansible_navigator.ui_framework.curses_defs import SimpleLinePart
 from ansible_navigator.utils.serialize import serialize
@@ -189,3 +188,98 @@ def test_styled_markdown() -> None:
     assert result == [
         [SimpleLinePart(chars="This is a header\n", column=0, color=(86, 156, 214), style="bold")],
     ]
+
+
+def test_ansi_lines() -> None:
+    """Ensure lazily converted ansi lines match the lines rendered all at once."""
+    lines = ["\x1b[0;32mok: [host]\x1b[0m", "", "\x1b[0;31mfatal: [host]\x1b[0m"]
+    ansi_lines = AnsiLines(lines)
+
+    expected = Colorize.render_ansi(doc="\n".join(lines))
+    assert len(ansi_lines) == len(expected)
+    assert ansi_lines[1:] == expected[1:]
+    assert ansi_lines[-1] == expected[-1]
+
+
+@pytest.mark.parametrize(
+    ("serialization_format", "scope"),
+    ((SerializationFormat.JSON, "source.json"), (SerializationFormat.YAML, "source.yaml")),
+    ids=("json", "yaml"),
+)
+def test_render_lines(
+    monkeypatch: pytest.MonkeyPatch,
+    serialization_format: SerializationFormat,
+    scope: str,
+) -> None:
+    """Ensure lines rendered as requested match the lines rendered all at once.
+
+    The last lines are requested first, so the chunks before them are tokenized for their
+    checkpoints only.
+
+    :param monkeypatch: The monkeypatch fixture
+    :param serialization_format: The serialization format
+    :param scope: The scope
+    """
+    monkeypatch.setattr("ansible_navigator.ui_framework.colorize.CHUNK_LINES", 4)
+    monkeypatch.setattr("ansible_navigator.ui_framework.colorize.CACHED_CHUNKS", 2)
+    content = {"list": [f"line {idx}" for idx in range(20)], "text": "multi\nline\ntext"}
+    sample = serialize(
+        content=content,
+        content_view=ContentView.NORMAL,
+        serialization_format=serialization_format,
+    )
+    colorize = Colorize(grammar_dir=GRAMMAR_DIR, theme_path=THEME_PATH)
+
+    expected = colorize.render(doc=sample, scope=scope)
+    rendered = colorize.render_lines(doc=sample, scope=scope)
+    assert len(rendered) == len(expected)
+    assert rendered[-3:] == expected[-3:]
+    assert rendered[:] == expected
+    assert colorize.render_lines(doc=sample, scope=scope) is rendered
+
+
+@patch("ansible_navigator.ui_framework.colorize.tokenize")
+def test_render_lines_graceful_failure(
+    mocked_func: MagicMock,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Ensure a tokenization error renders the lines without color.
+
+    :param mocked_func: Mocked fixture
+    :param caplog: Capture log
+    """
+    mocked_func.side_effect = ValueError()
+    sample = serialize(**SAMPLE_YAML)
+
+    rendered = Colorize(grammar_dir=GRAMMAR_DIR, theme_path=THEME_PATH).render_lines(
+        doc=sample,
+        scope="source.yaml",
+    )
+    assert rendered[:] == [
+        [SimpleLinePart(chars=line, column=0, color=None, style=None)]
+        for line in sample.splitlines()
+    ]
+    assert "rendered without color" in caplog.text
+
+
+def test_render_lines_reuse(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Ensure a document with lines appended is only tokenized from the last checkpoint.
+
+    :param monkeypatch: The monkeypatch fixture
+    """
+    monkeypatch.setattr("ansible_navigator.ui_framework.colorize.CHUNK_LINES", 4)
+    colorize = Colorize(grammar_dir=GRAMMAR_DIR, theme_path=THEME_PATH)
+    lines = [f"- item: {idx}" for idx in range(10)]
+    before = colorize.render(doc="\n".join(lines), scope="source.yaml")
+
+    lines.extend(f"- item: {idx}" for idx in range(10, 14))
+    doc = "\n".join(lines)
+    with patch("ansible_navigator.ui_framework.colorize.tokenize", wraps=tokenize) as tokenized:
+        after = colorize.render(doc=doc, scope="source.yaml")
+    # The first 8 lines are covered by the checkpoints of the previous document
+    assert tokenized.call_count == 6
+    assert after[:10] == before
+    assert after == Colorize(grammar_dir=GRAMMAR_DIR, theme_path=THEME_PATH).render(
+        doc=doc,
+        scope="source.yaml",
+    )
@@ -0,0 +1,92 @@
+"""Tests for the collection catalog cache."""
+
+from __future__ import annotations
+
+import os
+
+from typing import TYPE_CHECKING
+
+from ansible_navigator.utils import catalog_cache
+from ansible_navigator.utils.catalog_cache import CatalogCache
+from ansible_navigator.utils.catalog_cache import path_signature
+
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    import pytest
+
+
+def _touch(path: Path, content: str) -> None:
+    """Write a file and move its modification time forward.
+
+    :param path: The file to write
+    :param content: The content of the file
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    mtime_ns = path.stat().st_mtime_ns + 1_000_000_000 if path.exists() else None
+    path.write_text(content, encoding="utf-8")
+    if mtime_ns is not None:
+        os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+def test_path_signature(tmp_path: Path) -> None:
+    """Test the changes to collections that change the signature.
+
+    :param tmp_path: A temporary directory
+    """
+    collections_dir = tmp_path / "collections" / "ansible_collections"
+    installed = collections_dir / "company" / "installed"
+    developed = collections_dir / "company" / "developed"
+    _touch(installed / "MANIFEST.json", "{}")
+    _touch(installed / "FILES.json", "{}")
+    _touch(installed / "plugins" / "modules" / "ping.py", "")
+    _touch(developed / "galaxy.yml", "")
+    _touch(developed / "plugins" / "modules" / "pong.py", "")
+    paths = [str(tmp_path / "collections"), str(installed), str(developed)]
+
+    signature = path_signature(paths)
+    assert path_signature(reversed(paths)) == signature
+
+    # The content of an installed collection is described by its file manifest
+    _touch(installed / "plugins" / "modules" / "ping.py", "DOCUMENTATION = ''")
+    assert path_signature(paths) == signature
+    _touch(installed / "FILES.json", '{"files": []}')
+    assert path_signature(paths) != signature
+
+    signature = path_signature(paths)
+    _touch(developed / "plugins" / "modules" / "pong.py", "DOCUMENTATION = ''")
+    assert path_signature(paths) != signature
+
+    signature = path_signature(paths)
+    (collections_dir / "other").mkdir()
+    assert path_signature(paths) != signature
+
+
+def test_catalog_cache(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test a stored catalog is used until the collection paths change.
+
+    :param tmp_path: A temporary directory
+    :param monkeypatch: The monkeypatch fixture
+    """
+    monkeypatch.setattr(catalog_cache, "CATALOGS_KEPT", 2)
+    collection = tmp_path / "ansible_collections" / "company" / "name"
+    _touch(collection / "galaxy.yml", "")
+    cache = CatalogCache(tmp_path / "collection_doc_cache.db")
+
+    assert cache.get("settings_0") is None
+    cache.put("settings_0", [str(collection)], "catalog_0")
+    assert cache.get("settings_0") == "catalog_0"
+    assert cache.get("settings_1") is None
+
+    _touch(collection / "galaxy.yml", "version: 1.0.0")
+    assert cache.get("settings_0") is None
+
+    # Only the most recently used catalogs are kept
+    cache.put("settings_0", [str(collection)], "catalog_0")
+    cache.put("settings_1", [str(collection)], "catalog_1")
+    assert cache.get("settings_0") == "catalog_0"
+    cache.put("settings_2", [str(collection)], "catalog_2")
+    assert cache.get("settings_0") == "catalog_0"
+    assert cache.get("settings_1") is None
+    assert cache.get("settings_2") == "catalog_2"
@@ -1,7 +1,13 @@
 """Test KVS from ansible_navigator.utils."""
 
+import sqlite3
 import types
 
+from pathlib import Path
+
+import pytest
+
+from ansible_navigator.utils import key_value_store
 from ansible_navigator.utils.key_value_store import KeyValueStore
 
 
@@ -135,3 +141,109 @@ def test_kvs_repr(kvs: KeyValueStore, empty_kvs: KeyValueStore) -> None:
     )
 
     assert repr(empty_kvs) == "KeyValueStore()"
+
+
+def test_kvs_delitem_missing(kvs: KeyValueStore) -> None:
+    """Test KVS __delitem__ with a key that does not exist.
+
+    :param kvs: A key-value store populated with data
+    """
+    with pytest.raises(KeyError):
+        del kvs["cherry"]
+    assert len(kvs) == 4
+
+
+def test_kvs_many(kvs: KeyValueStore, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test KVS get_many(), set_many() and delete_many().
+
+    :param kvs: A key-value store populated with data
+    :param monkeypatch: The monkeypatch fixture
+    """
+    # Look the keys up across more than one query
+    monkeypatch.setattr(key_value_store, "MAX_VARIABLES", 2)
+    assert kvs.get_many(["apple", "grape", "foo", "apple", "banana"]) == {
+        "apple": "red",
+        "banana": "yellow",
+        "grape": "green",
+    }
+    kvs.set_many([("cherry", "red"), ("apple", "green")])
+    assert kvs.get_many(["apple", "cherry"]) == {"apple": "green", "cherry": "red"}
+    kvs.delete_many(["apple", "cherry", "foo"])
+    assert sorted(kvs.keys()) == ["banana", "grape", "strawberry"]
+
+
+def test_kvs_read_only(kvs: KeyValueStore) -> None:
+    """Test a read-only KVS sees the changes of a writer and can not change anything.
+
+    :param kvs: A key-value store populated with data
+    """
+    kvs.conn.commit()
+    reader = KeyValueStore(kvs.path, read_only=True)
+    assert reader.read_only
+    assert reader["banana"] == "yellow"
+
+    kvs["banana"] = "green"
+    kvs.conn.commit()
+    assert reader["banana"] == "green"
+
+    with pytest.raises(sqlite3.OperationalError, match="readonly"):
+        reader["banana"] = "blue"
+    reader.close()
+    kvs.close()
+
+    kvs.open_(read_only=True)
+    assert kvs.read_only
+    assert kvs.get_many(["banana"]) == {"banana": "green"}
+
+
+def test_kvs_layers(kvs: KeyValueStore, tmp_path: Path) -> None:
+    """Test a KVS consults its layers, in order, for keys it does not have.
+
+    :param kvs: A key-value store populated with data
+    :param tmp_path: Path to a temporary directory
+    """
+    layers = []
+    for idx, items in enumerate(
+        (
+            [("banana", "green"), ("cherry", "red")],
+            [("cherry", "black"), ("lemon", "yellow")],
+        ),
+    ):
+        shared = KeyValueStore(tmp_path / f"shared_{idx}.db")
+        shared.set_many(items)
+        shared.close()
+        layers.append(KeyValueStore(shared.path, read_only=True))
+    kvs.close()
+    layered = KeyValueStore(kvs.path, layers=layers)
+
+    assert layered["banana"] == "yellow"
+    assert layered["cherry"] == "red"
+    assert layered["lemon"] == "yellow"
+    assert "lemon" in layered
+    assert "lime" not in layered
+    assert layered.get_many(["banana", "cherry", "lemon", "lime"]) == {
+        "banana": "yellow",
+        "cherry": "red",
+        "lemon": "yellow",
+    }
+    assert len(layered) == 6
+    assert dict(layered.items()) == {
+        "apple": "red",
+        "banana": "yellow",
+        "cherry": "red",
+        "grape": "green",
+        "lemon": "yellow",
+        "strawberry": "red",
+    }
+
+    # Changes are only made to the top layer
+    layered["lemon"] = "green"
+    assert layered["lemon"] == "green"
+    assert layers[1]["lemon"] == "yellow"
+    with pytest.raises(KeyError):
+        del layered["cherry"]
+    layered.close()
+
+    layered.open_(read_only=True)
+    assert layered.get_many(["cherry", "lemon"]) == {"cherry": "red", "lemon": "green"}
+    layered.close()
@@ -0,0 +1,78 @@
+"""Tests for the stdout store."""
+
+from __future__ import annotations
+
+import pytest
+
+from ansible_navigator.utils.stdout_store import StdoutStore
+
+
+@pytest.fixture(name="store")
+def fixture_store() -> StdoutStore:
+    """Provide a stdout store with most lines spilled to disk.
+
+    :returns: The stdout store
+    """
+    store = StdoutStore(memory_lines=10)
+    store.extend(f"line {idx} ✓" for idx in range(50))
+    store.append("\x1b[0;32mok: [host]\x1b[0m")
+    return store
+
+
+def test_spill(store: StdoutStore) -> None:
+    """Test older lines are spilled to disk and the memory tail stays bounded.
+
+    :param store: The stdout store
+    """
+    # pylint: disable=protected-access
+    assert len(store) == 51
+    assert store.spilled >= 41
+    assert len(store._lines) <= 10
+    assert list(store) == [f"line {idx} ✓" for idx in range(50)] + [store[-1]]
+
+
+@pytest.mark.parametrize(
+    "index",
+    (
+        0,
+        7,
+        45,
+        50,
+        -1,
+        -51,
+        slice(None),
+        slice(3, 8),
+        slice(38, 47),
+        slice(-5, None),
+        slice(1, 30, 7),
+    ),
+)
+def test_index(store: StdoutStore, index: int | slice) -> None:
+    """Test lines are read the same from disk or from memory.
+
+    :param store: The stdout store
+    :param index: The index or slice
+    """
+    expected = [f"line {idx} ✓" for idx in range(50)] + ["\x1b[0;32mok: [host]\x1b[0m"]
+    assert store[index] == expected[index]
+
+
+def test_out_of_range(store: StdoutStore) -> None:
+    """Test an index out of range raises an IndexError.
+
+    :param store: The stdout store
+    """
+    with pytest.raises(IndexError):
+        store[51]
+
+
+def test_clear(store: StdoutStore) -> None:
+    """Test the store can be cleared and reused.
+
+    :param store: The stdout store
+    """
+    store.clear()
+    assert len(store) == 0
+    assert not store.spilled
+    store.extend(["a", "b"])
+    assert str(store) == "a\nb"